@@ -12,14 +12,31 @@ Target: > 60% recall accuracy at day 30.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
+import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
-from benchmarks.ground_truth import MEMORIES, QUERIES, get_session_schedule
-from benchmarks.metrics import BenchmarkReport, evaluate_query
+from benchmarks.ground_truth import (
+    QUERIES,
+    GroundTruthMemory,
+    GroundTruthQuery,
+    get_session_schedule,
+)
+from benchmarks.metrics import evaluate_batch
+from benchmarks.result_log import BenchmarkLogger
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+# Simulated clock: day 0 starts here, memories are encoded one minute apart
+_BASE_TIME = datetime(2026, 1, 1, 9, 0, 0)
+_ENCODE_SPACING = timedelta(minutes=1)
+
+
+@dataclass(frozen=True, slots=True)
 class SessionResult:
     """Results from a single coherence test session.
 
@@ -42,7 +59,7 @@ class SessionResult:
     mrr: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CoherenceReport:
     """Full coherence test report across all sessions.
 
@@ -66,15 +83,36 @@ async def run_coherence_test(
     query_fn: object,
     consolidate_fn: object | None = None,
     k: int = 5,
+    max_concurrency: int = 1,
+    background_consolidation: bool = False,
+    interleave_queries: bool = False,
+    result_log: BenchmarkLogger | None = None,
 ) -> CoherenceReport:
     """Run the multi-session coherence test.
 
     Args:
         encode_fn: async (content, tags, timestamp) -> memory_id mapping
             Returns dict mapping ground-truth ID to actual system ID
-        query_fn: async (query_text) -> list[str] of retrieved memory IDs
+        query_fn: async (query_text) -> iterable of retrieved memory IDs in rank order
         consolidate_fn: optional async () -> None to run consolidation
         k: K value for metrics
+        max_concurrency: Max in-flight query_fn calls per session.
+            The default of 1 runs them one at a time, so results are
+            reproducible. Raise it only when query_fn is safe to call
+            concurrently; ReflexPipeline.query is not, since each query
+            applies Hebbian updates to the graph. encode_fn calls always
+            run one at a time in schedule order: the encoder looks up
+            similar entity and time neurons before creating them, so
+            overlapping encodes could create duplicates.
+        background_consolidation: Run consolidation concurrently with the
+            session's queries and only wait for it before the next session
+            starts encoding. Failures are logged instead of raised.
+        interleave_queries: Start each query as soon as the session's memories
+            it expects are encoded instead of after the whole session, so
+            queries overlap the remaining encodes. Only applies to sessions
+            without consolidation.
+        result_log: Optional JSONL sink receiving every per-query metric and
+            session result as soon as its session is scored
 
     Returns:
         CoherenceReport with per-session and final results
@@ -82,68 +120,145 @@ async def run_coherence_test(
     report = CoherenceReport()
     schedule = get_session_schedule()
 
-    base_time = datetime(2026, 1, 1, 9, 0, 0)
     # Map from ground-truth ID to actual system ID
     id_mapping: dict[str, str] = {}
+    # Ground-truth IDs encoded so far; grows with each session
+    available_ids: set[str] = set()
     total_encoded = 0
-
-    for _session_idx, (day, day_memories) in enumerate(schedule):
-        session_time = base_time + timedelta(days=day)
-
-        # Encode this session's memories
-        for mem in day_memories:
-            mem_time = session_time + timedelta(minutes=len(id_mapping))
-            actual_id = await encode_fn(mem.content, mem.tags, mem_time)
-            if isinstance(actual_id, dict):
-                id_mapping.update(actual_id)
-            else:
-                id_mapping[mem.id] = actual_id
-            total_encoded += 1
-
-        # Run consolidation on day 14+ if available
-        if day >= 14 and consolidate_fn is not None:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    pending_consolidation: asyncio.Task[None] | None = None
+
+    async def _encode(mem: GroundTruthMemory, mem_time: datetime) -> None:
+        actual_id = await encode_fn(mem.content, mem.tags, mem_time)
+        # Interned so expected-ID sets share objects with the mapping values
+        if isinstance(actual_id, dict):
+            id_mapping.update({gt_id: _intern(sys_id) for gt_id, sys_id in actual_id.items()})
+        else:
+            id_mapping[mem.id] = _intern(actual_id)
+
+    async def _consolidate_logged() -> None:
+        try:
             await consolidate_fn()
-
-        # Evaluate queries that should be answerable by now
-        available_ids = {m.id for m in MEMORIES if m.day_offset <= day}
-        testable_queries = [
-            q
-            for q in QUERIES
-            if q.expected_ids & available_ids  # At least some expected results exist
-        ]
-
-        session_report = BenchmarkReport()
-        for query in testable_queries:
-            # Map expected IDs to actual system IDs
-            mapped_expected = {
-                id_mapping.get(eid, eid) for eid in query.expected_ids if eid in available_ids
-            }
-
-            retrieved = await query_fn(query.query)
-            if not isinstance(retrieved, list):
-                retrieved = list(retrieved)
-
-            qm = evaluate_query(
-                query=query.query,
-                category=query.category,
-                retrieved_ids=retrieved,
-                relevant_ids=mapped_expected,
+        except Exception:
+            logger.exception("Background consolidation failed")
+
+    async def _retrieve(query_text: str) -> Iterable[str]:
+        # Returned as-is: evaluate_query consumes any iterable without copying
+        async with semaphore:
+            return await query_fn(query_text)
+
+    async def _encode_interleaved(
+        day_memories: tuple[GroundTruthMemory, ...],
+        mem_times: list[datetime],
+        testable_queries: list[GroundTruthQuery],
+    ) -> list[Iterable[str]]:
+        """Encode a session, launching each query once its expected memories exist."""
+        session_ids = {mem.id for mem in day_memories}
+        # Per query: how many of its expected memories this session still has to encode
+        waiting = [len(q.expected_ids & session_ids) for q in testable_queries]
+        unblocks: dict[str, list[int]] = {}
+        for qi, q in enumerate(testable_queries):
+            for eid in q.expected_ids & session_ids:
+                unblocks.setdefault(eid, []).append(qi)
+        results: dict[int, Iterable[str]] = {}
+
+        async def _query(qi: int) -> None:
+            results[qi] = await _retrieve(testable_queries[qi].query)
+
+        async with asyncio.TaskGroup() as tg:
+            for qi, remaining in enumerate(waiting):
+                if not remaining:
+                    tg.create_task(_query(qi))
+            # Encodes stay in order; queries they unblock run alongside the rest
+            for mem, mem_time in zip(day_memories, mem_times, strict=True):
+                await _encode(mem, mem_time)
+                for qi in unblocks.get(mem.id, ()):
+                    waiting[qi] -= 1
+                    if not waiting[qi]:
+                        tg.create_task(_query(qi))
+
+        return [results[qi] for qi in range(len(testable_queries))]
+
+    try:
+        for _session_idx, (day, day_memories) in enumerate(schedule):
+            # Timestamps follow schedule order, one minute apart
+            first_time = _BASE_TIME + timedelta(days=day, minutes=len(id_mapping))
+            mem_times = [first_time + i * _ENCODE_SPACING for i in range(len(day_memories))]
+            consolidate_now = day >= 14 and consolidate_fn is not None
+
+            # Queries that should be answerable once this session is encoded
+            available_ids.update(mem.id for mem in day_memories)
+            testable_queries = [
+                q
+                for q in QUERIES
+                if not q.expected_ids.isdisjoint(available_ids)  # Some expected results exist
+            ]
+            total_encoded += len(day_memories)
+
+            # Previous session's background consolidation must land before this
+            # session touches the graph
+            if pending_consolidation is not None:
+                await pending_consolidation
+                pending_consolidation = None
+
+            if interleave_queries and not consolidate_now:
+                retrieved_lists = await _encode_interleaved(
+                    day_memories, mem_times, testable_queries
+                )
+            else:
+                for mem, mem_time in zip(day_memories, mem_times, strict=True):
+                    await _encode(mem, mem_time)
+
+                # Run consolidation on day 14+ if available
+                if consolidate_now:
+                    if background_consolidation:
+                        pending_consolidation = asyncio.create_task(_consolidate_logged())
+                    else:
+                        await consolidate_fn()
+
+                # Queries are independent; max_concurrency bounds how many overlap
+                retrieved_lists = await asyncio.gather(
+                    *(_retrieve(q.query) for q in testable_queries)
+                )
+
+            # Map expected IDs to actual system IDs and score the whole session at once
+            session_report = evaluate_batch(
+                (
+                    (
+                        query.query,
+                        query.category,
+                        retrieved,
+                        {id_mapping.get(eid, eid) for eid in query.expected_ids & available_ids},
+                    )
+                    for query, retrieved in zip(testable_queries, retrieved_lists, strict=True)
+                ),
                 k=k,
             )
-            session_report.query_metrics.append(qm)
-
-        session_report.compute_aggregates()
-
-        session_result = SessionResult(
-            day=day,
-            memories_encoded=len(day_memories),
-            total_memories=total_encoded,
-            queries_tested=len(testable_queries),
-            mean_recall=session_report.mean_recall,
-            mean_precision=session_report.mean_precision,
-            mrr=session_report.mrr,
-        )
-        report.sessions.append(session_result)
+
+            session_result = SessionResult(
+                day=day,
+                memories_encoded=len(day_memories),
+                total_memories=total_encoded,
+                queries_tested=len(testable_queries),
+                mean_recall=session_report.mean_recall,
+                mean_precision=session_report.mean_precision,
+                mrr=session_report.mrr,
+            )
+            report.sessions.append(session_result)
+
+            if result_log is not None:
+                for qm in session_report.query_metrics:
+                    result_log.log("query", qm, day=day)
+                result_log.log("session", session_result)
+
+        if pending_consolidation is not None:
+            await pending_consolidation
+    finally:
+        # Don't leave consolidation running if a session failed
+        if pending_consolidation is not None and not pending_consolidation.done():
+            pending_consolidation.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pending_consolidation
 
     # Final session is the last one
     if report.sessions:
@@ -156,29 +271,36 @@ async def run_coherence_test(
     return report
 
 
-def format_coherence_report(report: CoherenceReport) -> str:
-    """Format coherence report as markdown table.
+def _intern(memory_id: object) -> object:
+    """Intern string IDs returned by a backend; pass anything else through."""
+    return sys.intern(memory_id) if isinstance(memory_id, str) else memory_id
 
-    Args:
-        report: The coherence test report
 
-    Returns:
-        Markdown-formatted report string
-    """
-    lines: list[str] = []
-    lines.append("### Long-Horizon Coherence Test\n")
-    lines.append("| Day | Memories | Total | Queries | Recall | Precision | MRR |")
-    lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+def _report_lines(report: CoherenceReport) -> Iterator[str]:
+    """Yield the markdown lines of a coherence report."""
+    yield "### Long-Horizon Coherence Test\n"
+    yield "| Day | Memories | Total | Queries | Recall | Precision | MRR |"
+    yield "| --- | --- | --- | --- | --- | --- | --- |"
 
     for session in report.sessions:
-        lines.append(
+        yield (
             f"| {session.day} | {session.memories_encoded} | {session.total_memories} "
             f"| {session.queries_tested} | {session.mean_recall:.1%} "
             f"| {session.mean_precision:.1%} | {session.mrr:.3f} |"
         )
 
-    lines.append("")
+    yield ""
     target_icon = "PASS" if report.target_met else "FAIL"
-    lines.append(f"**Day 30 Recall: {report.final_recall:.1%}** (target: >= 60%) [{target_icon}]")
+    yield f"**Day 30 Recall: {report.final_recall:.1%}** (target: >= 60%) [{target_icon}]"
+
+
+def format_coherence_report(report: CoherenceReport) -> str:
+    """Format coherence report as markdown table.
+
+    Args:
+        report: The coherence test report
 
-    return "\n".join(lines)
+    Returns:
+        Markdown-formatted report string
+    """
+    return "\n".join(_report_lines(report))
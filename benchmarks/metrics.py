@@ -5,15 +5,29 @@ Implements:
 - Recall@K: How many relevant results found in top-K
 - MRR (Mean Reciprocal Rank): How quickly the first relevant result appears
 - NDCG@K (Normalized Discounted Cumulative Gain): Overall ranking quality
+
+Repeated retrieved IDs are dropped (first occurrence kept) by every metric,
+so a duplicate cannot earn credit twice or push other results out of the top-K.
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from itertools import accumulate, islice
+
+# Deepest rank with a precomputed DCG discount; deeper ranks fall back to math.log2
+MAX_K = 1024
+
+# _DISCOUNTS[i] is the DCG weight 1/log2(i + 2) of 0-based rank i
+_DISCOUNTS: tuple[float, ...] = tuple(1.0 / math.log2(i + 2) for i in range(MAX_K))
 
+# _IDEAL_DCG[n] is the DCG of a ranking whose first n results are all relevant
+_IDEAL_DCG: tuple[float, ...] = (0.0, *accumulate(_DISCOUNTS))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QueryMetrics:
     """Metrics for a single query evaluation.
 
@@ -25,7 +39,7 @@ class QueryMetrics:
         reciprocal_rank: 1/rank of first relevant result (0 if none)
         ndcg_at_k: NDCG@K value
         k: The K value used
-        relevant_found: Number of relevant results in top-K
+        relevant_found: Number of distinct relevant results in top-K
         total_relevant: Total number of relevant results
     """
 
@@ -40,7 +54,7 @@ class QueryMetrics:
     total_relevant: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     """Aggregate metrics across all queries.
 
@@ -65,28 +79,68 @@ class BenchmarkReport:
         if not self.query_metrics:
             return
 
-        n = len(self.query_metrics)
-        self.mean_precision = sum(q.precision_at_k for q in self.query_metrics) / n
-        self.mean_recall = sum(q.recall_at_k for q in self.query_metrics) / n
-        self.mrr = sum(q.reciprocal_rank for q in self.query_metrics) / n
-        self.mean_ndcg = sum(q.ndcg_at_k for q in self.query_metrics) / n
-
-        # Per-category breakdown
-        categories: dict[str, list[QueryMetrics]] = {}
+        # One pass: accumulate [precision, recall, rr, ndcg, count] globally and per category
+        totals = [0.0, 0.0, 0.0, 0.0, 0]
+        by_category: dict[str, list[float]] = {}
         for qm in self.query_metrics:
-            categories.setdefault(qm.category, []).append(qm)
-
-        for cat, metrics in categories.items():
-            cn = len(metrics)
+            cat_totals = by_category.setdefault(qm.category, [0.0, 0.0, 0.0, 0.0, 0])
+            for acc in (totals, cat_totals):
+                acc[0] += qm.precision_at_k
+                acc[1] += qm.recall_at_k
+                acc[2] += qm.reciprocal_rank
+                acc[3] += qm.ndcg_at_k
+                acc[4] += 1
+
+        n = totals[4]
+        self.mean_precision = totals[0] / n
+        self.mean_recall = totals[1] / n
+        self.mrr = totals[2] / n
+        self.mean_ndcg = totals[3] / n
+
+        for cat, (precision, recall, rr, ndcg, cn) in by_category.items():
             self.category_breakdown[cat] = {
-                "precision": sum(q.precision_at_k for q in metrics) / cn,
-                "recall": sum(q.recall_at_k for q in metrics) / cn,
-                "mrr": sum(q.reciprocal_rank for q in metrics) / cn,
-                "ndcg": sum(q.ndcg_at_k for q in metrics) / cn,
+                "precision": precision / cn,
+                "recall": recall / cn,
+                "mrr": rr / cn,
+                "ndcg": ndcg / cn,
                 "count": cn,
             }
 
 
+def _discount(rank: int) -> float:
+    """DCG discount for a 0-based rank, served from the precomputed table."""
+    if rank < MAX_K:
+        return _DISCOUNTS[rank]
+    return 1.0 / math.log2(rank + 2)
+
+
+def _ideal_dcg(n_relevant: int) -> float:
+    """DCG of an ideal ranking with n_relevant hits at the top."""
+    if n_relevant <= MAX_K:
+        return _IDEAL_DCG[n_relevant]
+    return _IDEAL_DCG[MAX_K] + sum(_discount(i) for i in range(MAX_K, n_relevant))
+
+
+def _unique(ids: Iterable[str]) -> Iterator[str]:
+    """Yield IDs in order, skipping repeats of an ID already seen."""
+    seen: set[str] = set()
+    for rid in ids:
+        if rid not in seen:
+            seen.add(rid)
+            yield rid
+
+
+def _first_hit_rank(ranked: Iterable[str], relevant_ids: set[str], offset: int = 0) -> int:
+    """1-based rank of the first relevant ID (shifted by offset), or 0 if none."""
+    hits = map(relevant_ids.__contains__, ranked)
+    return next((rank for rank, hit in enumerate(hits, start=offset + 1) if hit), 0)
+
+
+def _relevance(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> list[bool]:
+    """Binary relevance vector for the top-K distinct retrieved IDs."""
+    return [rid in relevant_ids for rid in islice(_unique(retrieved_ids), max(k, 0))]
+
+
 def precision_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float:
     """Compute Precision@K: fraction of top-K results that are relevant.
 
@@ -100,11 +154,7 @@ def precision_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) ->
     """
     if k <= 0:
         return 0.0
-    top_k = retrieved_ids[:k]
-    if not top_k:
-        return 0.0
-    relevant_in_top_k = sum(1 for rid in top_k if rid in relevant_ids)
-    return relevant_in_top_k / k
+    return sum(_relevance(retrieved_ids, relevant_ids, k)) / k
 
 
 def recall_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float:
@@ -120,9 +170,7 @@ def recall_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> flo
     """
     if not relevant_ids:
         return 1.0  # No relevant → perfect recall by convention
-    top_k = retrieved_ids[:k]
-    relevant_found = sum(1 for rid in top_k if rid in relevant_ids)
-    return relevant_found / len(relevant_ids)
+    return sum(_relevance(retrieved_ids, relevant_ids, k)) / len(relevant_ids)
 
 
 def reciprocal_rank(retrieved_ids: list[str], relevant_ids: set[str]) -> float:
@@ -135,10 +183,8 @@ def reciprocal_rank(retrieved_ids: list[str], relevant_ids: set[str]) -> float:
     Returns:
         1/rank of first relevant result, 0 if none found
     """
-    for i, rid in enumerate(retrieved_ids):
-        if rid in relevant_ids:
-            return 1.0 / (i + 1)
-    return 0.0
+    rank = _first_hit_rank(_unique(retrieved_ids), relevant_ids)
+    return 1.0 / rank if rank else 0.0
 
 
 def dcg_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float:
@@ -154,11 +200,8 @@ def dcg_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float:
     Returns:
         DCG@K value
     """
-    dcg = 0.0
-    for i, rid in enumerate(retrieved_ids[:k]):
-        rel = 1.0 if rid in relevant_ids else 0.0
-        dcg += rel / math.log2(i + 2)  # i+2 because log2(1) = 0
-    return dcg
+    rel = _relevance(retrieved_ids, relevant_ids, k)
+    return sum(_discount(i) for i, hit in enumerate(rel) if hit)
 
 
 def ndcg_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float:
@@ -174,22 +217,18 @@ def ndcg_at_k(retrieved_ids: list[str], relevant_ids: set[str], k: int) -> float
     Returns:
         NDCG@K value in [0, 1]
     """
-    actual_dcg = dcg_at_k(retrieved_ids, relevant_ids, k)
-
     # Ideal: all relevant documents ranked first
-    n_relevant = min(len(relevant_ids), k)
-    ideal_dcg = sum(1.0 / math.log2(i + 2) for i in range(n_relevant))
-
+    ideal_dcg = _ideal_dcg(min(len(relevant_ids), k))
     if ideal_dcg == 0:
         return 0.0
 
-    return actual_dcg / ideal_dcg
+    return dcg_at_k(retrieved_ids, relevant_ids, k) / ideal_dcg
 
 
 def evaluate_query(
     query: str,
     category: str,
-    retrieved_ids: list[str],
+    retrieved_ids: Iterable[str],
     relevant_ids: set[str],
     k: int = 5,
 ) -> QueryMetrics:
@@ -198,28 +237,67 @@ def evaluate_query(
     Args:
         query: The query text
         category: Query category
-        retrieved_ids: Ordered list of retrieved memory IDs
+        retrieved_ids: Retrieved memory IDs in rank order; any iterable,
+            consumed once without being copied
         relevant_ids: Set of truly relevant memory IDs
         k: K value for @K metrics
 
     Returns:
         QueryMetrics with all metric values
     """
-    p_at_k = precision_at_k(retrieved_ids, relevant_ids, k)
-    r_at_k = recall_at_k(retrieved_ids, relevant_ids, k)
-    rr = reciprocal_rank(retrieved_ids, relevant_ids)
-    ndcg = ndcg_at_k(retrieved_ids, relevant_ids, k)
+    # Single pass over the top-K: hits, DCG and first-hit rank together
+    relevant_found = 0
+    dcg = 0.0
+    first_rank = 0
+    ranked = _unique(retrieved_ids)
+    # Walk the discount table alongside the ranks: no per-hit helper call in the loop
+    discounts = _DISCOUNTS if k <= MAX_K else map(_discount, range(k))
+    top_k = zip(islice(ranked, max(k, 0)), discounts, strict=False)
+    for i, (rid, discount) in enumerate(top_k):
+        if rid in relevant_ids:
+            relevant_found += 1
+            dcg += discount
+            if not first_rank:
+                first_rank = i + 1
+
+    # MRR is not cut off at K: keep scanning only if the top-K had no hit
+    if not first_rank:
+        first_rank = _first_hit_rank(ranked, relevant_ids, offset=k)
 
-    relevant_found = sum(1 for rid in retrieved_ids[:k] if rid in relevant_ids)
+    total_relevant = len(relevant_ids)
+    ideal_dcg = _ideal_dcg(min(total_relevant, k))
 
     return QueryMetrics(
         query=query,
         category=category,
-        precision_at_k=p_at_k,
-        recall_at_k=r_at_k,
-        reciprocal_rank=rr,
-        ndcg_at_k=ndcg,
+        precision_at_k=relevant_found / k if k > 0 else 0.0,
+        recall_at_k=relevant_found / total_relevant if total_relevant else 1.0,
+        reciprocal_rank=1.0 / first_rank if first_rank else 0.0,
+        ndcg_at_k=dcg / ideal_dcg if ideal_dcg else 0.0,
         k=k,
         relevant_found=relevant_found,
-        total_relevant=len(relevant_ids),
+        total_relevant=total_relevant,
+    )
+
+
+def evaluate_batch(
+    evaluations: Iterable[tuple[str, str, Iterable[str], set[str]]],
+    k: int = 5,
+) -> BenchmarkReport:
+    """Evaluate a batch of queries and aggregate them into one report.
+
+    Args:
+        evaluations: (query, category, retrieved_ids, relevant_ids) tuples
+        k: K value for @K metrics
+
+    Returns:
+        BenchmarkReport with per-query metrics and computed aggregates
+    """
+    report = BenchmarkReport(
+        query_metrics=[
+            evaluate_query(query, category, retrieved_ids, relevant_ids, k)
+            for query, category, retrieved_ids, relevant_ids in evaluations
+        ]
     )
+    report.compute_aggregates()
+    return report
@@ -6,8 +6,10 @@ Simple approach: tokenize query, count shared words with each memory, rank by ov
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Common English stop words to exclude from keyword matching
 _STOP_WORDS: frozenset[str] = frozenset(
@@ -95,8 +97,11 @@ _STOP_WORDS: frozenset[str] = frozenset(
     }
 )
 
+# Keywords: a letter followed by letters, digits, or _.- (3+ chars total)
+_TOKEN_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9_.-]{2,}\b")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BaselineResult:
     """Result from naive keyword-overlap ranking.
 
@@ -113,20 +118,25 @@ class BaselineResult:
     shared_keywords: set[str]
 
 
-def tokenize(text: str) -> set[str]:
+@lru_cache(maxsize=2048)
+def tokenize(text: str) -> frozenset[str]:
     """Tokenize text into lowercase keyword set, excluding stop words.
 
+    Results are immutable and memoized, since the same query and memory
+    texts are tokenized again on every benchmark run.
+
     Args:
         text: Input text
 
     Returns:
-        Set of lowercase keywords (3+ chars, no stop words)
+        Frozen set of lowercase keywords (3+ chars, no stop words)
     """
-    words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9_.-]+\b", text)
-    return {w.lower() for w in words if w.lower() not in _STOP_WORDS and len(w) >= 3}
+    return frozenset(w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOP_WORDS)
 
 
-def keyword_overlap_score(query_tokens: set[str], memory_tokens: set[str]) -> float:
+def keyword_overlap_score(
+    query_tokens: frozenset[str] | set[str], memory_tokens: frozenset[str] | set[str]
+) -> float:
     """Compute keyword overlap score between query and memory.
 
     Score = |intersection| / |query_tokens| (recall-oriented).
@@ -139,12 +149,75 @@ def keyword_overlap_score(query_tokens: set[str], memory_tokens: set[str]) -> fl
     Returns:
         Overlap score in [0, 1]
     """
-    if not query_tokens:
+    # Most pairs share nothing; isdisjoint answers that without building a set
+    if not query_tokens or query_tokens.isdisjoint(memory_tokens):
         return 0.0
     shared = query_tokens & memory_tokens
     return len(shared) / len(query_tokens)
 
 
+@dataclass(frozen=True, slots=True)
+class TokenizedCorpus:
+    """Memory corpus tokenized once, so it can be ranked against many queries.
+
+    Every distinct corpus token gets a bit position in ``vocab``; each memory's
+    keywords are stored as an int bitmask, so overlap with a query is one
+    integer AND plus a popcount instead of a string-set intersection.
+
+    Stored column-wise: ``ids[i]``, ``contents[i]`` and ``masks[i]`` describe
+    memory ``i``, so the scoring loop only touches the masks.
+
+    Attributes:
+        ids: Memory IDs
+        contents: Memory texts
+        masks: Keyword bitmask per memory
+        vocab: Token -> bit position
+        tokens_by_bit: Bit position -> token (inverse of vocab)
+    """
+
+    ids: tuple[str, ...]
+    contents: tuple[str, ...]
+    masks: tuple[int, ...]
+    vocab: dict[str, int]
+    tokens_by_bit: tuple[str, ...]
+
+    @classmethod
+    def build(cls, memories: list[tuple[str, str]]) -> TokenizedCorpus:
+        """Tokenize (memory_id, content) pairs and encode their keyword bitmasks."""
+        vocab: dict[str, int] = {}
+        masks: list[int] = []
+        for _, content in memories:
+            mask = 0
+            for token in tokenize(content):
+                mask |= 1 << vocab.setdefault(token, len(vocab))
+            masks.append(mask)
+        return cls(
+            ids=tuple(memory_id for memory_id, _ in memories),
+            contents=tuple(content for _, content in memories),
+            masks=tuple(masks),
+            vocab=vocab,
+            tokens_by_bit=tuple(vocab),
+        )
+
+    def query_mask(self, query_tokens: frozenset[str] | set[str]) -> int:
+        """Bitmask of the query tokens that occur anywhere in the corpus."""
+        mask = 0
+        for token in query_tokens:
+            bit = self.vocab.get(token)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def tokens_of(self, mask: int) -> set[str]:
+        """Decode a bitmask back into its tokens."""
+        tokens: set[str] = set()
+        while mask:
+            low_bit = mask & -mask
+            tokens.add(self.tokens_by_bit[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return tokens
+
+
 def rank_memories(
     query: str,
     memories: list[tuple[str, str]],
@@ -160,28 +233,51 @@ def rank_memories(
     Returns:
         Top-K memories ranked by keyword overlap score
     """
-    query_tokens = tokenize(query)
-
-    results: list[BaselineResult] = []
-    for memory_id, content in memories:
-        memory_tokens = tokenize(content)
-        shared = query_tokens & memory_tokens
-        score = keyword_overlap_score(query_tokens, memory_tokens)
-
-        if score > 0:
-            results.append(
-                BaselineResult(
-                    memory_id=memory_id,
-                    content=content,
-                    score=score,
-                    shared_keywords=shared,
-                )
-            )
+    return rank_tokenized(tokenize(query), TokenizedCorpus.build(memories), top_k=top_k)
 
-    # Sort by score descending, then by memory_id for stability
-    results.sort(key=lambda r: (-r.score, r.memory_id))
 
-    return results[:top_k]
+def rank_tokenized(
+    query_tokens: frozenset[str] | set[str],
+    corpus: TokenizedCorpus,
+    top_k: int = 10,
+) -> list[BaselineResult]:
+    """Rank a pre-tokenized corpus by keyword overlap with query tokens.
+
+    Args:
+        query_tokens: Tokenized query
+        corpus: Corpus built with TokenizedCorpus.build()
+        top_k: Number of top results to return
+
+    Returns:
+        Top-K memories ranked by keyword overlap score
+    """
+    if not query_tokens:
+        return []
+
+    # The query length is fixed, so rank by integer overlap count and only
+    # divide into a score for the top-K survivors
+    query_mask = corpus.query_mask(query_tokens)
+    ids = corpus.ids
+    overlaps = (
+        (-shared_mask.bit_count(), ids[i], i, shared_mask)
+        for i, mask in enumerate(corpus.masks)
+        if (shared_mask := query_mask & mask)
+    )
+
+    # Partial selection by overlap descending, then memory_id for stability;
+    # only the top-K survivors become BaselineResult objects
+    n_query = len(query_tokens)
+    return [
+        BaselineResult(
+            memory_id=memory_id,
+            content=corpus.contents[i],
+            score=-neg_overlap / n_query,
+            shared_keywords=corpus.tokens_of(shared_mask),
+        )
+        for neg_overlap, memory_id, i, shared_mask in heapq.nsmallest(
+            top_k, overlaps, key=lambda item: (item[0], item[1])
+        )
+    ]
 
 
 def evaluate_baseline(
@@ -199,24 +295,22 @@ def evaluate_baseline(
     Returns:
         Dict with per-category and overall metrics
     """
-    from benchmarks.metrics import BenchmarkReport, evaluate_query
-
-    report = BenchmarkReport()
-
-    for query_text, category, expected_ids in queries:
-        ranked = rank_memories(query_text, memories, top_k=k)
-        retrieved_ids = [r.memory_id for r in ranked]
-
-        qm = evaluate_query(
-            query=query_text,
-            category=category,
-            retrieved_ids=retrieved_ids,
-            relevant_ids=expected_ids,
-            k=k,
-        )
-        report.query_metrics.append(qm)
-
-    report.compute_aggregates()
+    from benchmarks.metrics import evaluate_batch
+
+    # Memories are tokenized once and reused for every query
+    corpus = TokenizedCorpus.build(memories)
+    report = evaluate_batch(
+        (
+            (
+                query_text,
+                category,
+                [r.memory_id for r in rank_tokenized(tokenize(query_text), corpus, top_k=k)],
+                expected_ids,
+            )
+            for query_text, category, expected_ids in queries
+        ),
+        k=k,
+    )
 
     result: dict[str, dict[str, float]] = {
         "overall": {
@@ -0,0 +1,52 @@
+"""JSON Lines sink for streaming benchmark results to disk.
+
+Long-horizon runs can write each per-query and per-session record as it is
+produced instead of keeping every record around until the final report.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+
+class BenchmarkLogger:
+    """Append benchmark records to a JSON Lines file, one object per line.
+
+    Each line is the record's dataclass fields plus a ``kind`` tag
+    (e.g. ``"query"`` or ``"session"``) and any extra context fields.
+
+    Usage:
+        with BenchmarkLogger(Path("coherence.jsonl")) as log:
+            await run_coherence_test(encode, query, result_log=log)
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file: IO[str] = path.open("w", encoding="utf-8")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def log(self, kind: str, record: Any, **context: Any) -> None:
+        """Write one record (a dataclass instance) as a JSON line."""
+        line = {"kind": kind, **context, **asdict(record)}
+        self._file.write(json.dumps(line, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> BenchmarkLogger:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
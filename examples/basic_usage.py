@@ -7,13 +7,13 @@ This example demonstrates:
 3. Querying memories through activation
 """
 
-import asyncio
 from datetime import datetime
 
 from neural_memory.core.brain import Brain, BrainConfig
 from neural_memory.engine.encoder import MemoryEncoder
 from neural_memory.engine.retrieval import ReflexPipeline
 from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.utils.event_loop import run
 
 
 async def main() -> None:
@@ -45,6 +45,8 @@ async def main() -> None:
     ]
 
     print("\nEncoding memories...")
+    # One at a time: the encoder looks up similar entity and time neurons
+    # before creating them, so overlapping encodes could create duplicates
     for content, timestamp in memories:
         result = await encoder.encode(content, timestamp=timestamp)
         print(f"  - Encoded: {content[:50]}...")
@@ -60,6 +62,8 @@ async def main() -> None:
     ]
 
     print("\nQuerying memories...")
+    # One at a time: each query reinforces the pathways it used, and the
+    # pipeline flushes those writes before it can take the next query
     for query in queries:
         result = await pipeline.query(
             query,
@@ -81,4 +85,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
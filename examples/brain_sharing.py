@@ -7,7 +7,6 @@ This example demonstrates:
 3. Importing a brain into another instance
 """
 
-import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +15,8 @@ from neural_memory.core.brain import Brain, BrainConfig
 from neural_memory.engine.encoder import MemoryEncoder
 from neural_memory.engine.retrieval import ReflexPipeline
 from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.utils.event_loop import run
+from neural_memory.utils.json_stream import dump_json_streaming
 
 
 async def create_expert_brain() -> tuple[InMemoryStorage, Brain]:
@@ -47,12 +48,11 @@ async def create_expert_brain() -> tuple[InMemoryStorage, Brain]:
         "Virtual environments isolate project dependencies",
     ]
 
-    for item in knowledge:
-        await encoder.encode(
-            item,
-            timestamp=datetime.now(),
-            tags={"python", "best-practices"},
-        )
+    await encoder.encode_batch(
+        knowledge,
+        timestamp=datetime.now(),
+        tags={"python", "best-practices"},
+    )
 
     return storage, brain
 
@@ -75,7 +75,9 @@ async def export_brain(storage: InMemoryStorage, brain_id: str, output_path: str
     }
 
     path = Path(output_path)
-    path.write_text(json.dumps(export_data, indent=2, ensure_ascii=False))
+    # Streamed one neuron/synapse/fiber at a time to bound peak memory
+    with path.open("w", encoding="utf-8") as f:
+        dump_json_streaming(export_data, f, ensure_ascii=False)
     print(f"Exported brain to: {path}")
 
 
@@ -84,7 +86,7 @@ async def import_brain(storage: InMemoryStorage, input_path: str) -> str:
     from neural_memory.core.brain import BrainSnapshot
 
     path = Path(input_path)
-    data = json.loads(path.read_text())
+    data = json.loads(path.read_bytes())
 
     snapshot = BrainSnapshot(
         brain_id=data["brain_id"],
@@ -171,4 +173,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,7 +5,8 @@ This example demonstrates how to use NeuralMemory
 to give a chatbot persistent memory across conversations.
 """
 
-import asyncio
+import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
@@ -13,6 +14,15 @@ from neural_memory.core.brain import Brain, BrainConfig
 from neural_memory.engine.encoder import MemoryEncoder
 from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline
 from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.utils.event_loop import run
+
+# Answers kept per bot; the cache is cleared whenever the bot learns something
+ANSWER_CACHE_SIZE = 128
+
+
+def _query_key(query: str) -> str:
+    """Normalize a query so case, punctuation and spacing variants share a key."""
+    return " ".join(re.findall(r"\w+", query.lower()))
 
 
 class MemoryBot:
@@ -23,6 +33,8 @@ class MemoryBot:
         self.brain: Brain | None = None
         self.encoder: MemoryEncoder | None = None
         self.pipeline: ReflexPipeline | None = None
+        # LRU of normalized query -> (answer, confidence)
+        self._answer_cache: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
 
     async def initialize(self, brain_name: str = "chatbot_brain") -> None:
         """Initialize the bot's memory system."""
@@ -55,8 +67,21 @@ class MemoryBot:
             metadata=metadata,
         )
 
+        self._answer_cache.clear()  # New memories can change any answer
         return result.fiber.id
 
+    async def remember_many(
+        self, contents: list[str], metadata: dict[str, Any] | None = None
+    ) -> list[str]:
+        """Store several memories in one batch, returning fiber IDs in order."""
+        if self.encoder is None:
+            raise RuntimeError("Bot not initialized")
+
+        results = await self.encoder.encode_batch(contents, metadata=metadata)
+
+        self._answer_cache.clear()
+        return [result.fiber.id for result in results]
+
     async def recall(self, query: str, depth: DepthLevel = DepthLevel.CONTEXT) -> str:
         """Recall relevant memories for a query."""
         if self.pipeline is None:
@@ -71,12 +96,26 @@ class MemoryBot:
         return result.context
 
     async def get_answer(self, query: str) -> tuple[str | None, float]:
-        """Get a direct answer to a query if possible."""
+        """Get a direct answer to a query if possible.
+
+        Repeated questions (ignoring case, punctuation and spacing) are
+        answered from a cache until the next remember call.
+        """
         if self.pipeline is None:
             raise RuntimeError("Bot not initialized")
 
+        key = _query_key(query)
+        cached = self._answer_cache.get(key)
+        if cached is not None:
+            self._answer_cache.move_to_end(key)
+            return cached
+
         result = await self.pipeline.query(query)
-        return result.answer, result.confidence
+        answer = (result.answer, result.confidence)
+        self._answer_cache[key] = answer
+        if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
+        return answer
 
 
 async def simulate_conversation() -> None:
@@ -96,8 +135,8 @@ async def simulate_conversation() -> None:
 
     for info in user_info:
         print(f"User: {info}")
-        await bot.remember(info, metadata={"type": "user_info"})
-        print("Bot: Got it, I'll remember that!\n")
+    await bot.remember_many(user_info, metadata={"type": "user_info"})
+    print("Bot: Got it, I'll remember all of that!\n")
 
     # Session 2: User asks questions (simulating new session)
     print("\n=== Session 2: Recalling information ===")
@@ -146,4 +185,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
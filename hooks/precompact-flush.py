@@ -5,16 +5,23 @@ Fires before Claude Code compresses the conversation. Reads the transcript,
 detects memorable patterns, saves them to the neural graph, and injects
 a session summary as additionalContext so critical info survives compaction.
 
+When an ``nmem-daemon`` is listening, the flush is delegated to it over a
+Unix socket so this process skips the neural-memory imports and storage
+start-up; otherwise it runs inline.
+
 No external dependencies beyond neural-memory itself.
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
+import os
+import socket
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger("neural_memory.hooks.precompact")
 
@@ -22,29 +29,153 @@ logger = logging.getLogger("neural_memory.hooks.precompact")
 _MAX_TRANSCRIPT_CHARS = 40_000
 # Maximum messages to scan from the end of the transcript
 _MAX_MESSAGES = 80
+# Transcript tail is read backwards in chunks of this size, up to a cap
+_TAIL_CHUNK = 64 * 1024
+_MAX_TAIL_BYTES = 16 * 1024 * 1024
+# Seconds to wait for the daemon to accept, then to finish the flush
+_DAEMON_CONNECT_TIMEOUT = 0.5
+_DAEMON_REPLY_TIMEOUT = 12.0
+
+
+@dataclass(frozen=True, slots=True)
+class _DetectedMemory:
+    """A detected memory selected for the emergency flush."""
+
+    content: str
+    type: str
+    priority: int
 
 
 def _read_hook_input() -> dict:
     """Read JSON hook input from stdin."""
     try:
-        raw = sys.stdin.read()
+        # json.loads takes bytes directly; skip the text-mode decode layer
+        raw = sys.stdin.buffer.read()
         return json.loads(raw) if raw.strip() else {}
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         return {}
 
 
-def _extract_transcript_text(transcript_path: str) -> str:
-    """Extract recent text content from transcript JSONL file."""
+def _daemon_socket_path() -> str:
+    """Mirror ``neural_memory.daemon.default_socket_path`` without importing it."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "nmem.sock")
+    data_dir = os.environ.get("NEURALMEMORY_DIR") or os.path.join(
+        os.path.expanduser("~"), ".neuralmemory"
+    )
+    return os.path.join(data_dir, "nmem.sock")
+
+
+def _flush_via_daemon(transcript_path: str) -> tuple[int, list[str]] | None:
+    """Ask a running daemon to flush the transcript.
+
+    Returns (saved_count, summary_lines), or None when no daemon accepted
+    the connection and the flush should run inline instead.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_DAEMON_CONNECT_TIMEOUT)
+        try:
+            sock.connect(_daemon_socket_path())
+        except OSError:
+            return None
+
+        # Connected: from here on never fall back, or memories could be saved twice
+        request = {"op": "precompact_flush", "transcript_path": transcript_path}
+        try:
+            sock.settimeout(_DAEMON_REPLY_TIMEOUT)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reply_file:
+                reply = json.loads(reply_file.readline())
+        except (OSError, ValueError):
+            logger.debug("Daemon flush failed", exc_info=True)
+            return 0, []
+
+    if not isinstance(reply, dict) or not reply.get("ok"):
+        return 0, []
+    items = reply.get("items", [])
+    return reply.get("saved", 0), [
+        _summary_line(item.get("type", "context"), item.get("content", ""))
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+def _summary_line(memory_type: str, content: str) -> str:
+    """Format one saved memory for the additionalContext summary."""
+    return f"- [{memory_type}] {content[:80]}"
+
+
+def _nothing_new(transcript_path: str) -> bool:
+    """Check whether an earlier flush already covered the whole transcript.
+
+    Compaction can fire twice in a row with nothing said in between; then
+    there is nothing to analyse and storage need not be started at all.
+    """
+    from neural_memory.hooks.transcript_offsets import load_transcript_offset
+
+    try:
+        size = os.path.getsize(transcript_path)
+    except OSError:
+        return False
+    offset = load_transcript_offset(transcript_path)
+    return offset > 0 and offset == size
+
+
+def _tail_lines(path: Path, n: int, start: int = 0) -> tuple[list[str], int]:
+    """Return the last ``n`` complete lines after byte ``start``, and where they end.
+
+    Only the tail is read, backwards from the end, so cost scales with ``n``
+    rather than with the size of a long session's transcript. At most
+    ``_MAX_TAIL_BYTES`` are read. A final line without its newline may still
+    be being written, so it is left out and the returned offset stops
+    before it.
+    """
+    with path.open("rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        buf = b""
+        # n lines need n + 1 newlines, unless the read reaches ``start``
+        while pos > start and buf.count(b"\n") <= n and end - pos < _MAX_TAIL_BYTES:
+            step = min(_TAIL_CHUNK, pos - start)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+
+    complete = buf.rfind(b"\n") + 1
+    lines = buf[:complete].decode("utf-8", errors="replace").split("\n")
+    lines.pop()  # Empty string after the last newline
+    if pos > start:
+        lines = lines[1:]  # First line may be cut mid-way
+    return lines[-n:], pos + complete
+
+
+def _join_text_blocks(blocks: list) -> str:
+    """Join the text of ``{"type": "text"}`` content blocks with newlines."""
+    return "\n".join(
+        block.get("text", "")
+        for block in blocks
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def _extract_transcript_text(transcript_path: str, start: int = 0) -> tuple[str, int]:
+    """Extract recent text content from transcript JSONL file.
+
+    Only lines after byte ``start`` are read. Returns the text and the
+    offset where the lines read end.
+    """
     path = Path(transcript_path)
     if not path.is_file():
-        return ""
+        return "", start
 
     lines: list[str] = []
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as f:
-            all_lines = f.readlines()
-            # Take last N lines (most recent messages)
-            recent = all_lines[-_MAX_MESSAGES:]
+        # Only the last N lines (most recent messages) are used
+        recent, end_offset = _tail_lines(path, _MAX_MESSAGES, start)
 
         for line in recent:
             line = line.strip()
@@ -61,42 +192,35 @@ def _extract_transcript_text(transcript_path: str) -> str:
                 content = msg["content"]
             elif isinstance(msg.get("content"), list):
                 # Content blocks format: [{"type": "text", "text": "..."}]
-                for block in msg["content"]:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        content += block.get("text", "") + "\n"
+                content = _join_text_blocks(msg["content"])
             elif isinstance(msg.get("message"), dict):
                 inner = msg["message"]
                 if isinstance(inner.get("content"), str):
                     content = inner["content"]
                 elif isinstance(inner.get("content"), list):
-                    for block in inner["content"]:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            content += block.get("text", "") + "\n"
+                    content = _join_text_blocks(inner["content"])
 
-            if content.strip():
+            content = content.strip()
+            if content:
                 role = msg.get("role", msg.get("type", ""))
-                lines.append(f"[{role}] {content.strip()}")
+                lines.append(f"[{role}] {content}")
 
     except OSError:
-        return ""
+        return "", start
 
     text = "\n\n".join(lines)
     # Trim to max chars from the end (most recent content)
     if len(text) > _MAX_TRANSCRIPT_CHARS:
         text = text[-_MAX_TRANSCRIPT_CHARS:]
-    return text
-
+    return text, end_offset
 
-async def _flush_memories(text: str) -> tuple[int, list[str]]:
-    """Analyze text and flush detected memories to storage.
 
-    Returns (saved_count, summary_lines).
-    """
+def _detect_memories(text: str) -> list[_DetectedMemory]:
+    """Detect memorable patterns in text, boosted for emergency capture."""
     if not text:
-        return 0, []
+        return []
 
     from neural_memory.mcp.auto_capture import analyze_text_for_memories
-    from neural_memory.safety.sensitive import auto_redact_content
 
     detected = analyze_text_for_memories(
         text,
@@ -108,76 +232,126 @@ async def _flush_memories(text: str) -> tuple[int, list[str]]:
         capture_preferences=True,
     )
 
-    if not detected:
-        return 0, []
-
     # Emergency threshold: lower than normal to capture more before compaction
     emergency_threshold = 0.5
     eligible = [item for item in detected if item["confidence"] >= emergency_threshold]
 
-    if not eligible:
-        return 0, []
-
     # Boost priority for emergency-captured memories
-    boosted = [{**item, "priority": min(item.get("priority", 5) + 2, 10)} for item in eligible]
+    return [
+        _DetectedMemory(
+            content=item["content"],
+            type=item.get("type", "context"),
+            priority=min(item.get("priority", 5) + 2, 10),
+        )
+        for item in eligible
+    ]
+
+
+async def _save_memories(storage: Any, boosted: list[_DetectedMemory]) -> tuple[int, list[str]]:
+    """Encode detected memories into the current brain.
 
-    # Import storage and encoding machinery
-    from neural_memory.core.typed_memory import MemoryType, Priority, TypedMemory
+    Returns (saved_count, summary_lines).
+    """
+    from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
     from neural_memory.engine.encoder import MemoryEncoder
-    from neural_memory.unified_config import get_shared_storage
+    from neural_memory.hooks.pre_compact import save_typed_memories
+    from neural_memory.safety.sensitive import auto_redact_batch
     from neural_memory.utils.timeutils import utcnow
 
-    storage = await get_shared_storage()
     brain = await storage.get_brain(storage._current_brain_id or "")
     if not brain:
         return 0, []
 
     encoder = MemoryEncoder(storage, brain.config)
-    saved = 0
+    now = utcnow()
+    typed_memories: list[TypedMemory] = []
     summary_lines: list[str] = []
+    # One flush for the whole run instead of one per memory
+    storage.disable_auto_save()
 
-    for item in boosted:
-        content = item["content"]
-        # Auto-redact sensitive content
-        redacted, _, _ = auto_redact_content(content, min_severity=3)
-        mem_type_str = item.get("type", "context")
+    # Auto-redact sensitive content in one pass over the whole batch
+    redacted_all = auto_redact_batch([item.content for item in boosted], min_severity=3)
 
+    for index, (item, (redacted, _, _)) in enumerate(zip(boosted, redacted_all, strict=True)):
         try:
-            mem_type = MemoryType(mem_type_str)
+            mem_type = MemoryType(item.type)
         except ValueError:
             mem_type = MemoryType.CONTEXT
 
-        priority_val = item.get("priority", 5)
         try:
-            mem_priority = Priority(min(max(priority_val, 0), 10))
+            mem_priority = Priority(min(max(item.priority, 0), 10))
         except ValueError:
             mem_priority = Priority(5)
 
         try:
-            storage.disable_auto_save()
             result = await encoder.encode(
                 content=redacted,
-                timestamp=utcnow(),
+                timestamp=now,
                 tags={"emergency_flush", "precompact"},
             )
+        except Exception:
+            logger.debug("Failed to encode memory %d during precompact flush", index, exc_info=True)
+            continue
 
-            typed_mem = TypedMemory.create(
+        typed_memories.append(
+            TypedMemory.create(
                 fiber_id=result.fiber.id,
                 memory_type=mem_type,
                 priority=mem_priority,
                 source="precompact_hook",
                 tags={"emergency_flush", "precompact"},
             )
-            await storage.add_typed_memory(typed_mem)
-            await storage.batch_save()
-            saved += 1
-            summary_lines.append(f"- [{mem_type_str}] {redacted[:80]}")
-        except Exception:
-            logger.debug("Failed to save memory during precompact flush", exc_info=True)
-            continue
+        )
+        summary_lines.append(_summary_line(item.type, redacted))
+
+    stored = await save_typed_memories(storage, typed_memories)
+    await storage.batch_save()
+    return len(stored), [
+        line
+        for typed_mem, line in zip(typed_memories, summary_lines, strict=True)
+        if typed_mem.fiber_id in stored
+    ]
 
-    await storage.close()
-    return saved, summary_lines
+
+async def _flush_memories(transcript_path: str) -> tuple[int, list[str]]:
+    """Read the transcript and flush detected memories to storage.
+
+    Storage startup runs concurrently with transcript reading and pattern
+    analysis (both moved to worker threads), so the hook waits for the
+    slower of the two instead of their sum.
+
+    Returns (saved_count, summary_lines).
+    """
+    import asyncio
+
+    from neural_memory.hooks.transcript_offsets import (
+        load_transcript_offset,
+        save_transcript_offset,
+    )
+    from neural_memory.unified_config import get_shared_storage
+
+    def read_new_text() -> tuple[str, int]:
+        # Skip what the previous PreCompact flush of this transcript scanned
+        return _extract_transcript_text(transcript_path, load_transcript_offset(transcript_path))
+
+    storage_task = asyncio.create_task(get_shared_storage())
+    try:
+        text, end_offset = await asyncio.to_thread(read_new_text)
+        boosted = await asyncio.to_thread(_detect_memories, text)
+        storage = await storage_task
+        flushed = await _save_memories(storage, boosted) if boosted else (0, [])
+    finally:
+        # Close the storage whenever it was opened, even if reading or
+        # analysis failed after startup finished; stop startup otherwise
+        storage_task.cancel()
+        try:
+            opened = await storage_task
+        except (Exception, asyncio.CancelledError):
+            opened = None
+        if opened is not None:
+            await opened.close()
+    save_transcript_offset(transcript_path, end_offset)
+    return flushed
 
 
 def _build_additional_context(saved: int, summary_lines: list[str]) -> str:
@@ -188,9 +362,7 @@ def _build_additional_context(saved: int, summary_lines: list[str]) -> str:
         parts.append(f"Auto-saved {saved} memories before compaction:")
         parts.extend(summary_lines[:10])  # Limit to 10 lines
 
-    parts.append(
-        "Use nmem_recall or nmem_recap to retrieve session context after compaction."
-    )
+    parts.append("Use nmem_recall or nmem_recap to retrieve session context after compaction.")
     return "\n".join(parts)
 
 
@@ -198,15 +370,21 @@ def main() -> None:
     hook_input = _read_hook_input()
     transcript_path = hook_input.get("transcript_path", "")
 
-    # Extract text from transcript
-    text = _extract_transcript_text(transcript_path)
+    # Read transcript and flush, preferring a warm daemon
+    flushed: tuple[int, list[str]] | None
+    if not transcript_path or _nothing_new(transcript_path):
+        flushed = 0, []
+    else:
+        flushed = _flush_via_daemon(transcript_path)
+    if flushed is None:
+        import asyncio
 
-    # Run flush
-    try:
-        saved, summary_lines = asyncio.run(_flush_memories(text))
-    except Exception:
-        logger.debug("PreCompact flush failed", exc_info=True)
-        saved, summary_lines = 0, []
+        try:
+            flushed = asyncio.run(_flush_memories(transcript_path))
+        except Exception:
+            logger.debug("PreCompact flush failed", exc_info=True)
+            flushed = 0, []
+    saved, summary_lines = flushed
 
     # Build output with additionalContext
     additional = _build_additional_context(saved, summary_lines)
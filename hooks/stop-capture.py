@@ -15,6 +15,7 @@ import json
 import logging
 import sys
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger("neural_memory.hooks.stop")
 
@@ -92,7 +93,6 @@ async def _flush_memories(text: str) -> int:
         return 0
 
     from neural_memory.mcp.auto_capture import analyze_text_for_memories
-    from neural_memory.safety.sensitive import auto_redact_content
 
     detected = analyze_text_for_memories(
         text,
@@ -115,18 +115,31 @@ async def _flush_memories(text: str) -> int:
 
     boosted = [{**item, "priority": min(item.get("priority", 5) + 2, 10)} for item in eligible]
 
-    from neural_memory.core.typed_memory import MemoryType, Priority, TypedMemory
-    from neural_memory.engine.encoder import MemoryEncoder
     from neural_memory.unified_config import get_shared_storage
-    from neural_memory.utils.timeutils import utcnow
 
     storage = await get_shared_storage()
+    try:
+        return await _save_memories(storage, boosted)
+    finally:
+        await storage.close()
+
+
+async def _save_memories(storage: Any, boosted: list[dict[str, Any]]) -> int:
+    """Encode detected memories into the current brain; returns the saved count."""
+    from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
+    from neural_memory.engine.encoder import MemoryEncoder
+    from neural_memory.hooks.pre_compact import save_typed_memories
+    from neural_memory.safety.sensitive import auto_redact_content
+    from neural_memory.utils.timeutils import utcnow
+
     brain = await storage.get_brain(storage._current_brain_id or "")
     if not brain:
         return 0
 
     encoder = MemoryEncoder(storage, brain.config)
-    saved = 0
+    typed_memories: list[TypedMemory] = []
+    # One flush for the whole run instead of one per memory
+    storage.disable_auto_save()
 
     for item in boosted:
         content = item["content"]
@@ -145,29 +158,28 @@ async def _flush_memories(text: str) -> int:
             mem_priority = Priority(5)
 
         try:
-            storage.disable_auto_save()
             result = await encoder.encode(
                 content=redacted,
                 timestamp=utcnow(),
                 tags={"emergency_flush", "session_end"},
             )
+        except Exception:
+            logger.debug("Failed to save memory during stop flush", exc_info=True)
+            continue
 
-            typed_mem = TypedMemory.create(
+        typed_memories.append(
+            TypedMemory.create(
                 fiber_id=result.fiber.id,
                 memory_type=mem_type,
                 priority=mem_priority,
                 source="stop_hook",
                 tags={"emergency_flush", "session_end"},
             )
-            await storage.add_typed_memory(typed_mem)
-            await storage.batch_save()
-            saved += 1
-        except Exception:
-            logger.debug("Failed to save memory during stop flush", exc_info=True)
-            continue
+        )
 
-    await storage.close()
-    return saved
+    stored = await save_typed_memories(storage, typed_memories)
+    await storage.batch_save()
+    return len(stored)
 
 
 def main() -> None:
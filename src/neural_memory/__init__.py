@@ -1,20 +1,27 @@
 """NeuralMemory - Reflex-based memory system for AI agents."""
 
-from neural_memory.core.brain import Brain, BrainConfig
-from neural_memory.core.brain_mode import (
-    BrainMode,
-    BrainModeConfig,
-    SharedConfig,
-    SyncStrategy,
-)
-from neural_memory.core.fiber import Fiber
-from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
-from neural_memory.core.synapse import Direction, Synapse, SynapseType
-from neural_memory.engine.brain_transplant import TransplantFilter, TransplantResult
-from neural_memory.engine.brain_versioning import BrainVersion, VersionDiff, VersioningEngine
-from neural_memory.engine.encoder import EncodingResult, MemoryEncoder
-from neural_memory.engine.reflex_activation import CoActivation, ReflexActivation
-from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline, RetrievalResult
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.core.brain import Brain, BrainConfig
+    from neural_memory.core.brain_mode import (
+        BrainMode,
+        BrainModeConfig,
+        SharedConfig,
+        SyncStrategy,
+    )
+    from neural_memory.core.fiber import Fiber
+    from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
+    from neural_memory.core.synapse import Direction, Synapse, SynapseType
+    from neural_memory.engine.brain_transplant import TransplantFilter, TransplantResult
+    from neural_memory.engine.brain_versioning import BrainVersion, VersionDiff, VersioningEngine
+    from neural_memory.engine.encoder import EncodingResult, MemoryEncoder
+    from neural_memory.engine.reflex_activation import CoActivation, ReflexActivation
+    from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline, RetrievalResult
 
 __version__ = "2.14.0"
 
@@ -46,3 +53,37 @@ __all__ = [
     "VersionDiff",
     "VersioningEngine",
 ]
+
+
+# Public names are imported on first access, so importing a submodule (the
+# CLI, hooks, config) does not load the whole engine through this package.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Brain": "neural_memory.core.brain",
+    "BrainConfig": "neural_memory.core.brain",
+    "BrainMode": "neural_memory.core.brain_mode",
+    "BrainModeConfig": "neural_memory.core.brain_mode",
+    "SharedConfig": "neural_memory.core.brain_mode",
+    "SyncStrategy": "neural_memory.core.brain_mode",
+    "Fiber": "neural_memory.core.fiber",
+    "Neuron": "neural_memory.core.neuron",
+    "NeuronState": "neural_memory.core.neuron",
+    "NeuronType": "neural_memory.core.neuron",
+    "Direction": "neural_memory.core.synapse",
+    "Synapse": "neural_memory.core.synapse",
+    "SynapseType": "neural_memory.core.synapse",
+    "TransplantFilter": "neural_memory.engine.brain_transplant",
+    "TransplantResult": "neural_memory.engine.brain_transplant",
+    "BrainVersion": "neural_memory.engine.brain_versioning",
+    "VersionDiff": "neural_memory.engine.brain_versioning",
+    "VersioningEngine": "neural_memory.engine.brain_versioning",
+    "EncodingResult": "neural_memory.engine.encoder",
+    "MemoryEncoder": "neural_memory.engine.encoder",
+    "CoActivation": "neural_memory.engine.reflex_activation",
+    "ReflexActivation": "neural_memory.engine.reflex_activation",
+    "DepthLevel": "neural_memory.engine.retrieval",
+    "ReflexPipeline": "neural_memory.engine.retrieval",
+    "RetrievalResult": "neural_memory.engine.retrieval",
+}
+
+
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
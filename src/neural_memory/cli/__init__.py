@@ -10,6 +10,23 @@ Usage:
     nmem brain use <name>       Switch brain
 """
 
-from neural_memory.cli.main import app, main
+from __future__ import annotations
 
-__all__ = ["app", "main"]
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neural_memory.cli.main import app
+
+__all__ = ["app"]
+
+
+# Imported on first access, so the console entry point (cli._entry) can
+# answer --version without loading Typer and the command tree.
+def __getattr__(name: str) -> Any:
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from neural_memory.cli.main import app as cli_app
+
+    globals()["app"] = cli_app  # Later lookups skip __getattr__
+    return cli_app
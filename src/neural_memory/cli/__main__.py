@@ -1,6 +1,6 @@
 """Allow running as python -m neural_memory.cli."""
 
-from neural_memory.cli.main import main
+from neural_memory.cli._entry import main
 
 if __name__ == "__main__":
     main()
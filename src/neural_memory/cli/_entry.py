@@ -0,0 +1,22 @@
+"""Console entry point for ``nmem`` and ``neural-memory``.
+
+``nmem --version`` is answered here, before Typer and the command tree
+are imported. Everything else runs ``neural_memory.cli.main:main``.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """Run the CLI, answering a bare ``--version`` without loading Typer."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from neural_memory import __version__
+
+        print(f"neural-memory {__version__}")
+        return
+
+    from neural_memory.cli.main import main as run_cli
+
+    run_cli()
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
 import logging
-from collections.abc import Coroutine
+import re
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
 
 import typer
 
-from neural_memory.cli.config import CLIConfig
-from neural_memory.cli.storage import PersistentStorage
+from neural_memory.cli.config import CLIConfig, get_default_data_dir
+
+if TYPE_CHECKING:
+    from neural_memory.cli.storage import PersistentStorage
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+P = ParamSpec("P")
 
 # Track storages created during a CLI command so we can close them before
 # the event loop shuts down (prevents "Event loop is closed" noise from
@@ -24,9 +30,32 @@ T = TypeVar("T")
 _active_storages: list[Any] = []
 
 
+# (config.json path, mtime_ns, size) -> parsed config
+_config_cache: dict[tuple[Path, int, int], CLIConfig] = {}
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
 def get_config() -> CLIConfig:
-    """Get CLI configuration."""
-    return CLIConfig.load()
+    """Get CLI configuration.
+
+    The parsed config is reused until config.json changes on disk (by
+    path, mtime or size). Each call returns a copy, so callers may
+    modify and save it without affecting later calls.
+    """
+    config_file = get_default_data_dir() / "config.json"
+    try:
+        stat = config_file.stat()
+    except OSError:
+        return CLIConfig.load()
+
+    key = (config_file, stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(key)
+    if cached is None:
+        cached = CLIConfig.load(config_file.parent)
+        _config_cache.clear()
+        _config_cache[key] = cached
+    return dataclasses.replace(cached, shared=dataclasses.replace(cached.shared))
 
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
@@ -102,10 +131,40 @@ async def get_storage(
         return sqlite_storage  # type: ignore[return-value]
 
     # Legacy JSON mode
+    from neural_memory.cli.storage import PersistentStorage
+
     brain_path = config.get_brain_path(name)
     return await PersistentStorage.load(brain_path)
 
 
+@asynccontextmanager
+async def open_storage(config: CLIConfig | None = None) -> AsyncIterator[PersistentStorage]:
+    """Open storage for the current brain and close it on exit.
+
+    Args:
+        config: CLI configuration (default: ``get_config()``)
+    """
+    storage = await get_storage(config or get_config())
+    try:
+        yield storage
+    finally:
+        await storage.close()
+
+
+def run_with_storage(
+    func: Callable[Concatenate[PersistentStorage, P], Coroutine[Any, Any, T]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """Run ``func(storage, *args, **kwargs)`` inside ``open_storage`` via ``run_async``."""
+
+    async def _main() -> T:
+        async with open_storage() as storage:
+            return await func(storage, *args, **kwargs)
+
+    return run_async(_main())
+
+
 def get_brain_path_auto(config: CLIConfig, brain_name: str | None = None) -> Path:
     """Get brain file path, choosing .db or .json based on storage mode."""
     if config.use_sqlite:
@@ -113,66 +172,132 @@ def get_brain_path_auto(config: CLIConfig, brain_name: str | None = None) -> Pat
     return config.get_brain_path(brain_name)
 
 
+def dumps_json_indented(data: Any) -> str:
+    """Serialize ``data`` like ``json.dumps(data, indent=2, default=str)``.
+
+    Uses orjson (the ``fast`` extra) when it is installed: with ``indent``
+    set, the stdlib falls back to its pure-Python encoder, which is slow for
+    large recall and list outputs. Datetimes and dataclasses are passed
+    through to ``default`` and non-ASCII characters are escaped afterwards,
+    so strings come out the same either way. orjson spells some floats
+    differently (``1e-5`` for ``1e-05``), writes plain Enum members as their
+    value and NaN as ``null``.
+
+    Args:
+        data: JSON-compatible value to serialize
+
+    Returns:
+        The indented JSON text
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, default=str)
+
+    try:
+        encoded = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
+    except orjson.JSONEncodeError:
+        # e.g. integers wider than 64 bits, which only the stdlib handles
+        return json.dumps(data, indent=2, default=str)
+    if encoded.isascii():
+        return encoded
+    return _NON_ASCII.sub(lambda m: json.dumps(m.group())[1:-1], encoded)
+
+
 def output_result(data: dict[str, Any], as_json: bool = False) -> None:
     """Output result in appropriate format."""
     if as_json:
-        typer.echo(json.dumps(data, indent=2, default=str))
+        typer.echo(dumps_json_indented(data))
+        return
+
+    # Human-readable format: the first key present picks the layout. Lines
+    # are styled one by one and written with a single echo (click strips
+    # the colours again when stdout is not a terminal).
+    for key, format_lines in _HUMAN_FORMATS:
+        if key in data:
+            lines = format_lines(data)
+            break
     else:
-        # Human-readable format
-        if "error" in data:
-            typer.secho(f"Error: {data['error']}", fg=typer.colors.RED)
-        elif "answer" in data:
-            typer.echo(data["answer"])
-
-            # Show freshness warnings
-            if data.get("freshness_warnings"):
-                typer.echo("")
-                for warning in data["freshness_warnings"]:
-                    typer.secho(warning, fg=typer.colors.YELLOW)
-
-            # Show metadata
-            meta_parts = []
-            if data.get("confidence") is not None:
-                meta_parts.append(f"confidence: {data['confidence']:.2f}")
-            if data.get("neurons_activated"):
-                meta_parts.append(f"neurons: {data['neurons_activated']}")
-            if data.get("oldest_memory_age"):
-                meta_parts.append(f"oldest: {data['oldest_memory_age']}")
-
-            if meta_parts:
-                typer.secho(f"\n[{', '.join(meta_parts)}]", fg=typer.colors.BRIGHT_BLACK)
-
-            # Show routing info if present
-            if data.get("routing"):
-                r = data["routing"]
-                typer.secho(
-                    f"\n[routing: {r['query_type']}, depth: {r['suggested_depth']}, "
-                    f"confidence: {r['confidence']}]",
-                    fg=typer.colors.BRIGHT_BLACK,
-                )
-
-        elif "message" in data:
-            typer.secho(data["message"], fg=typer.colors.GREEN)
-
-            # Show memory type info
-            type_parts = []
-            if data.get("memory_type"):
-                type_parts.append(f"type: {data['memory_type']}")
-            if data.get("priority"):
-                type_parts.append(f"priority: {data['priority']}")
-            if data.get("expires_in_days") is not None:
-                type_parts.append(f"expires: {data['expires_in_days']}d")
-            if data.get("project"):
-                type_parts.append(f"project: {data['project']}")
-            if type_parts:
-                typer.secho(f"  [{', '.join(type_parts)}]", fg=typer.colors.BRIGHT_BLACK)
-
-            # Show warnings if any
-            if data.get("warnings"):
-                for warning in data["warnings"]:
-                    typer.secho(warning, fg=typer.colors.YELLOW)
-
-        elif "context" in data:
-            typer.echo(data["context"])
-        else:
-            typer.echo(str(data))
+        lines = [str(data)]
+    typer.echo("\n".join(lines))
+
+
+def _error_lines(data: dict[str, Any]) -> list[str]:
+    return [typer.style(f"Error: {data['error']}", fg=typer.colors.RED)]
+
+
+def _answer_lines(data: dict[str, Any]) -> list[str]:
+    lines = [str(data["answer"])]
+
+    # Show freshness warnings
+    if warnings := data.get("freshness_warnings"):
+        lines.append("")
+        lines.extend(typer.style(warning, fg=typer.colors.YELLOW) for warning in warnings)
+
+    # Show metadata
+    meta_parts = []
+    if (confidence := data.get("confidence")) is not None:
+        meta_parts.append(f"confidence: {confidence:.2f}")
+    if neurons := data.get("neurons_activated"):
+        meta_parts.append(f"neurons: {neurons}")
+    if oldest := data.get("oldest_memory_age"):
+        meta_parts.append(f"oldest: {oldest}")
+    _append_parts(lines, "\n", meta_parts)
+
+    # Show routing info if present
+    if r := data.get("routing"):
+        lines.append(
+            typer.style(
+                f"\n[routing: {r['query_type']}, depth: {r['suggested_depth']}, "
+                f"confidence: {r['confidence']}]",
+                fg=typer.colors.BRIGHT_BLACK,
+            )
+        )
+    return lines
+
+
+def _message_lines(data: dict[str, Any]) -> list[str]:
+    lines = [typer.style(data["message"], fg=typer.colors.GREEN)]
+
+    # Show memory type info
+    type_parts = []
+    if memory_type := data.get("memory_type"):
+        type_parts.append(f"type: {memory_type}")
+    if priority := data.get("priority"):
+        type_parts.append(f"priority: {priority}")
+    if (expires_in_days := data.get("expires_in_days")) is not None:
+        type_parts.append(f"expires: {expires_in_days}d")
+    if project := data.get("project"):
+        type_parts.append(f"project: {project}")
+    _append_parts(lines, "  ", type_parts)
+
+    # Show warnings if any
+    if warnings := data.get("warnings"):
+        lines.extend(typer.style(warning, fg=typer.colors.YELLOW) for warning in warnings)
+    return lines
+
+
+def _context_lines(data: dict[str, Any]) -> list[str]:
+    return [str(data["context"])]
+
+
+def _append_parts(lines: list[str], prefix: str, parts: list[str]) -> None:
+    """Add ``parts`` as one dimmed ``[a, b]`` line, if there are any."""
+    if parts:
+        lines.append(typer.style(f"{prefix}[{', '.join(parts)}]", fg=typer.colors.BRIGHT_BLACK))
+
+
+# Human-readable layouts in priority order: an error wins over an answer, etc.
+_HUMAN_FORMATS: tuple[tuple[str, Callable[[dict[str, Any]], list[str]]], ...] = (
+    ("error", _error_lines),
+    ("answer", _answer_lines),
+    ("message", _message_lines),
+    ("context", _context_lines),
+)
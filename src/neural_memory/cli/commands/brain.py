@@ -194,10 +194,12 @@ def brain_export(
         if output:
             from pathlib import Path
 
+            from neural_memory.utils.json_stream import dump_json_streaming
+
             output_path = Path(output).resolve()
             try:
                 with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(export_data, f, indent=2, default=str)
+                    dump_json_streaming(export_data, f, default=str)
             except OSError as exc:
                 typer.secho(f"Failed to write export file: {exc}", fg=typer.colors.RED, err=True)
                 raise typer.Exit(1) from exc
@@ -8,7 +8,6 @@ from typing import Annotated
 import typer
 
 from neural_memory.cli._helpers import get_config, get_storage, output_result, run_async
-from neural_memory.engine.codebase_encoder import CodebaseEncoder
 
 
 def index(
@@ -77,6 +76,8 @@ async def _index_async(
         typer.echo("Error: No brain configured", err=True)
         raise typer.Exit(code=1)
 
+    from neural_memory.engine.codebase_encoder import CodebaseEncoder
+
     encoder = CodebaseEncoder(storage, brain.config)
     storage.disable_auto_save()
 
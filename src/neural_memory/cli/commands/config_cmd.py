@@ -32,15 +32,9 @@ def preset_cmd(
         nmem config preset max-recall --dry-run
         nmem config preset safe-cost
     """
-    from neural_memory.config_presets import (
-        apply_preset,
-        compute_diff,
-        get_preset,
-        list_presets,
-    )
-    from neural_memory.unified_config import UnifiedConfig
-
     if list_available or not name:
+        from neural_memory.config_presets import list_presets
+
         presets = list_presets()
         typer.echo("Available presets:\n")
         for p in presets:
@@ -49,6 +43,9 @@ def preset_cmd(
         typer.echo("\nUsage: nmem config preset <name>")
         return
 
+    from neural_memory.config_presets import apply_preset, compute_diff, get_preset
+    from neural_memory.unified_config import UnifiedConfig
+
     preset = get_preset(name)
     if preset is None:
         typer.secho(f"Unknown preset: {name}", fg=typer.colors.RED)
@@ -112,6 +109,7 @@ def tier_cmd(
     """
     from neural_memory.unified_config import (
         _VALID_TOOL_TIERS,
+        _VALID_TOOL_TIERS_TEXT,
         ToolTierConfig,
         UnifiedConfig,
     )
@@ -120,13 +118,13 @@ def tier_cmd(
 
     if show or not name:
         typer.echo(f"Current tool tier: {config.tool_tier.tier}")
-        typer.echo(f"Valid tiers: {', '.join(sorted(_VALID_TOOL_TIERS))}")
+        typer.echo(f"Valid tiers: {_VALID_TOOL_TIERS_TEXT}")
         return
 
     tier_value = name.lower().strip()
     if tier_value not in _VALID_TOOL_TIERS:
         typer.secho(f"Unknown tier: {name}", fg=typer.colors.RED)
-        typer.echo(f"Valid tiers: {', '.join(sorted(_VALID_TOOL_TIERS))}")
+        typer.echo(f"Valid tiers: {_VALID_TOOL_TIERS_TEXT}")
         raise typer.Exit(1)
 
     config.tool_tier = ToolTierConfig(tier=tier_value)
@@ -3,15 +3,213 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Annotated
+from itertools import islice
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from neural_memory.cli._helpers import get_config, get_storage, output_result, run_async
+from neural_memory.cli._helpers import output_result, run_with_storage
+
+if TYPE_CHECKING:
+    from neural_memory.cli.storage import PersistentStorage
 
 habits_app = typer.Typer(help="Learned workflow habit commands")
 
 
+async def _list(storage: PersistentStorage, json_output: bool) -> None:
+    """List learned habits."""
+    habits = [h async for h in storage.iter_habit_fibers()]
+
+    if json_output:
+        output_result(
+            {
+                "habits": [
+                    {
+                        "name": h.summary or "unnamed",
+                        "steps": h.metadata.get("_workflow_actions", []),
+                        "frequency": h.metadata.get("_habit_frequency", 0),
+                        "confidence": h.metadata.get("_habit_confidence", 0.0),
+                        "fiber_id": h.id,
+                    }
+                    for h in habits
+                ],
+                "count": len(habits),
+            },
+            True,
+        )
+    else:
+        if not habits:
+            typer.echo(
+                "No learned habits yet. Use NeuralMemory tools to build action history.\n"
+                "Run `nmem habits status` to see progress toward pattern detection."
+            )
+            return
+
+        typer.echo(f"Learned habits ({len(habits)}):")
+        for h in habits:
+            steps = h.metadata.get("_workflow_actions", [])
+            freq = h.metadata.get("_habit_frequency", 0)
+            conf = h.metadata.get("_habit_confidence", 0.0)
+            typer.echo(f"  {h.summary or 'unnamed'}")
+            typer.echo(f"    Steps: {' → '.join(steps)}")
+            typer.echo(f"    Frequency: {freq}, Confidence: {conf:.2f}")
+
+
+async def _show(storage: PersistentStorage, name: str, json_output: bool) -> None:
+    """Show a single habit by name."""
+    habit = await storage.get_habit_by_name(name)
+    if habit is None:
+        typer.echo(f"No habit found with name: {name}")
+        raise typer.Exit(code=1)
+
+    steps = habit.metadata.get("_workflow_actions", [])
+    freq = habit.metadata.get("_habit_frequency", 0)
+    conf = habit.metadata.get("_habit_confidence", 0.0)
+
+    if json_output:
+        output_result(
+            {
+                "name": habit.summary or "unnamed",
+                "steps": steps,
+                "frequency": freq,
+                "confidence": conf,
+                "fiber_id": habit.id,
+                "neuron_count": len(habit.neuron_ids),
+                "synapse_count": len(habit.synapse_ids),
+                "created_at": habit.created_at.isoformat(),
+            },
+            True,
+        )
+    else:
+        typer.echo(f"Habit: {habit.summary or 'unnamed'}")
+        typer.echo(f"  Steps: {' → '.join(steps)}")
+        typer.echo(f"  Frequency: {freq}")
+        typer.echo(f"  Confidence: {conf:.2f}")
+        typer.echo(f"  Neurons: {len(habit.neuron_ids)}")
+        typer.echo(f"  Synapses: {len(habit.synapse_ids)}")
+        typer.echo(f"  Created: {habit.created_at.isoformat()}")
+
+
+async def _clear(storage: PersistentStorage, force: bool) -> None:
+    """Delete all learned habit fibers."""
+    habits = [h async for h in storage.iter_habit_fibers()]
+
+    if not habits:
+        typer.echo("No habits to clear.")
+        return
+
+    if not force:
+        confirm = typer.confirm(f"Clear {len(habits)} learned habits?")
+        if not confirm:
+            typer.echo("Cancelled.")
+            return
+
+    cleared = await storage.delete_fibers([h.id for h in habits])
+
+    typer.echo(f"Cleared {cleared} learned habits.")
+
+
+async def _status(storage: PersistentStorage, json_output: bool) -> None:
+    """Report emerging patterns that have not become habits yet."""
+    from neural_memory.engine.sequence_mining import mine_sequential_pairs
+    from neural_memory.utils.timeutils import utcnow
+
+    brain = await storage.get_brain(storage._current_brain_id or "")
+    if not brain:
+        typer.secho("No brain configured.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    brain_config = brain.config
+    min_freq = brain_config.habit_min_frequency
+    window = brain_config.sequential_window_seconds
+    now = utcnow()
+
+    # Get recent action events (same window as learn_habits)
+    since = now - timedelta(days=30)
+    events = await storage.get_action_sequences(since=since)
+
+    if len(events) < 2:
+        if json_output:
+            output_result(
+                {
+                    "action_events": len(events),
+                    "threshold": min_freq,
+                    "emerging_patterns": [],
+                    "message": "Not enough action events yet. Keep using NeuralMemory tools.",
+                },
+                True,
+            )
+        else:
+            typer.echo(f"Action events (last 30 days): {len(events)}")
+            typer.echo(f"Minimum for habit detection: {min_freq} occurrences")
+            typer.echo()
+            typer.echo("Not enough action events yet. Keep using NeuralMemory tools.")
+        return
+
+    # Mine pairs (same logic as learn_habits)
+    pairs = mine_sequential_pairs(events, window)
+
+    # Count sessions
+    session_ids = {e.session_id for e in events if e.session_id}
+    total_sessions = max(len(session_ids), 1)
+
+    # Get existing habits to exclude
+    existing_habits = {
+        tuple(h.metadata.get("_workflow_actions", [])) async for h in storage.iter_habit_fibers()
+    }
+
+    # Separate into learned vs emerging, keeping the 10 closest to the
+    # threshold (capped for readability). Pairs come sorted by count
+    # descending, so those are the first 10 not yet learned.
+    candidates = (pair for pair in pairs if (pair.action_a, pair.action_b) not in existing_habits)
+    emerging: list[dict[str, str | int | float]] = [
+        {
+            "pattern": f"{pair.action_a} -> {pair.action_b}",
+            "count": pair.count,
+            "threshold": min_freq,
+            "progress": round(min(pair.count / min_freq, 1.0), 2),
+            "remaining": max(0, min_freq - pair.count),
+        }
+        for pair in islice(candidates, 10)
+    ]
+
+    if json_output:
+        output_result(
+            {
+                "action_events": len(events),
+                "sessions": total_sessions,
+                "threshold": min_freq,
+                "existing_habits": len(existing_habits),
+                "emerging_patterns": emerging,
+            },
+            True,
+        )
+    else:
+        typer.echo(f"Action events (last 30 days): {len(events)}")
+        typer.echo(f"Sessions: {total_sessions}")
+        typer.echo(f"Learned habits: {len(existing_habits)}")
+        typer.echo(f"Threshold for habit detection: {min_freq} occurrences")
+        typer.echo()
+
+        if not emerging:
+            typer.echo("No emerging patterns detected yet.")
+            typer.echo("Keep using recall, remember, and other tools to build patterns.")
+            return
+
+        typer.echo("Emerging patterns:")
+        for e in emerging:
+            bar_filled = round(float(e["progress"]) * 10)
+            bar = "#" * bar_filled + "-" * (10 - bar_filled)
+            status = "READY" if e["remaining"] == 0 else f"{e['remaining']} more needed"
+            typer.echo(f"  {e['pattern']!s:<30} [{bar}] {e['count']}/{e['threshold']} ({status})")
+
+        ready_count = sum(1 for e in emerging if e["remaining"] == 0)
+        if ready_count > 0:
+            typer.echo(
+                f"\n{ready_count} pattern(s) ready — run `nmem consolidate --strategy learn_habits` to materialize."
+            )
+
+
 @habits_app.command("list")
 def habits_list(
     json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
@@ -25,51 +223,7 @@ def habits_list(
         nmem habits list
         nmem habits list --json
     """
-
-    async def _list() -> None:
-        config = get_config()
-        storage = await get_storage(config)
-        try:
-            fibers = await storage.get_fibers(limit=1000)
-            habits = [f for f in fibers if f.metadata.get("_habit_pattern")]
-
-            if json_output:
-                output_result(
-                    {
-                        "habits": [
-                            {
-                                "name": h.summary or "unnamed",
-                                "steps": h.metadata.get("_workflow_actions", []),
-                                "frequency": h.metadata.get("_habit_frequency", 0),
-                                "confidence": h.metadata.get("_habit_confidence", 0.0),
-                                "fiber_id": h.id,
-                            }
-                            for h in habits
-                        ],
-                        "count": len(habits),
-                    },
-                    True,
-                )
-            else:
-                if not habits:
-                    typer.echo(
-                        "No learned habits yet. Use NeuralMemory tools to build action history.\n"
-                        "Run `nmem habits status` to see progress toward pattern detection."
-                    )
-                    return
-
-                typer.echo(f"Learned habits ({len(habits)}):")
-                for h in habits:
-                    steps = h.metadata.get("_workflow_actions", [])
-                    freq = h.metadata.get("_habit_frequency", 0)
-                    conf = h.metadata.get("_habit_confidence", 0.0)
-                    typer.echo(f"  {h.summary or 'unnamed'}")
-                    typer.echo(f"    Steps: {' → '.join(steps)}")
-                    typer.echo(f"    Frequency: {freq}, Confidence: {conf:.2f}")
-        finally:
-            await storage.close()
-
-    run_async(_list())
+    run_with_storage(_list, json_output)
 
 
 @habits_app.command("show")
@@ -83,49 +237,7 @@ def habits_show(
         nmem habits show recall-edit-test
         nmem habits show recall-edit-test --json
     """
-
-    async def _show() -> None:
-        config = get_config()
-        storage = await get_storage(config)
-        try:
-            fibers = await storage.get_fibers(limit=1000)
-            habits = [f for f in fibers if f.metadata.get("_habit_pattern") and f.summary == name]
-
-            if not habits:
-                typer.echo(f"No habit found with name: {name}")
-                raise typer.Exit(code=1)
-
-            habit = habits[0]
-            steps = habit.metadata.get("_workflow_actions", [])
-            freq = habit.metadata.get("_habit_frequency", 0)
-            conf = habit.metadata.get("_habit_confidence", 0.0)
-
-            if json_output:
-                output_result(
-                    {
-                        "name": habit.summary or "unnamed",
-                        "steps": steps,
-                        "frequency": freq,
-                        "confidence": conf,
-                        "fiber_id": habit.id,
-                        "neuron_count": len(habit.neuron_ids),
-                        "synapse_count": len(habit.synapse_ids),
-                        "created_at": habit.created_at.isoformat(),
-                    },
-                    True,
-                )
-            else:
-                typer.echo(f"Habit: {habit.summary or 'unnamed'}")
-                typer.echo(f"  Steps: {' → '.join(steps)}")
-                typer.echo(f"  Frequency: {freq}")
-                typer.echo(f"  Confidence: {conf:.2f}")
-                typer.echo(f"  Neurons: {len(habit.neuron_ids)}")
-                typer.echo(f"  Synapses: {len(habit.synapse_ids)}")
-                typer.echo(f"  Created: {habit.created_at.isoformat()}")
-        finally:
-            await storage.close()
-
-    run_async(_show())
+    run_with_storage(_show, name, json_output)
 
 
 @habits_app.command("clear")
@@ -141,34 +253,7 @@ def habits_clear(
         nmem habits clear
         nmem habits clear --force
     """
-
-    async def _clear() -> None:
-        config = get_config()
-        storage = await get_storage(config)
-        try:
-            fibers = await storage.get_fibers(limit=1000)
-            habits = [f for f in fibers if f.metadata.get("_habit_pattern")]
-
-            if not habits:
-                typer.echo("No habits to clear.")
-                return
-
-            if not force:
-                confirm = typer.confirm(f"Clear {len(habits)} learned habits?")
-                if not confirm:
-                    typer.echo("Cancelled.")
-                    return
-
-            cleared = 0
-            for h in habits:
-                await storage.delete_fiber(h.id)
-                cleared += 1
-
-            typer.echo(f"Cleared {cleared} learned habits.")
-        finally:
-            await storage.close()
-
-    run_async(_clear())
+    run_with_storage(_clear, force)
 
 
 @habits_app.command("status")
@@ -185,121 +270,4 @@ def habits_status(
         nmem habits status
         nmem habits status --json
     """
-
-    async def _status() -> None:
-        from neural_memory.engine.sequence_mining import mine_sequential_pairs
-        from neural_memory.utils.timeutils import utcnow
-
-        config = get_config()
-        storage = await get_storage(config)
-        try:
-            brain = await storage.get_brain(storage._current_brain_id or "")
-            if not brain:
-                typer.secho("No brain configured.", fg=typer.colors.RED, err=True)
-                raise typer.Exit(1)
-
-            brain_config = brain.config
-            min_freq = brain_config.habit_min_frequency
-            window = brain_config.sequential_window_seconds
-            now = utcnow()
-
-            # Get recent action events (same window as learn_habits)
-            since = now - timedelta(days=30)
-            events = await storage.get_action_sequences(since=since)
-
-            if len(events) < 2:
-                if json_output:
-                    output_result(
-                        {
-                            "action_events": len(events),
-                            "threshold": min_freq,
-                            "emerging_patterns": [],
-                            "message": "Not enough action events yet. Keep using NeuralMemory tools.",
-                        },
-                        True,
-                    )
-                else:
-                    typer.echo(f"Action events (last 30 days): {len(events)}")
-                    typer.echo(f"Minimum for habit detection: {min_freq} occurrences")
-                    typer.echo()
-                    typer.echo("Not enough action events yet. Keep using NeuralMemory tools.")
-                return
-
-            # Mine pairs (same logic as learn_habits)
-            pairs = mine_sequential_pairs(events, window)
-
-            # Count sessions
-            session_ids = {e.session_id for e in events if e.session_id}
-            total_sessions = max(len(session_ids), 1)
-
-            # Get existing habits to exclude
-            fibers = await storage.get_fibers(limit=1000)
-            existing_habits = {
-                tuple(f.metadata.get("_workflow_actions", []))
-                for f in fibers
-                if f.metadata.get("_habit_pattern")
-            }
-
-            # Separate into learned vs emerging
-            emerging: list[dict[str, str | int | float]] = []
-            for pair in pairs:
-                steps = (pair.action_a, pair.action_b)
-                if steps in existing_habits:
-                    continue
-                progress = min(pair.count / min_freq, 1.0)
-                emerging.append(
-                    {
-                        "pattern": f"{pair.action_a} -> {pair.action_b}",
-                        "count": pair.count,
-                        "threshold": min_freq,
-                        "progress": round(progress, 2),
-                        "remaining": max(0, min_freq - pair.count),
-                    }
-                )
-
-            # Sort by progress descending
-            emerging.sort(key=lambda e: float(e["progress"]), reverse=True)
-            # Cap at 10 for readability
-            emerging = emerging[:10]
-
-            if json_output:
-                output_result(
-                    {
-                        "action_events": len(events),
-                        "sessions": total_sessions,
-                        "threshold": min_freq,
-                        "existing_habits": len(existing_habits),
-                        "emerging_patterns": emerging,
-                    },
-                    True,
-                )
-            else:
-                typer.echo(f"Action events (last 30 days): {len(events)}")
-                typer.echo(f"Sessions: {total_sessions}")
-                typer.echo(f"Learned habits: {len(existing_habits)}")
-                typer.echo(f"Threshold for habit detection: {min_freq} occurrences")
-                typer.echo()
-
-                if not emerging:
-                    typer.echo("No emerging patterns detected yet.")
-                    typer.echo("Keep using recall, remember, and other tools to build patterns.")
-                    return
-
-                typer.echo("Emerging patterns:")
-                for e in emerging:
-                    bar_filled = round(float(e["progress"]) * 10)
-                    bar = "#" * bar_filled + "-" * (10 - bar_filled)
-                    status = "READY" if e["remaining"] == 0 else f"{e['remaining']} more needed"
-                    typer.echo(
-                        f"  {e['pattern']!s:<30} [{bar}] {e['count']}/{e['threshold']} ({status})"
-                    )
-
-                ready_count = sum(1 for e in emerging if e["remaining"] == 0)
-                if ready_count > 0:
-                    typer.echo(
-                        f"\n{ready_count} pattern(s) ready — run `nmem consolidate --strategy learn_habits` to materialize."
-                    )
-        finally:
-            await storage.close()
-
-    run_async(_status())
+    run_with_storage(_status, json_output)
@@ -309,7 +309,7 @@ def cleanup(
         nmem cleanup --type context         # Remove expired context memories
     """
 
-    async def _cleanup() -> dict[str, Any]:
+    async def _cleanup() -> dict[str, Any] | None:
         config = get_config()
         storage = await get_storage(config)
 
@@ -361,6 +361,13 @@ def cleanup(
                 "count": len(to_delete),
             }
 
+        # Ask inside the same run so the storage opened above is reused for
+        # the delete. Blocking the loop is fine: nothing else is scheduled.
+        if not force and not typer.confirm(
+            f"Delete {len(to_delete)} expired memories? This cannot be undone."
+        ):
+            return None
+
         # Actually delete
         deleted_count = 0
         for tm in expired_memories:
@@ -378,31 +385,10 @@ def cleanup(
             "details": to_delete,
         }
 
-    # Confirmation for non-dry-run
-    if not dry_run and not force:
-        # First do a dry run to show count
-        async def _preview() -> int:
-            config = get_config()
-            storage = await get_storage(config)
-            expired = await storage.get_expired_memories()
-            if memory_type:
-                try:
-                    mem_type = MemoryType(memory_type.lower())
-                    expired = [tm for tm in expired if tm.memory_type == mem_type]
-                except ValueError:
-                    logger.debug("Invalid memory_type %r in preview, showing all", memory_type)
-            return len(expired)
-
-        count = run_async(_preview())
-        if count == 0:
-            typer.echo("No expired memories to clean up.")
-            return
-
-        if not typer.confirm(f"Delete {count} expired memories? This cannot be undone."):
-            typer.echo("Cancelled.")
-            return
-
     result = run_async(_cleanup())
+    if result is None:
+        typer.echo("Cancelled.")
+        return
 
     if json_output:
         output_result(result, True)
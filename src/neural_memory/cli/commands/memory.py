@@ -17,10 +17,6 @@ from neural_memory.core.memory_types import (
     TypedMemory,
     suggest_memory_type,
 )
-from neural_memory.engine.encoder import MemoryEncoder
-from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline
-from neural_memory.extraction.parser import QueryParser
-from neural_memory.extraction.router import QueryRouter
 from neural_memory.safety.freshness import (
     FreshnessLevel,
     analyze_freshness,
@@ -95,6 +91,8 @@ async def _encode_and_store(
     project_id: str | None,
 ) -> dict[str, Any]:
     """Encode content into neural graph and store typed memory metadata."""
+    from neural_memory.engine.encoder import MemoryEncoder
+
     encoder = MemoryEncoder(storage, brain_config)
     storage.disable_auto_save()
 
@@ -277,6 +275,8 @@ def todo(
                 }
             project_id = proj.id
 
+        from neural_memory.engine.encoder import MemoryEncoder
+
         encoder = MemoryEncoder(storage, brain.config)
         storage.disable_auto_save()
 
@@ -378,6 +378,10 @@ def recall(
         if not brain:
             return {"error": "No brain configured"}
 
+        from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline
+        from neural_memory.extraction.parser import QueryParser
+        from neural_memory.extraction.router import QueryRouter
+
         parser = QueryParser()
         router = QueryRouter()
         stimulus = parser.parse(query, reference_time=utcnow())
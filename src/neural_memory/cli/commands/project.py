@@ -317,7 +317,7 @@ def project_delete(
         nmem project delete "Temp" --force
     """
 
-    async def _delete() -> dict[str, Any]:
+    async def _delete() -> dict[str, Any] | None:
         config = get_config()
         storage = await get_storage(config)
 
@@ -328,6 +328,15 @@ def project_delete(
         # Count memories
         memories = await storage.get_project_memories(proj.id)
 
+        # Ask inside the same run so the lookup above is not repeated.
+        # Blocking the loop is fine: nothing else is scheduled.
+        if not force:
+            msg = f"Delete project '{name}'?"
+            if memories:
+                msg += f" ({len(memories)} memories will be preserved but unlinked)"
+            if not typer.confirm(msg):
+                return None
+
         deleted = await storage.delete_project(proj.id)
         if deleted:
             await storage.batch_save()
@@ -338,31 +347,10 @@ def project_delete(
         else:
             return {"error": "Failed to delete project."}
 
-    # Confirmation
-    if not force:
-
-        async def _preview() -> int:
-            config = get_config()
-            storage = await get_storage(config)
-            proj = await storage.get_project_by_name(name)
-            if not proj:
-                return -1
-            memories = await storage.get_project_memories(proj.id)
-            return len(memories)
-
-        count = run_async(_preview())
-        if count < 0:
-            typer.secho(f"Project '{name}' not found.", fg=typer.colors.RED)
-            return
-
-        msg = f"Delete project '{name}'?"
-        if count > 0:
-            msg += f" ({count} memories will be preserved but unlinked)"
-        if not typer.confirm(msg):
-            typer.echo("Cancelled.")
-            return
-
     result = run_async(_delete())
+    if result is None:
+        typer.echo("Cancelled.")
+        return
 
     if "error" in result:
         typer.secho(result["error"], fg=typer.colors.RED)
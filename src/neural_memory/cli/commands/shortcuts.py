@@ -267,6 +267,8 @@ def export_brain_cmd(
     """
     from pathlib import Path
 
+    from neural_memory.utils.json_stream import dump_json_streaming
+
     async def _export() -> None:
         config = get_config()
         brain_name = brain or config.current_brain
@@ -288,7 +290,8 @@ def export_brain_cmd(
         }
 
         try:
-            output_path.write_text(json.dumps(export_data, indent=2, default=str))
+            with output_path.open("w", encoding="utf-8") as f:
+                dump_json_streaming(export_data, f, default=str)
         except OSError as exc:
             typer.echo(f"Failed to write export file: {exc}", err=True)
             raise typer.Exit(1) from exc
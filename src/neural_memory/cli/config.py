@@ -55,11 +55,12 @@ def use_unified_config() -> bool:
     if env_dir:
         return True
 
-    unified_dir = Path.home() / ".neuralmemory"
-    return (unified_dir / "config.toml").exists()
+    # Checked on every CLIConfig.use_sqlite access; plain os.path avoids
+    # building Path objects for a single stat.
+    return os.path.exists(os.path.join(os.path.expanduser("~"), ".neuralmemory", "config.toml"))
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedModeConfig:
     """Configuration for shared/remote storage mode."""
 
@@ -120,7 +121,7 @@ def _sync_brain_to_toml(data_dir: Path, brain_name: str) -> None:
         logger.warning("Failed to sync current_brain to config.toml", exc_info=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIConfig:
     """CLI configuration."""
 
@@ -8,10 +8,12 @@ Zero external dependencies — pure SVG/XML generation.
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
-from xml.sax.saxutils import escape
+from typing import TYPE_CHECKING, TextIO
+
+from neural_memory.core.synapse import SynapseType
 
 if TYPE_CHECKING:
     from neural_memory.cli.storage import PersistentStorage
@@ -27,6 +29,7 @@ V_GAP = 50
 PADDING = 40
 MAX_FIBERS = 10
 MAX_NEIGHBORS = 5
+SYNAPSE_CHAR_WIDTH = 7  # Fixed per-character width of synapse type labels (textLength)
 
 # ── Dark theme colors ────────────────────────────────────────────
 
@@ -57,11 +60,75 @@ SYNAPSE_ICONS: dict[str, str] = {
     "contradicts": "\u2716",
 }
 
+# Keyed by enum member: skips the Enum.value property lookup per neighbor
+_ICON_BY_TYPE: dict[SynapseType, str] = {
+    SynapseType(name): icon for name, icon in SYNAPSE_ICONS.items()
+}
+
+# ── XML escaping ─────────────────────────────────────────────────
+
+_XML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _esc(text: str) -> str:
+    """Escape text for SVG element content or attribute values."""
+    return text.translate(_XML_TABLE)
+
+
+# ── Static SVG fragments (built once at import) ──────────────────
+
+_STYLE_DEFS = (
+    "<defs><style>"
+    f".fiber-node {{ fill: {FIBER_FILL}; stroke: {FIBER_STROKE}; stroke-width: 2; rx: 8; }}"
+    f".neuron-node {{ fill: {NEURON_FILL}; stroke: {NEURON_STROKE}; stroke-width: 1; rx: 6; }}"
+    f".text-primary {{ fill: {TEXT_PRIMARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 13px; }}"
+    f".text-secondary {{ fill: {TEXT_SECONDARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 11px; }}"
+    f".text-header {{ fill: {HEADER_COLOR}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 16px; font-weight: bold; }}"
+    f".text-icon {{ fill: {EDGE_STRONG}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 12px; }}"
+    f".legend-bg {{ fill: {LEGEND_BG}; stroke: {NEURON_STROKE}; stroke-width: 1; rx: 6; }}"
+    f".legend-text {{ fill: {TEXT_SECONDARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 10px; }}"
+    "</style></defs>"
+)
+
+_LEGEND_LABELS = (
+    ("\u25cf Fiber (memory)", FIBER_STROKE),
+    ("\u2192 leads_to", TEXT_SECONDARY),
+    ("\u2190 caused_by", TEXT_SECONDARY),
+    ("\u2194 co_occurs", TEXT_SECONDARY),
+    ("~ related_to", TEXT_SECONDARY),
+    ("@ happened_at", TEXT_SECONDARY),
+)
+
+# (x, y offset from legend top, rest of the <text> element); 3 items per row
+_LEGEND_ITEMS: tuple[tuple[int, int, str], ...] = tuple(
+    (
+        PADDING + 10 + (i % 3) * 130,
+        36 + (i // 3) * 18,
+        f'fill="{color}" class="legend-text">{_esc(text)}</text>',
+    )
+    for i, (text, color) in enumerate(_LEGEND_LABELS)
+)
+
+
+# %-format templates for the repeated per-element lines (newline included)
+_LINE_FMT = (
+    '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="%s" stroke-width="1.5" '
+    'stroke-dasharray="4,3" opacity="0.6"/>\n'
+)
+_RECT_FMT = '<rect x="%s" y="%s" width="%s" height="%s" class="%s"/>\n'
+_TEXT_FMT = '<text x="%s" y="%s" class="%s">%s</text>\n'
+_EDGE_TEXT_FMT = (
+    '<text x="%s" y="%s" class="text-icon">%s</text>'
+    '<text x="%s" y="%s" class="text-secondary" '
+    'textLength="%s" lengthAdjust="spacingAndGlyphs">%s</text>'
+    '<text x="%s" y="%s" class="%s">%s</text>\n'
+)
+
 
 # ── Data models ──────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeighborEdge:
     """A neighbor neuron connected via a synapse."""
 
@@ -71,7 +138,7 @@ class NeighborEdge:
     weight: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FiberNode:
     """A fiber with its neighbor edges for visualization."""
 
@@ -79,7 +146,7 @@ class FiberNode:
     neighbors: tuple[NeighborEdge, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionedRect:
     """A positioned rectangle in the SVG canvas."""
 
@@ -92,7 +159,7 @@ class PositionedRect:
     edge_info: NeighborEdge | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionedLine:
     """A positioned line connecting two nodes."""
 
@@ -103,7 +170,7 @@ class PositionedLine:
     color: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayoutResult:
     """Complete layout with positioned nodes and edges."""
 
@@ -214,113 +281,114 @@ def build_svg(
     Returns:
         Complete SVG document as a string.
     """
+    buf = io.StringIO()
+    write_svg(buf, brain_name, fibers, timestamp)
+    return buf.getvalue()
+
+
+def write_svg(
+    out: TextIO,
+    brain_name: str,
+    fibers: list[FiberNode],
+    timestamp: str = "",
+) -> None:
+    """Write an SVG document for the graph data to a text stream.
+
+    Elements are written one line at a time, so a file target never holds
+    the whole document in memory.
+
+    Args:
+        out: Writable text stream (open file or StringIO).
+        brain_name: Name of the brain being visualized.
+        fibers: List of fiber nodes with their neighbors.
+        timestamp: Optional timestamp string for the header.
+    """
     if not fibers:
-        return _build_empty_svg(brain_name)
+        out.write(_build_empty_svg(brain_name))
+        return
 
     layout = layout_tree(brain_name, fibers)
-    parts: list[str] = []
+
+    def emit(element: str) -> None:
+        out.write(element)
+        out.write("\n")
 
     # SVG header
-    parts.append(
+    emit(
         f'<svg xmlns="http://www.w3.org/2000/svg" '
         f'width="{layout.width}" height="{layout.height}" '
         f'viewBox="0 0 {layout.width} {layout.height}">'
     )
 
     # Background
-    parts.append(f'<rect width="100%" height="100%" fill="{BG_COLOR}"/>')
+    emit(f'<rect width="100%" height="100%" fill="{BG_COLOR}"/>')
 
     # Styles
-    parts.append(
-        "<defs><style>"
-        f".fiber-node {{ fill: {FIBER_FILL}; stroke: {FIBER_STROKE}; stroke-width: 2; rx: 8; }}"
-        f".neuron-node {{ fill: {NEURON_FILL}; stroke: {NEURON_STROKE}; stroke-width: 1; rx: 6; }}"
-        f".text-primary {{ fill: {TEXT_PRIMARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 13px; }}"
-        f".text-secondary {{ fill: {TEXT_SECONDARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 11px; }}"
-        f".text-header {{ fill: {HEADER_COLOR}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 16px; font-weight: bold; }}"
-        f".text-icon {{ fill: {EDGE_STRONG}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 12px; }}"
-        f".legend-bg {{ fill: {LEGEND_BG}; stroke: {NEURON_STROKE}; stroke-width: 1; rx: 6; }}"
-        f".legend-text {{ fill: {TEXT_SECONDARY}; font-family: 'Segoe UI', system-ui, sans-serif; font-size: 10px; }}"
-        "</style></defs>"
-    )
+    emit(_STYLE_DEFS)
 
     # Header
-    header_text = f"Neural Graph — {escape(brain_name)}"
+    header_text = f"Neural Graph — {_esc(brain_name)}"
     if timestamp:
-        header_text += f"  ({escape(timestamp)})"
-    parts.append(f'<text x="{PADDING}" y="{PADDING + 5}" class="text-header">{header_text}</text>')
+        header_text += f"  ({_esc(timestamp)})"
+    emit(f'<text x="{PADDING}" y="{PADDING + 5}" class="text-header">{header_text}</text>')
 
     # Edge lines (draw first so nodes appear on top)
-    for line in layout.lines:
-        parts.append(
-            f'<line x1="{line.x1}" y1="{line.y1}" '
-            f'x2="{line.x2}" y2="{line.y2}" '
-            f'stroke="{line.color}" stroke-width="1.5" '
-            f'stroke-dasharray="4,3" opacity="0.6"/>'
-        )
+    out.writelines(
+        _LINE_FMT % (line.x1, line.y1, line.x2, line.y2, line.color) for line in layout.lines
+    )
 
     # Nodes
     for rect in layout.rects:
-        css_class = "fiber-node" if rect.is_fiber else "neuron-node"
-        parts.append(
-            f'<rect x="{rect.x}" y="{rect.y}" '
-            f'width="{rect.width}" height="{rect.height}" '
-            f'class="{css_class}"/>'
-        )
-
-        # Text
-        text_class = "text-primary" if rect.is_fiber else "text-secondary"
-        text_x = rect.x + 10
-        text_y = rect.y + rect.height / 2 + 4
+        x, y, width, height = rect.x, rect.y, rect.width, rect.height
+        text_x = x + 10
+        text_y = y + height / 2 + 4
+        edge = rect.edge_info
+
+        if rect.is_fiber:
+            out.write(_RECT_FMT % (x, y, width, height, "fiber-node"))
+            text_class = "text-primary"
+        else:
+            out.write(_RECT_FMT % (x, y, width, height, "neuron-node"))
+            text_class = "text-secondary"
 
-        if rect.edge_info:
+        if edge:
             # Show icon + type + content
-            icon = escape(rect.edge_info.icon)
-            syn_type = escape(rect.edge_info.synapse_type)
-            label = escape(_truncate(rect.label, 25))
-            parts.append(
-                f'<text x="{text_x}" y="{text_y}" class="text-icon">{icon}</text>'
-                f'<text x="{text_x + 16}" y="{text_y}" class="text-secondary">'
-                f"{syn_type}</text>"
-                f'<text x="{text_x + 16 + len(syn_type) * 6.5 + 6}" y="{text_y}" '
-                f'class="{text_class}">{label}</text>'
+            syn_width = len(edge.synapse_type) * SYNAPSE_CHAR_WIDTH
+            out.write(
+                _EDGE_TEXT_FMT
+                % (
+                    text_x,
+                    text_y,
+                    _esc(edge.icon),
+                    text_x + 16,
+                    text_y,
+                    syn_width,
+                    _esc(edge.synapse_type),
+                    text_x + 16 + syn_width + 6,
+                    text_y,
+                    text_class,
+                    _esc(_truncate(rect.label, 25)),
+                )
             )
         else:
-            label = escape(_truncate(rect.label, 40))
-            parts.append(f'<text x="{text_x}" y="{text_y}" class="{text_class}">{label}</text>')
+            out.write(_TEXT_FMT % (text_x, text_y, text_class, _esc(_truncate(rect.label, 40))))
 
     # Legend
     legend_y = layout.height - 100
-    parts.append(
+    emit(
         f'<rect x="{PADDING}" y="{legend_y}" '
         f'width="{layout.width - 2 * PADDING}" height="80" '
         f'class="legend-bg"/>'
     )
-    parts.append(
+    emit(
         f'<text x="{PADDING + 10}" y="{legend_y + 18}" '
         f'class="text-secondary" font-weight="bold">Legend</text>'
     )
 
-    legend_items = [
-        ("\u25cf Fiber (memory)", FIBER_STROKE),
-        ("\u2192 leads_to", TEXT_SECONDARY),
-        ("\u2190 caused_by", TEXT_SECONDARY),
-        ("\u2194 co_occurs", TEXT_SECONDARY),
-        ("~ related_to", TEXT_SECONDARY),
-        ("@ happened_at", TEXT_SECONDARY),
-    ]
-    legend_x = PADDING + 10
-    for i, (text, color) in enumerate(legend_items):
-        col = i % 3
-        row = i // 3
-        lx = legend_x + col * 130
-        ly = legend_y + 36 + row * 18
-        parts.append(
-            f'<text x="{lx}" y="{ly}" fill="{color}" class="legend-text">{escape(text)}</text>'
-        )
+    for lx, dy, tail in _LEGEND_ITEMS:
+        emit(f'<text x="{lx}" y="{legend_y + dy}" {tail}')
 
-    parts.append("</svg>")
-    return "\n".join(parts)
+    out.write("</svg>")
 
 
 def _build_empty_svg(brain_name: str) -> str:
@@ -333,7 +401,7 @@ def _build_empty_svg(brain_name: str) -> str:
         f'<rect width="100%" height="100%" fill="{BG_COLOR}"/>'
         f'<text x="{width // 2}" y="50" text-anchor="middle" '
         f'fill="{HEADER_COLOR}" font-family="system-ui" font-size="16" '
-        f'font-weight="bold">Neural Graph — {escape(brain_name)}</text>'
+        f'font-weight="bold">Neural Graph — {_esc(brain_name)}</text>'
         f'<text x="{width // 2}" y="90" text-anchor="middle" '
         f'fill="{TEXT_SECONDARY}" font-family="system-ui" font-size="13">'
         f"No memories to visualize</text>"
@@ -377,45 +445,40 @@ async def collect_graph_data(
         if result.confidence < 0.1:
             return brain.name, []
 
-        raw_fibers = []
-        for fiber_id in result.fibers_matched[:MAX_FIBERS]:
-            fiber = await storage.get_fiber(fiber_id)
-            if fiber:
-                raw_fibers.append(fiber)
+        fiber_ids = result.fibers_matched[:MAX_FIBERS]
     else:
-        raw_fibers = await storage.get_fibers(limit=MAX_FIBERS)
+        fiber_ids = [fiber.id for fiber in await storage.get_fibers(limit=MAX_FIBERS)]
 
-    if not raw_fibers:
+    if not fiber_ids:
         return brain.name, []
 
+    # Fibers, anchors and neighbors in one bulk storage call
+    neighborhoods = await storage.get_fiber_neighborhoods(fiber_ids, MAX_NEIGHBORS)
+
     # Build FiberNode list
     fiber_nodes: list[FiberNode] = []
-    for fiber in raw_fibers:
+    for fiber, anchor, raw_neighbors in neighborhoods:
         # Get fiber label
         content = fiber.summary or ""
-        if not content and fiber.anchor_neuron_id:
-            anchor = await storage.get_neuron(fiber.anchor_neuron_id)
-            if anchor:
-                content = anchor.content
+        if not content and anchor:
+            content = anchor.content
         label = content[:50] + "..." if len(content) > 50 else content
 
         # Get neighbors
         neighbors: list[NeighborEdge] = []
-        if fiber.anchor_neuron_id:
-            raw_neighbors = await storage.get_neighbors(fiber.anchor_neuron_id, direction="both")
-            for neighbor, synapse in raw_neighbors[:MAX_NEIGHBORS]:
-                neighbor_content = neighbor.content[:30]
-                if len(neighbor.content) > 30:
-                    neighbor_content += "..."
-                icon = SYNAPSE_ICONS.get(synapse.type.value, "\u2500")
-                neighbors.append(
-                    NeighborEdge(
-                        content=neighbor_content,
-                        synapse_type=synapse.type.value,
-                        icon=icon,
-                        weight=synapse.weight,
-                    )
+        for neighbor, synapse in raw_neighbors:
+            neighbor_content = neighbor.content[:30]
+            if len(neighbor.content) > 30:
+                neighbor_content += "..."
+            syn_type = synapse.type
+            neighbors.append(
+                NeighborEdge(
+                    content=neighbor_content,
+                    synapse_type=syn_type.value,
+                    icon=_ICON_BY_TYPE.get(syn_type, "\u2500"),
+                    weight=synapse.weight,
                 )
+            )
 
         fiber_nodes.append(FiberNode(label=label, neighbors=tuple(neighbors)))
 
@@ -444,12 +507,12 @@ async def export_graph_svg(
     brain_name, fibers = await collect_graph_data(storage, query, depth)
 
     timestamp = utcnow().strftime("%Y-%m-%d %H:%M")
-    svg_content = build_svg(brain_name, fibers, timestamp)
 
     if output_path:
         out = Path(output_path)
     else:
         out = Path(f"neural_graph_{brain_name}.svg")
 
-    out.write_text(svg_content, encoding="utf-8")
+    with out.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        write_svg(f, brain_name, fibers, timestamp)
     return out
@@ -2,15 +2,104 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+import importlib
+import os
+import sys
+from typing import Annotated, Any
 
 import typer
+from typer.core import TyperGroup
+
+# Sub-app name -> (module, Typer attribute)
+_SUBAPPS: dict[str, tuple[str, str]] = {
+    "brain": ("neural_memory.cli.commands.brain", "brain_app"),
+    "config": ("neural_memory.cli.commands.config_cmd", "config_app"),
+    "project": ("neural_memory.cli.commands.project", "project_app"),
+    "shared": ("neural_memory.cli.commands.shared", "shared_app"),
+    "habits": ("neural_memory.cli.commands.habits", "habits_app"),
+    "version": ("neural_memory.cli.commands.version", "version_app"),
+}
+
+# Top-level command name -> module whose register() adds it. info also
+# defines "version", which the version sub-app shadows; it stays listed
+# here so help keeps showing "version" in that position.
+_COMMAND_MODULES: dict[str, str] = {
+    **dict.fromkeys(["remember", "todo", "recall", "context"], "memory"),
+    **dict.fromkeys(["list", "cleanup"], "listing"),
+    **dict.fromkeys(["stats", "check", "status", "health", "version"], "info"),
+    **dict.fromkeys(
+        [
+            "mcp",
+            "dashboard",
+            "ui",
+            "graph",
+            "init",
+            "serve",
+            "decay",
+            "consolidate",
+            "hooks",
+            "flush",
+            "install-skills",
+        ],
+        "tools",
+    ),
+    **dict.fromkeys(
+        ["q", "a", "last", "today", "mcp-config", "prompt", "export", "import"], "shortcuts"
+    ),
+    "index": "codebase",
+    "train": "train",
+    "update": "update",
+    "migrate": "migrate",
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Root group that imports command modules on first use.
+
+    Running a command imports only the module that defines it, so
+    ``nmem recall`` does not pay for brain, project or tools imports.
+    Listing commands (``--help``, shell completion) loads them all.
+    """
+
+    # Click types are left as Any: newer typer vendors click as typer._click
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            self._load(cmd_name)
+            command = super().get_command(ctx, cmd_name)
+        return command
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        names = list(dict.fromkeys([*_COMMAND_MODULES, *_SUBAPPS]))
+        for name in names:
+            self.get_command(ctx, name)
+        return [name for name in names if name in self.commands]
+
+    def _load(self, cmd_name: str) -> None:
+        if cmd_name in _SUBAPPS:
+            module_name, attr = _SUBAPPS[cmd_name]
+            group = typer.main.get_group(getattr(importlib.import_module(module_name), attr))
+            group.name = cmd_name
+            self.add_command(group, cmd_name)
+            return
+
+        if cmd_name not in _COMMAND_MODULES:
+            return
+        module = importlib.import_module(f"neural_memory.cli.commands.{_COMMAND_MODULES[cmd_name]}")
+        commands_app = typer.Typer()
+        module.register(commands_app)
+        # Add every command the module defines; sub-app names take precedence
+        for name, command in typer.main.get_group(commands_app).commands.items():
+            if name not in _SUBAPPS and name not in self.commands:
+                self.add_command(command, name)
+
 
 # Main app
 app = typer.Typer(
     name="nmem",
     help="Neural Memory - Reflex-based memory for AI agents",
     no_args_is_help=True,
+    cls=_LazyGroup,
 )
 
 
@@ -23,6 +112,17 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+# Built once here; the string annotation below is re-evaluated whenever
+# Typer introspects the callback.
+_VERSION_OPTION = typer.Option(
+    "--version",
+    "-V",
+    help="Show version and exit.",
+    callback=_version_callback,
+    is_eager=True,
+)
+
+
 def _warn_if_not_initialized(ctx: typer.Context) -> None:
     """Print a one-line hint if NeuralMemory has never been initialized.
 
@@ -30,10 +130,12 @@ def _warn_if_not_initialized(ctx: typer.Context) -> None:
     """
     if ctx.invoked_subcommand == "init":
         return
-    from neural_memory.unified_config import get_neuralmemory_dir
-
-    config_path = get_neuralmemory_dir() / "config.toml"
-    if not config_path.exists():
+    # Same lookup as unified_config.get_neuralmemory_dir(), done with os.path
+    # so commands that never read the config don't pay for importing it.
+    data_dir = os.environ.get("NEURALMEMORY_DIR") or os.path.join(
+        os.path.expanduser("~"), ".neuralmemory"
+    )
+    if not os.path.exists(os.path.join(data_dir, "config.toml")):
         typer.secho(
             "Tip: NeuralMemory not set up yet. Run 'nmem init' to get started.",
             fg=typer.colors.YELLOW,
@@ -41,23 +143,29 @@ def _warn_if_not_initialized(ctx: typer.Context) -> None:
         )
 
 
+def _json_output_requested() -> bool:
+    """Whether the command line asks for ``--json`` output.
+
+    Checked from ``sys.argv`` because the group callback runs before the
+    subcommand's options are parsed. Every command spells it ``--json``/``-j``.
+    """
+    args = sys.argv[1:]
+    if "--" in args:
+        args = args[: args.index("--")]
+    return "--json" in args or "-j" in args
+
+
 @app.callback(invoke_without_command=True)
 def _app_callback(
     ctx: typer.Context,
-    version: Annotated[
-        bool,
-        typer.Option(
-            "--version",
-            "-V",
-            help="Show version and exit.",
-            callback=_version_callback,
-            is_eager=True,
-        ),
-    ] = False,
+    version: Annotated[bool, _VERSION_OPTION] = False,
 ) -> None:
     """Global callback: runs before every command."""
     if ctx.invoked_subcommand is None:
         return
+    # JSON output is read by programs, which may merge stderr into it
+    if _json_output_requested():
+        return
 
     _warn_if_not_initialized(ctx)
 
@@ -66,45 +174,6 @@ def _app_callback(
     run_update_check_background()
 
 
-# Register sub-apps (brain, project, shared)
-from neural_memory.cli.commands.brain import brain_app  # noqa: E402
-from neural_memory.cli.commands.config_cmd import config_app  # noqa: E402
-from neural_memory.cli.commands.habits import habits_app  # noqa: E402
-from neural_memory.cli.commands.project import project_app  # noqa: E402
-from neural_memory.cli.commands.shared import shared_app  # noqa: E402
-from neural_memory.cli.commands.version import version_app  # noqa: E402
-
-app.add_typer(brain_app, name="brain")
-app.add_typer(config_app, name="config")
-app.add_typer(project_app, name="project")
-app.add_typer(shared_app, name="shared")
-app.add_typer(habits_app, name="habits")
-app.add_typer(version_app, name="version")
-
-# Register top-level commands
-from neural_memory.cli.commands import (  # noqa: E402
-    codebase,
-    info,
-    listing,
-    memory,
-    migrate,
-    shortcuts,
-    tools,
-    train,
-    update,
-)
-
-memory.register(app)
-listing.register(app)
-info.register(app)
-tools.register(app)
-shortcuts.register(app)
-codebase.register(app)
-train.register(app)
-update.register(app)
-migrate.register(app)
-
-
 def main() -> None:
     """Main entry point."""
     app()
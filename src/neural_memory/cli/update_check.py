@@ -4,6 +4,9 @@ Checks PyPI for newer versions of neural-memory, cached for 24 hours.
 Runs in background thread to avoid slowing down CLI commands.
 
 Cache location: ~/.neuralmemory/.update_check
+
+Skipped when stderr is not a terminal, when ``CI`` is set, or when
+``NEURALMEMORY_NO_UPDATE_CHECK`` is set.
 """
 
 from __future__ import annotations
@@ -11,6 +14,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import sys
 import threading
 import time
 from pathlib import Path
@@ -92,26 +96,25 @@ def _fetch_latest_version() -> str | None:
         return None
 
 
+def _update_check_enabled() -> bool:
+    """Whether an update notice from this process could reach a person."""
+    if os.environ.get("NEURALMEMORY_NO_UPDATE_CHECK") or os.environ.get("CI"):
+        return False
+    return sys.stderr is not None and sys.stderr.isatty()
+
+
+def _notify_from_cache(cache: dict[str, Any], current: str) -> None:
+    """Show the cached update notice, if any and not dismissed."""
+    cached_version = cache.get("latest_version")
+    if cached_version and _is_newer(cached_version, current) and not cache.get("dismissed"):
+        _print_update_notice(current, cached_version)
+
+
 def _check_and_notify() -> None:
     """Background worker: check PyPI and print update notice if needed."""
     try:
         from neural_memory import __version__
 
-        cache = _read_cache()
-        last_check = cache.get("last_check", 0)
-
-        # Throttle: skip if checked recently
-        if time.time() - last_check < CHECK_INTERVAL_SECONDS:
-            # Still show cached notification if not dismissed
-            cached_version = cache.get("latest_version")
-            if (
-                cached_version
-                and _is_newer(cached_version, __version__)
-                and not cache.get("dismissed")
-            ):
-                _print_update_notice(__version__, cached_version)
-            return
-
         latest = _fetch_latest_version()
         if not latest:
             return
@@ -132,8 +135,6 @@ def _check_and_notify() -> None:
 
 def _print_update_notice(current: str, latest: str) -> None:
     """Print a styled update notice to stderr (doesn't pollute stdout)."""
-    import sys
-
     notice = (
         f"\n  Update available: neural-memory {current} → {latest}\n"
         f"  Run: pip install -U neural-memory\n"
@@ -143,6 +144,24 @@ def _print_update_notice(current: str, latest: str) -> None:
 
 
 def run_update_check_background() -> None:
-    """Launch update check in a daemon thread. Non-blocking, fire-and-forget."""
+    """Check for updates without blocking the command.
+
+    Within the check interval the cached result is used directly; only a
+    due PyPI fetch runs, in a fire-and-forget daemon thread.
+    """
+    if not _update_check_enabled():
+        return
+
+    cache = _read_cache()
+    try:
+        # Throttle: skip if checked recently
+        if time.time() - cache.get("last_check", 0) < CHECK_INTERVAL_SECONDS:
+            from neural_memory import __version__
+
+            _notify_from_cache(cache, __version__)
+            return
+    except (AttributeError, TypeError, ValueError):
+        logger.debug("Ignoring malformed update cache", exc_info=True)
+
     thread = threading.Thread(target=_check_and_notify, daemon=True)
     thread.start()
@@ -0,0 +1,244 @@
+"""Long-lived NeuralMemory daemon serving hook requests over a Unix socket.
+
+Claude Code hooks run as a fresh process per event, so each one pays for
+interpreter start-up, package imports and storage initialisation. The daemon
+keeps all of that warm. Hooks connect to its socket, send one JSON request
+line and read one JSON reply line:
+
+    -> {"op": "precompact_flush", "transcript_path": "/path/to/transcript.jsonl"}
+    <- {"ok": true, "saved": 1, "items": [{"type": "decision", "content": "..."}], ...}
+
+Hooks fall back to running inline when no daemon is listening.
+
+Usage:
+    nmem-daemon
+    nmem-daemon --socket /tmp/nmem.sock
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+import sys
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "nmem.sock"
+# Largest request line accepted from a client
+MAX_REQUEST_BYTES = 64 * 1024
+# Transcript text shorter than this is not worth analysing
+MIN_FLUSH_CHARS = 50
+
+RequestHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+def default_socket_path() -> Path:
+    """Get the daemon socket path.
+
+    Priority:
+    1. $XDG_RUNTIME_DIR/nmem.sock
+    2. <NeuralMemory data dir>/nmem.sock
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+
+    from neural_memory.unified_config import get_neuralmemory_dir
+
+    return get_neuralmemory_dir() / SOCKET_NAME
+
+
+async def _precompact_flush(request: dict[str, Any]) -> dict[str, Any]:
+    """Flush memories from a transcript tail into the current brain."""
+    from neural_memory.hooks.pre_compact import flush_text_to_storage, read_transcript_since
+    from neural_memory.hooks.transcript_offsets import (
+        load_transcript_offset,
+        save_transcript_offset,
+    )
+    from neural_memory.unified_config import get_config, get_shared_storage
+
+    transcript_path = request.get("transcript_path", "")
+    if not isinstance(transcript_path, str) or not transcript_path:
+        return {"saved": 0, "memories": [], "items": [], "message": "No transcript path"}
+
+    def read_new_text() -> tuple[str, int]:
+        return read_transcript_since(transcript_path, load_transcript_offset(transcript_path))
+
+    text, end_offset = await asyncio.to_thread(read_new_text)
+    if len(text.strip()) < MIN_FLUSH_CHARS:
+        return {
+            "saved": 0,
+            "memories": [],
+            "items": [],
+            "message": "No substantial content to flush",
+        }
+
+    config = get_config()
+    # Cached per brain, so storage stays open between requests
+    storage = await get_shared_storage(config.current_brain)
+    result = await flush_text_to_storage(storage, config, text)
+    if "error" not in result:
+        await asyncio.to_thread(save_transcript_offset, transcript_path, end_offset)
+    return result
+
+
+HANDLERS: dict[str, RequestHandler] = {
+    "precompact_flush": _precompact_flush,
+}
+
+
+async def _handle_request(line: bytes, lock: asyncio.Lock) -> dict[str, Any]:
+    """Decode one request line and dispatch it to its handler."""
+    try:
+        request = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {"ok": False, "error": "Invalid JSON request"}
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "Request must be a JSON object"}
+
+    op = request.get("op")
+    handler = HANDLERS.get(op) if isinstance(op, str) else None
+    if handler is None:
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    # Requests share one storage; encoding is not safe to interleave
+    async with lock:
+        try:
+            result = await handler(request)
+        except Exception:
+            logger.error("Daemon op %s failed", op, exc_info=True)
+            return {"ok": False, "error": f"{op} failed"}
+    return {"ok": True, **result}
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, lock: asyncio.Lock
+) -> None:
+    """Answer a single request on a client connection, then close it."""
+    try:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            reply: dict[str, Any] = {"ok": False, "error": "Request too large"}
+        else:
+            if not line.strip():
+                return  # Liveness probe, e.g. from _claim_socket_path
+            reply = await _handle_request(line, lock)
+        writer.write(json.dumps(reply).encode() + b"\n")
+        await writer.drain()
+    except (ConnectionError, OSError):
+        logger.debug("Client disconnected before reply", exc_info=True)
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError, OSError):
+            await writer.wait_closed()
+
+
+def _claim_socket_path(path: Path) -> None:
+    """Remove a stale socket file, refusing if another daemon is listening.
+
+    Anything at ``path`` that is not a socket is left alone and refused.
+    """
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{path} exists and is not a socket")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()  # Left behind by a daemon that did not shut down cleanly
+    else:
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+async def serve(path: Path) -> None:
+    """Listen on ``path`` and serve requests until SIGTERM or cancellation."""
+    _claim_socket_path(path)
+    lock = asyncio.Lock()
+    stop = asyncio.Event()
+
+    async def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await _serve_connection(reader, writer, lock)
+
+    # Only the owning user may submit requests: bound under a private umask,
+    # the socket is never open to others, not even briefly
+    old_umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(
+            on_connect, path=str(path), limit=MAX_REQUEST_BYTES
+        )
+    finally:
+        os.umask(old_umask)
+    logger.info("NeuralMemory daemon listening on %s", path)
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(NotImplementedError):
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+        from neural_memory.unified_config import close_shared_storage
+
+        await close_shared_storage()
+
+
+def main() -> None:
+    """Entry point for the ``nmem-daemon`` command."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="NeuralMemory daemon — keep storage warm for hook clients"
+    )
+    parser.add_argument(
+        "--socket",
+        "-s",
+        type=Path,
+        help=f"Unix socket path (default: $XDG_RUNTIME_DIR/{SOCKET_NAME})",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging",
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, stream=sys.stderr)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("[NeuralMemory] Daemon requires Unix domain sockets", file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+
+    from neural_memory.utils.event_loop import run
+
+    path = args.socket or default_socket_path()
+    try:
+        run(serve(path))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as exc:
+        print(f"[NeuralMemory] {exc}", file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,23 @@
 """Engine components for memory encoding and retrieval."""
 
-from neural_memory.engine.activation import (
-    ActivationResult,
-    SpreadingActivation,
-)
-from neural_memory.engine.encoder import EncodingResult, MemoryEncoder, build_default_pipeline
-from neural_memory.engine.pipeline import Pipeline, PipelineContext, PipelineStep
-from neural_memory.engine.reflex_activation import (
-    CoActivation,
-    ReflexActivation,
-)
-from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline, RetrievalResult
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.engine.activation import (
+        ActivationResult,
+        SpreadingActivation,
+    )
+    from neural_memory.engine.encoder import EncodingResult, MemoryEncoder, build_default_pipeline
+    from neural_memory.engine.pipeline import Pipeline, PipelineContext, PipelineStep
+    from neural_memory.engine.reflex_activation import (
+        CoActivation,
+        ReflexActivation,
+    )
+    from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline, RetrievalResult
 
 __all__ = [
     "ActivationResult",
@@ -27,3 +34,25 @@ __all__ = [
     "SpreadingActivation",
     "build_default_pipeline",
 ]
+
+
+# Imported on first access, so storage modules that need one engine helper
+# (e.g. depth priors) don't load the encoder and the extraction stack.
+_LAZY_IMPORTS: dict[str, str] = {
+    "ActivationResult": "neural_memory.engine.activation",
+    "SpreadingActivation": "neural_memory.engine.activation",
+    "EncodingResult": "neural_memory.engine.encoder",
+    "MemoryEncoder": "neural_memory.engine.encoder",
+    "build_default_pipeline": "neural_memory.engine.encoder",
+    "Pipeline": "neural_memory.engine.pipeline",
+    "PipelineContext": "neural_memory.engine.pipeline",
+    "PipelineStep": "neural_memory.engine.pipeline",
+    "CoActivation": "neural_memory.engine.reflex_activation",
+    "ReflexActivation": "neural_memory.engine.reflex_activation",
+    "DepthLevel": "neural_memory.engine.retrieval",
+    "ReflexPipeline": "neural_memory.engine.retrieval",
+    "RetrievalResult": "neural_memory.engine.retrieval",
+}
+
+
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
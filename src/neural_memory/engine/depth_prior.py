@@ -14,10 +14,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from neural_memory.engine.retrieval_types import DepthLevel
-from neural_memory.extraction.parser import Stimulus
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
+    from neural_memory.extraction.parser import Stimulus
     from neural_memory.storage.base import NeuralStorage
 
 logger = logging.getLogger(__name__)
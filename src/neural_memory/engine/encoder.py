@@ -227,3 +227,58 @@ class MemoryEncoder:
             synapses_created=ctx.synapses_created,
             conflicts_detected=ctx.conflicts_detected,
         )
+
+    async def encode_batch(
+        self,
+        contents: list[str],
+        timestamp: datetime | None = None,
+        metadata: dict[str, Any] | None = None,
+        tags: set[str] | None = None,
+        language: str = "auto",
+        *,
+        skip_conflicts: bool = False,
+        skip_time_neurons: bool = False,
+    ) -> list[EncodingResult]:
+        """
+        Encode several contents that share timestamp, metadata and tags.
+
+        Items are encoded in order, so later items de-duplicate against
+        neurons created by earlier ones, but auto-save is disabled for the
+        whole batch and pending writes are flushed with a single
+        ``batch_save()`` instead of once per item.
+
+        Args:
+            contents: The text contents to encode
+            timestamp: When these memories occurred (default: now)
+            metadata: Additional metadata attached to every fiber
+            tags: Tags for every fiber
+            language: Language hint ("vi", "en", or "auto")
+            skip_conflicts: Skip conflict detection.
+            skip_time_neurons: Skip TIME neuron creation.
+
+        Returns:
+            One EncodingResult per content, in input order
+        """
+        if timestamp is None:
+            timestamp = utcnow()
+
+        results: list[EncodingResult] = []
+        self._storage.disable_auto_save()
+        try:
+            for content in contents:
+                results.append(
+                    await self.encode(
+                        content,
+                        timestamp=timestamp,
+                        metadata=metadata,
+                        # The pipeline mutates tags, so each item gets its own set
+                        tags=set(tags) if tags else None,
+                        language=language,
+                        skip_conflicts=skip_conflicts,
+                        skip_time_neurons=skip_time_neurons,
+                    )
+                )
+            await self._storage.batch_save()
+        finally:
+            self._storage.enable_auto_save()
+        return results
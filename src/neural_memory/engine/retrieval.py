@@ -141,6 +141,10 @@ class ReflexPipeline:
         """
         Execute the retrieval pipeline.
 
+        Not safe to run concurrently on one instance: Hebbian and
+        conductivity updates are queued on the pipeline and flushed at
+        the end of each query. Use one pipeline per concurrent query.
+
         Args:
             query: The query text
             depth: Retrieval depth (auto-detect if None)
@@ -13,6 +13,8 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import pairwise
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from neural_memory.core.fiber import Fiber
@@ -117,28 +119,28 @@ def mine_sequential_pairs(
     for event in events:
         sessions[event.session_id].append(event)
 
-    # Count pairs
-    pair_gaps: dict[tuple[str, str], list[float]] = defaultdict(list)
+    # Count pairs. Gaps stay timedeltas (compared and summed without
+    # per-pair float conversion); only the per-pair average is converted.
+    window = timedelta(seconds=window_seconds)
+    pair_gaps: dict[tuple[str, str], list[timedelta]] = defaultdict(list)
 
     for session_events in sessions.values():
-        sorted_events = sorted(session_events, key=lambda e: e.created_at)
-        for i in range(len(sorted_events) - 1):
-            a = sorted_events[i]
-            b = sorted_events[i + 1]
-            gap = (b.created_at - a.created_at).total_seconds()
-            if gap <= window_seconds:
-                pair_gaps[(a.action_type, b.action_type)].append(gap)
-
-    results: list[SequencePair] = []
-    for (action_a, action_b), gaps in pair_gaps.items():
-        results.append(
-            SequencePair(
-                action_a=action_a,
-                action_b=action_b,
-                count=len(gaps),
-                avg_gap_seconds=sum(gaps) / len(gaps) if gaps else 0.0,
-            )
+        # Storage returns events oldest first, so this is a linear timsort pass
+        session_events.sort(key=attrgetter("created_at"))
+        for a, b in pairwise(session_events):
+            gap = b.created_at - a.created_at
+            if gap <= window:
+                pair_gaps[a.action_type, b.action_type].append(gap)
+
+    results = [
+        SequencePair(
+            action_a=action_a,
+            action_b=action_b,
+            count=len(gaps),
+            avg_gap_seconds=sum(gaps, timedelta()).total_seconds() / len(gaps),
         )
+        for (action_a, action_b), gaps in pair_gaps.items()
+    ]
 
     results.sort(key=lambda p: p.count, reverse=True)
     return results
@@ -1,29 +1,36 @@
 """Extraction modules for parsing queries and content."""
 
-from neural_memory.extraction.entities import Entity, EntityExtractor
-from neural_memory.extraction.parser import (
-    Perspective,
-    QueryIntent,
-    QueryParser,
-    Stimulus,
-)
-from neural_memory.extraction.relations import (
-    RelationCandidate,
-    RelationExtractor,
-    RelationType,
-)
-from neural_memory.extraction.router import (
-    QueryRouter,
-    QueryType,
-    RouteConfidence,
-    RouteDecision,
-    route_query,
-)
-from neural_memory.extraction.temporal import (
-    TemporalExtractor,
-    TimeGranularity,
-    TimeHint,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.extraction.entities import Entity, EntityExtractor
+    from neural_memory.extraction.parser import (
+        Perspective,
+        QueryIntent,
+        QueryParser,
+        Stimulus,
+    )
+    from neural_memory.extraction.relations import (
+        RelationCandidate,
+        RelationExtractor,
+        RelationType,
+    )
+    from neural_memory.extraction.router import (
+        QueryRouter,
+        QueryType,
+        RouteConfidence,
+        RouteDecision,
+        route_query,
+    )
+    from neural_memory.extraction.temporal import (
+        TemporalExtractor,
+        TimeGranularity,
+        TimeHint,
+    )
 
 __all__ = [
     # Temporal
@@ -49,3 +56,29 @@ __all__ = [
     "RelationExtractor",
     "RelationType",
 ]
+
+
+# Imported on first access, so importing one extractor doesn't build the
+# others.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Entity": "neural_memory.extraction.entities",
+    "EntityExtractor": "neural_memory.extraction.entities",
+    "Perspective": "neural_memory.extraction.parser",
+    "QueryIntent": "neural_memory.extraction.parser",
+    "QueryParser": "neural_memory.extraction.parser",
+    "Stimulus": "neural_memory.extraction.parser",
+    "RelationCandidate": "neural_memory.extraction.relations",
+    "RelationExtractor": "neural_memory.extraction.relations",
+    "RelationType": "neural_memory.extraction.relations",
+    "QueryRouter": "neural_memory.extraction.router",
+    "QueryType": "neural_memory.extraction.router",
+    "RouteConfidence": "neural_memory.extraction.router",
+    "RouteDecision": "neural_memory.extraction.router",
+    "route_query": "neural_memory.extraction.router",
+    "TemporalExtractor": "neural_memory.extraction.temporal",
+    "TimeGranularity": "neural_memory.extraction.temporal",
+    "TimeHint": "neural_memory.extraction.temporal",
+}
+
+
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
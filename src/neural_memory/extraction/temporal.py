@@ -293,18 +293,14 @@ class TemporalExtractor:
 
     def __init__(self) -> None:
         """Initialize the extractor."""
-        # Compile regex patterns and cache resolver arity
-        self._vi_compiled = [
-            (re.compile(p, re.IGNORECASE), r, len(inspect.signature(r).parameters))
-            for p, r in self.VI_PATTERNS.items()
-        ]
-        self._en_compiled = [
-            (re.compile(p, re.IGNORECASE), r, len(inspect.signature(r).parameters))
-            for p, r in self.EN_PATTERNS.items()
-        ]
-        self._vi_numbered = [
-            (re.compile(p, re.IGNORECASE), r, g) for p, r, g in self.VI_NUMBERED_PATTERNS
-        ]
+        # Compiled patterns and resolver arity are shared by every instance
+        # of a class, since inspect.signature() dominates construction cost
+        (
+            self._vi_compiled,
+            self._en_compiled,
+            self._vi_numbered,
+        ) = _compile_patterns(type(self))
+        self._all_compiled = self._vi_compiled + self._en_compiled
 
     def extract(
         self,
@@ -331,14 +327,14 @@ class TemporalExtractor:
         # Determine which patterns to use
         if language == "auto":
             # Use both
-            patterns = self._vi_compiled + self._en_compiled
+            patterns = self._all_compiled
             numbered_patterns = self._vi_numbered
         elif language == "vi":
             patterns = self._vi_compiled
             numbered_patterns = self._vi_numbered
         else:  # en
             patterns = self._en_compiled
-            numbered_patterns = []
+            numbered_patterns = ()
 
         # Try each pattern
         for pattern, resolver, arity in patterns:
@@ -438,3 +434,33 @@ def _infer_granularity(start: datetime, end: datetime) -> TimeGranularity:
         return TimeGranularity.MONTH
     else:
         return TimeGranularity.YEAR
+
+
+_CompiledPatterns = tuple[
+    tuple[tuple[re.Pattern[str], TimeResolver, int], ...],
+    tuple[tuple[re.Pattern[str], TimeResolver, int], ...],
+    tuple[tuple[re.Pattern[str], TimeResolver, TimeGranularity], ...],
+]
+
+# Compiled pattern tables per extractor class
+_COMPILED_PATTERNS: dict[type[TemporalExtractor], _CompiledPatterns] = {}
+
+
+def _compile_patterns(extractor_cls: type[TemporalExtractor]) -> _CompiledPatterns:
+    """Compile an extractor class's regex tables and cache resolver arity."""
+    compiled = _COMPILED_PATTERNS.get(extractor_cls)
+    if compiled is None:
+        vi_compiled = tuple(
+            (re.compile(p, re.IGNORECASE), r, len(inspect.signature(r).parameters))
+            for p, r in extractor_cls.VI_PATTERNS.items()
+        )
+        en_compiled = tuple(
+            (re.compile(p, re.IGNORECASE), r, len(inspect.signature(r).parameters))
+            for p, r in extractor_cls.EN_PATTERNS.items()
+        )
+        vi_numbered = tuple(
+            (re.compile(p, re.IGNORECASE), r, g) for p, r, g in extractor_cls.VI_NUMBERED_PATTERNS
+        )
+        compiled = (vi_compiled, en_compiled, vi_numbered)
+        _COMPILED_PATTERNS[extractor_cls] = compiled
+    return compiled
@@ -21,7 +21,14 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from neural_memory.hooks.transcript_offsets import load_transcript_offset, save_transcript_offset
+
+if TYPE_CHECKING:
+    from neural_memory.core.memory_types import TypedMemory
+    from neural_memory.storage.base import NeuralStorage
+    from neural_memory.unified_config import UnifiedConfig
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,8 @@ MAX_FLUSH_CHARS = 100_000
 EMERGENCY_THRESHOLD = 0.5
 # Priority boost for emergency-captured memories
 PRIORITY_BOOST = 2
+# Characters of each saved memory returned for a hook's summary
+SUMMARY_CHARS = 80
 
 
 def read_hook_input() -> dict[str, Any]:
@@ -59,25 +68,53 @@ def read_transcript_tail(transcript_path: str, max_lines: int = MAX_TRANSCRIPT_L
     if not path.exists() or not path.is_file():
         return ""
 
-    lines: list[str] = []
     try:
         with open(path, encoding="utf-8", errors="replace") as f:
             all_lines = f.readlines()
-        tail = all_lines[-max_lines:]
-
-        for raw_line in tail:
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
-            try:
-                entry = json.loads(raw_line)
-                text = _extract_text(entry)
-                if text and len(text) > 20:  # Skip trivial entries
-                    lines.append(text)
-            except json.JSONDecodeError:
-                continue
     except OSError:
         return ""
+    return _join_transcript_lines(all_lines[-max_lines:])
+
+
+def read_transcript_since(
+    transcript_path: str, start: int = 0, max_lines: int = MAX_TRANSCRIPT_LINES
+) -> tuple[str, int]:
+    """Read text from the complete transcript lines after byte ``start``.
+
+    Like read_transcript_tail, but skips what an earlier flush already
+    scanned (see load_transcript_offset). A final line without its newline
+    may still be being written, so it is left for the next read.
+
+    Returns:
+        Tuple of (text, offset just past the last complete line).
+    """
+    path = Path(transcript_path)
+    try:
+        with path.open("rb") as f:
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return "", start
+
+    complete = data.rfind(b"\n") + 1
+    lines = data[:complete].decode("utf-8", errors="replace").splitlines()
+    return _join_transcript_lines(lines[-max_lines:]), start + complete
+
+
+def _join_transcript_lines(raw_lines: list[str]) -> str:
+    """Extract and join the text of JSONL transcript lines."""
+    lines: list[str] = []
+    for raw_line in raw_lines:
+        raw_line = raw_line.strip()
+        if not raw_line:
+            continue
+        try:
+            entry = json.loads(raw_line)
+            text = _extract_text(entry)
+            if text and len(text) > 20:  # Skip trivial entries
+                lines.append(text)
+        except json.JSONDecodeError:
+            continue
 
     joined = "\n\n".join(lines)
     # Truncate to max flush size
@@ -119,103 +156,158 @@ async def flush_text(text: str) -> dict[str, Any]:
     Uses the same auto-capture pipeline as the MCP server's flush action,
     but runs standalone without the MCP server.
     """
-    from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
-    from neural_memory.engine.encoder import MemoryEncoder
-    from neural_memory.mcp.auto_capture import analyze_text_for_memories
-    from neural_memory.safety.sensitive import auto_redact_content
     from neural_memory.unified_config import get_config, get_shared_storage
-    from neural_memory.utils.timeutils import utcnow
 
     config = get_config()
     storage = await get_shared_storage(config.current_brain)
 
     try:
-        # Detect ALL memory types with emergency settings
-        detected = analyze_text_for_memories(
-            text,
-            capture_decisions=True,
-            capture_errors=True,
-            capture_todos=True,
-            capture_facts=True,
-            capture_insights=True,
-            capture_preferences=True,
-        )
-
-        if not detected:
-            return {"saved": 0, "message": "No memorable content detected"}
-
-        # Emergency threshold: more aggressive than normal
-        eligible = [item for item in detected if item["confidence"] >= EMERGENCY_THRESHOLD]
-        if not eligible:
-            return {"saved": 0, "message": "No memories met emergency threshold"}
-
-        # Boost priority for emergency-captured memories
-        boosted = [
-            {**item, "priority": min(item.get("priority", 5) + PRIORITY_BOOST, 10)}
-            for item in eligible
-        ]
+        return await flush_text_to_storage(storage, config, text)
+    finally:
+        await storage.close()
 
-        # Get brain for encoder
-        brain = await storage.get_brain(config.current_brain)
-        if not brain:
-            return {"error": "No brain configured", "saved": 0}
 
-        encoder = MemoryEncoder(storage, brain.config)
-        storage.disable_auto_save()
+async def flush_text_to_storage(
+    storage: NeuralStorage, config: UnifiedConfig, text: str
+) -> dict[str, Any]:
+    """Detect and save memorable content from text into an open storage.
 
-        auto_redact_severity = config.safety.auto_redact_min_severity
-        saved: list[str] = []
+    The caller owns ``storage``: it is left open, so a long-lived process
+    (see ``neural_memory.daemon``) can reuse it across flushes.
+    """
+    from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
+    from neural_memory.engine.encoder import MemoryEncoder
+    from neural_memory.mcp.auto_capture import analyze_text_for_memories
+    from neural_memory.safety.sensitive import auto_redact_batch
+    from neural_memory.utils.timeutils import utcnow
 
-        for item in boosted:
-            try:
-                # Auto-redact sensitive content
-                content = item["content"]
-                redacted_content, matches, _ = auto_redact_content(
-                    content, min_severity=auto_redact_severity
-                )
-                if matches:
-                    logger.debug("Auto-redacted %d matches in flush memory", len(matches))
+    # Detect ALL memory types with emergency settings
+    detected = analyze_text_for_memories(
+        text,
+        capture_decisions=True,
+        capture_errors=True,
+        capture_todos=True,
+        capture_facts=True,
+        capture_insights=True,
+        capture_preferences=True,
+    )
+
+    if not detected:
+        return {"saved": 0, "message": "No memorable content detected"}
+
+    # Emergency threshold: more aggressive than normal
+    eligible = [item for item in detected if item["confidence"] >= EMERGENCY_THRESHOLD]
+    if not eligible:
+        return {"saved": 0, "message": "No memories met emergency threshold"}
 
+    # Boost priority for emergency-captured memories
+    boosted = [
+        {**item, "priority": min(item.get("priority", 5) + PRIORITY_BOOST, 10)} for item in eligible
+    ]
+
+    # Get brain for encoder
+    brain = await storage.get_brain(config.current_brain)
+    if not brain:
+        return {"error": "No brain configured", "saved": 0}
+
+    encoder = MemoryEncoder(storage, brain.config)
+    redacted_all = auto_redact_batch(
+        [item["content"] for item in boosted],
+        min_severity=config.safety.auto_redact_min_severity,
+    )
+    now = utcnow()
+    typed_memories: list[TypedMemory] = []
+    # (detected type, redacted content) of each encoded memory
+    captured: list[tuple[str, str]] = []
+
+    storage.disable_auto_save()
+    try:
+        for index, (item, (redacted_content, matches, _)) in enumerate(
+            zip(boosted, redacted_all, strict=True)
+        ):
+            if matches:
+                logger.debug("Auto-redacted %d matches in flush memory", len(matches))
+
+            try:
                 # Encode into neural graph
                 result = await encoder.encode(
                     content=redacted_content,
-                    timestamp=utcnow(),
+                    timestamp=now,
                     tags={"emergency_flush", "pre_compact"},
                 )
+            except Exception:
+                logger.debug("Failed to save flush memory %d", index, exc_info=True)
+                continue
 
-                # Create typed memory metadata
-                mem_type_str = item.get("type", "fact")
-                try:
-                    mem_type = MemoryType(mem_type_str)
-                except ValueError:
-                    mem_type = MemoryType.FACT
+            # Create typed memory metadata
+            mem_type_str = item.get("type", "fact")
+            try:
+                mem_type = MemoryType(mem_type_str)
+            except ValueError:
+                mem_type = MemoryType.FACT
 
-                typed_mem = TypedMemory.create(
+            typed_memories.append(
+                TypedMemory.create(
                     fiber_id=result.fiber.id,
                     memory_type=mem_type,
                     priority=Priority.from_int(item.get("priority", 5)),
                     source="pre_compact_hook",
                     tags={"emergency_flush", "pre_compact"},
                 )
-                await storage.add_typed_memory(typed_mem)
-                saved.append(redacted_content[:60])
-            except Exception:
-                logger.debug("Failed to save flush memory", exc_info=True)
-                continue
+            )
+            captured.append((mem_type_str, redacted_content))
 
+        stored = await save_typed_memories(storage, typed_memories)
+        saved = [
+            entry
+            for typed_mem, entry in zip(typed_memories, captured, strict=True)
+            if typed_mem.fiber_id in stored
+        ]
         await storage.batch_save()
-
-        return {
-            "saved": len(saved),
-            "memories": saved,
-            "mode": "emergency_flush",
-            "threshold": EMERGENCY_THRESHOLD,
-            "message": f"Emergency flush: captured {len(saved)} memories"
-            if saved
-            else "No memories saved",
-        }
     finally:
-        await storage.close()
+        # Storage may outlive this flush (daemon), so restore auto-save
+        storage.enable_auto_save()
+
+    return {
+        "saved": len(saved),
+        "memories": [content[:60] for _, content in saved],
+        # Type and a longer excerpt, for hooks summarising what was captured
+        "items": [
+            {"type": mem_type, "content": content[:SUMMARY_CHARS]} for mem_type, content in saved
+        ],
+        "mode": "emergency_flush",
+        "threshold": EMERGENCY_THRESHOLD,
+        "message": f"Emergency flush: captured {len(saved)} memories"
+        if saved
+        else "No memories saved",
+    }
+
+
+async def save_typed_memories(
+    storage: NeuralStorage, typed_memories: list[TypedMemory]
+) -> set[str]:
+    """Store typed-memory rows, in one batch when possible.
+
+    If the batch insert fails, the rows are added one at a time so a single
+    bad row only loses itself. Returns the fiber IDs whose rows were stored.
+    """
+    try:
+        # Typed-memory rows for every encoded fiber in one insert and commit
+        await storage.add_typed_memories_batch(typed_memories)
+    except Exception:
+        logger.debug("Batch typed-memory insert failed, adding one at a time", exc_info=True)
+    else:
+        return {typed_mem.fiber_id for typed_mem in typed_memories}
+
+    stored: set[str] = set()
+    for typed_mem in typed_memories:
+        try:
+            await storage.add_typed_memory(typed_mem)
+        except Exception:
+            logger.debug("Failed to save flush memory %s", typed_mem.fiber_id, exc_info=True)
+            continue
+        stored.add(typed_mem.fiber_id)
+    return stored
 
 
 def main() -> None:
@@ -248,6 +340,9 @@ def main() -> None:
         logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
 
     text = ""
+    # Set when only the part of a hook's transcript not yet flushed is read
+    transcript_path = ""
+    end_offset = 0
 
     if args.text:
         # Direct text input
@@ -260,7 +355,9 @@ def main() -> None:
         hook_input = read_hook_input()
         transcript_path = hook_input.get("transcript_path", "")
         if transcript_path:
-            text = read_transcript_tail(transcript_path)
+            text, end_offset = read_transcript_since(
+                transcript_path, load_transcript_offset(transcript_path)
+            )
         else:
             # No transcript path — nothing to flush
             sys.exit(0)
@@ -272,6 +369,8 @@ def main() -> None:
 
     try:
         result = asyncio.run(flush_text(text))
+        if transcript_path and "error" not in result:
+            save_transcript_offset(transcript_path, end_offset)
         saved = result.get("saved", 0)
         if saved > 0:
             print(  # noqa: T201
@@ -111,6 +111,7 @@ async def capture_text(text: str) -> dict[str, Any]:
     """
     from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
     from neural_memory.engine.encoder import MemoryEncoder
+    from neural_memory.hooks.pre_compact import save_typed_memories
     from neural_memory.mcp.auto_capture import analyze_text_for_memories
     from neural_memory.safety.sensitive import auto_redact_content
     from neural_memory.unified_config import get_config, get_shared_storage
@@ -147,7 +148,8 @@ async def capture_text(text: str) -> dict[str, Any]:
         storage.disable_auto_save()
 
         auto_redact_severity = config.safety.auto_redact_min_severity
-        saved: list[str] = []
+        typed_memories: list[TypedMemory] = []
+        contents: list[str] = []
 
         for item in eligible:
             try:
@@ -163,26 +165,33 @@ async def capture_text(text: str) -> dict[str, Any]:
                     timestamp=utcnow(),
                     tags={"stop_hook", "session_end"},
                 )
+            except Exception:
+                logger.debug("Failed to save stop-hook memory", exc_info=True)
+                continue
 
-                mem_type_str = item.get("type", "fact")
-                try:
-                    mem_type = MemoryType(mem_type_str)
-                except ValueError:
-                    mem_type = MemoryType.FACT
+            mem_type_str = item.get("type", "fact")
+            try:
+                mem_type = MemoryType(mem_type_str)
+            except ValueError:
+                mem_type = MemoryType.FACT
 
-                typed_mem = TypedMemory.create(
+            typed_memories.append(
+                TypedMemory.create(
                     fiber_id=result.fiber.id,
                     memory_type=mem_type,
                     priority=Priority.from_int(item.get("priority", 5)),
                     source="stop_hook",
                     tags={"stop_hook", "session_end"},
                 )
-                await storage.add_typed_memory(typed_mem)
-                saved.append(redacted_content[:60])
-            except Exception:
-                logger.debug("Failed to save stop-hook memory", exc_info=True)
-                continue
-
+            )
+            contents.append(redacted_content[:60])
+
+        stored = await save_typed_memories(storage, typed_memories)
+        saved = [
+            content
+            for typed_mem, content in zip(typed_memories, contents, strict=True)
+            if typed_mem.fiber_id in stored
+        ]
         await storage.batch_save()
 
         return {
@@ -0,0 +1,91 @@
+"""Where each transcript was last flushed by the PreCompact hook.
+
+Kept apart from ``pre_compact`` so hook scripts can check for new
+transcript content with only the standard library loaded (no asyncio).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# Bytes before a saved transcript offset hashed to detect a rewritten file
+OFFSET_GUARD_BYTES = 4096
+# Transcripts remembered in the offsets file; the oldest are dropped first
+MAX_TRACKED_TRANSCRIPTS = 64
+
+
+def _get_offsets_path() -> Path:
+    """Get path to the file recording where each transcript was last flushed."""
+    data_dir = os.environ.get("NEURALMEMORY_DIR") or str(Path.home() / ".neuralmemory")
+    return Path(data_dir) / ".precompact_offsets"
+
+
+def _read_offsets() -> dict[str, Any]:
+    """Read saved transcript offsets."""
+    try:
+        offsets_path = _get_offsets_path()
+        if not offsets_path.exists():
+            return {}
+        result: dict[str, Any] = json.loads(offsets_path.read_text(encoding="utf-8"))
+        return result if isinstance(result, dict) else {}
+    except (OSError, ValueError):
+        logger.debug("Failed to read precompact offsets", exc_info=True)
+        return {}
+
+
+def _guard_hash(f: BinaryIO, offset: int) -> str:
+    """Hash the bytes just before ``offset``."""
+    guard_start = max(0, offset - OFFSET_GUARD_BYTES)
+    f.seek(guard_start)
+    return hashlib.sha256(f.read(offset - guard_start)).hexdigest()
+
+
+def load_transcript_offset(transcript_path: str) -> int:
+    """Get the byte offset where the last flush of a transcript stopped.
+
+    Consecutive PreCompact events see mostly the same transcript tail, so
+    only what was appended since the last flush needs scanning. Returns 0
+    (scan from the start) when the transcript was never flushed, or when it
+    shrank or its bytes before the offset changed, i.e. it was rewritten.
+    """
+    saved = _read_offsets().get(str(Path(transcript_path).resolve()))
+    if not isinstance(saved, dict):
+        return 0
+    offset = saved.get("offset")
+    if not isinstance(offset, int) or offset <= 0:
+        return 0
+
+    try:
+        with open(transcript_path, "rb") as f:
+            if f.seek(0, os.SEEK_END) < offset or _guard_hash(f, offset) != saved.get("hash"):
+                return 0
+    except OSError:
+        return 0
+    return offset
+
+
+def save_transcript_offset(transcript_path: str, offset: int) -> None:
+    """Record that a transcript has been flushed up to byte ``offset``."""
+    try:
+        with open(transcript_path, "rb") as f:
+            guard = _guard_hash(f, offset)
+
+        key = str(Path(transcript_path).resolve())
+        offsets = _read_offsets()
+        offsets.pop(key, None)  # Re-insert as the most recent entry
+        offsets[key] = {"offset": offset, "hash": guard}
+        for stale in list(offsets)[:-MAX_TRACKED_TRANSCRIPTS]:
+            del offsets[stale]
+
+        offsets_path = _get_offsets_path()
+        offsets_path.parent.mkdir(parents=True, exist_ok=True)
+        offsets_path.write_text(json.dumps(offsets), encoding="utf-8")
+    except OSError:
+        logger.debug("Failed to save precompact offset", exc_info=True)
@@ -4,17 +4,24 @@ Import memories from competing systems (ChromaDB, Mem0, Graphiti, etc.)
 into NeuralMemory's neuron/synapse/fiber graph.
 """
 
-from neural_memory.integration.adapter import SourceAdapter
-from neural_memory.integration.mapper import MappingResult, RecordMapper
-from neural_memory.integration.models import (
-    ExternalRecord,
-    ExternalRelationship,
-    ImportResult,
-    SourceCapability,
-    SourceSystemType,
-    SyncState,
-)
-from neural_memory.integration.sync_engine import SyncEngine
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.integration.adapter import SourceAdapter
+    from neural_memory.integration.mapper import MappingResult, RecordMapper
+    from neural_memory.integration.models import (
+        ExternalRecord,
+        ExternalRelationship,
+        ImportResult,
+        SourceCapability,
+        SourceSystemType,
+        SyncState,
+    )
+    from neural_memory.integration.sync_engine import SyncEngine
 
 __all__ = [
     "ExternalRecord",
@@ -28,3 +35,22 @@ __all__ = [
     "SyncEngine",
     "SyncState",
 ]
+
+
+# Imported on first access: storage only needs the record models, not the
+# mapper and its encoder.
+_LAZY_IMPORTS: dict[str, str] = {
+    "SourceAdapter": "neural_memory.integration.adapter",
+    "MappingResult": "neural_memory.integration.mapper",
+    "RecordMapper": "neural_memory.integration.mapper",
+    "ExternalRecord": "neural_memory.integration.models",
+    "ExternalRelationship": "neural_memory.integration.models",
+    "ImportResult": "neural_memory.integration.models",
+    "SourceCapability": "neural_memory.integration.models",
+    "SourceSystemType": "neural_memory.integration.models",
+    "SyncState": "neural_memory.integration.models",
+    "SyncEngine": "neural_memory.integration.sync_engine",
+}
+
+
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
@@ -392,4 +392,6 @@ async def run_mcp_server() -> None:
 
 def main() -> None:
     """Entry point for the MCP server."""
-    asyncio.run(run_mcp_server())
+    from neural_memory.utils.event_loop import run
+
+    run(run_mcp_server())
@@ -10,7 +10,6 @@ from the MCPServer base class.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -1183,9 +1182,7 @@ class ToolHandler:
             }
 
         elif action == "list":
-            # TODO: filter by metadata in query instead of fetching all fibers
-            fibers = await storage.get_fibers(limit=1000)
-            habits = [f for f in fibers if f.metadata.get("_habit_pattern")]
+            habits = [h async for h in storage.iter_habit_fibers()]
             return {
                 "habits": [
                     {
@@ -1201,11 +1198,8 @@ class ToolHandler:
             }
 
         elif action == "clear":
-            fibers = await storage.get_fibers(limit=1000)
-            habits = [f for f in fibers if f.metadata.get("_habit_pattern")]
-            if habits:
-                await asyncio.gather(*[storage.delete_fiber(h.id) for h in habits])
-            cleared = len(habits)
+            habit_ids = [h.id async for h in storage.iter_habit_fibers()]
+            cleared = await storage.delete_fibers(habit_ids)
             return {"cleared": cleared, "message": f"Cleared {cleared} learned habits"}
 
         return {"error": f"Unknown action: {action}"}
@@ -10,6 +10,7 @@ Detects potentially sensitive information like:
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 from dataclasses import dataclass
@@ -20,6 +21,11 @@ logger = logging.getLogger(__name__)
 # Maximum content length for sensitive detection (prevent ReDoS on huge input)
 _MAX_CONTENT_LENGTH = 100_000
 
+# Joins texts for auto_redact_batch. No default pattern matches across it:
+# the newlines stop the [^\s] runs and the NUL stops the \s runs.
+_BATCH_SEPARATOR_CHAR = "\x00"
+_BATCH_SEPARATOR = f"\n{_BATCH_SEPARATOR_CHAR}\n"
+
 
 class SensitiveType(StrEnum):
     """Types of sensitive content."""
@@ -232,6 +238,11 @@ def check_sensitive_content(
             logger.warning("Invalid regex pattern '%s': %s", pattern.name, e)
             continue
 
+    return _merge_matches(matches, content)
+
+
+def _merge_matches(matches: list[SensitiveMatch], content: str) -> list[SensitiveMatch]:
+    """Drop duplicate spans and merge overlapping ones, highest severity first."""
     # Remove duplicates (same position)
     seen_positions: set[tuple[int, int]] = set()
     unique_matches: list[SensitiveMatch] = []
@@ -321,9 +332,100 @@ def auto_redact_content(
         Tuple of (redacted_content, redacted_matches, original_content_hash).
         If no matches found, returns (content, [], None).
     """
-    import hashlib
-
     all_matches = check_sensitive_content(content, patterns, min_severity=1)
+    return _redact_matches(content, all_matches, min_severity, replacement)
+
+
+def auto_redact_batch(
+    contents: list[str],
+    min_severity: int = 3,
+    patterns: list[SensitivePattern] | None = None,
+    replacement: str = "[REDACTED]",
+) -> list[tuple[str, list[SensitiveMatch], str | None]]:
+    """Auto-redact a batch of texts, as auto_redact_content does for one.
+
+    With the default patterns, the texts are joined with a separator those
+    patterns cannot match across, and each pattern scans the joined text
+    once instead of once per item. Matches are mapped back to their item by
+    offset. An item containing the separator, or touched by a match that
+    does cross it, is redacted on its own. Custom patterns may use anchors
+    or lookarounds that behave differently on joined text, so they are
+    always applied per item.
+
+    Args:
+        contents: Texts to check and redact
+        min_severity: Minimum severity level to auto-redact (1-3)
+        patterns: Patterns to use (default: get_default_patterns())
+        replacement: Replacement text for redacted matches
+
+    Returns:
+        One (redacted_content, redacted_matches, original_content_hash)
+        tuple per input text, in order.
+    """
+    if patterns is not None:
+        return [
+            auto_redact_content(content, min_severity, patterns, replacement)
+            for content in contents
+        ]
+    patterns = get_default_patterns()
+
+    capped = [content[:_MAX_CONTENT_LENGTH] for content in contents]
+    batched = [i for i, text in enumerate(capped) if _BATCH_SEPARATOR_CHAR not in text]
+    starts: list[int] = []
+    offset = 0
+    for i in batched:
+        starts.append(offset)
+        offset += len(capped[i]) + len(_BATCH_SEPARATOR)
+    corpus = _BATCH_SEPARATOR.join(capped[i] for i in batched)
+
+    found: list[list[SensitiveMatch]] = [[] for _ in batched]
+    crossed: set[int] = set()
+    for pattern in patterns:
+        try:
+            regex = _get_compiled(pattern.pattern)
+        except re.error as e:
+            logger.warning("Invalid regex pattern '%s': %s", pattern.name, e)
+            continue
+        for match in regex.finditer(corpus):
+            slot = bisect.bisect_right(starts, match.start()) - 1
+            start = match.start() - starts[slot]
+            end = match.end() - starts[slot]
+            if end > len(capped[batched[slot]]):
+                last = bisect.bisect_right(starts, match.end()) - 1
+                crossed.update(range(slot, last + 1))
+                continue
+            found[slot].append(
+                SensitiveMatch(
+                    pattern_name=pattern.name,
+                    matched_text=match.group(0),
+                    type=pattern.type,
+                    severity=pattern.severity,
+                    start=start,
+                    end=end,
+                )
+            )
+
+    results: list[tuple[str, list[SensitiveMatch], str | None] | None] = [None] * len(contents)
+    for slot, i in enumerate(batched):
+        if slot not in crossed:
+            all_matches = _merge_matches(found[slot], capped[i])
+            results[i] = _redact_matches(contents[i], all_matches, min_severity, replacement)
+    return [
+        result
+        if result is not None
+        else auto_redact_content(contents[i], min_severity, patterns, replacement)
+        for i, result in enumerate(results)
+    ]
+
+
+def _redact_matches(
+    content: str,
+    all_matches: list[SensitiveMatch],
+    min_severity: int,
+    replacement: str,
+) -> tuple[str, list[SensitiveMatch], str | None]:
+    """Redact the matches at or above min_severity from content."""
+    import hashlib
 
     if not all_matches:
         return content, [], None
@@ -1,11 +1,18 @@
 """Storage backends for NeuralMemory."""
 
-from neural_memory.storage.base import NeuralStorage
-from neural_memory.storage.factory import HybridStorage, create_storage
-from neural_memory.storage.memory_store import InMemoryStorage
-from neural_memory.storage.shared_store import SharedStorage
-from neural_memory.storage.shared_store_collections import SharedStorageError
-from neural_memory.storage.sqlite_store import SQLiteStorage
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.storage.base import NeuralStorage
+    from neural_memory.storage.factory import HybridStorage, create_storage
+    from neural_memory.storage.memory_store import InMemoryStorage
+    from neural_memory.storage.shared_store import SharedStorage
+    from neural_memory.storage.shared_store_collections import SharedStorageError
+    from neural_memory.storage.sqlite_store import SQLiteStorage
 
 __all__ = [
     "HybridStorage",
@@ -18,10 +25,19 @@ __all__ = [
 ]
 
 
-# Lazy import FalkorDB to avoid requiring falkordb package for SQLite users
-def __getattr__(name: str):  # type: ignore[no-untyped-def]
-    if name == "FalkorDBStorage":
-        from neural_memory.storage.falkordb.falkordb_store import FalkorDBStorage
+# Imported on first access, so opening one backend doesn't load the others
+# (networkx for the in-memory store, aiohttp for the shared one). FalkorDB
+# also stays optional for SQLite users this way.
+_LAZY_IMPORTS: dict[str, str] = {
+    "NeuralStorage": "neural_memory.storage.base",
+    "FalkorDBStorage": "neural_memory.storage.falkordb.falkordb_store",
+    "HybridStorage": "neural_memory.storage.factory",
+    "create_storage": "neural_memory.storage.factory",
+    "InMemoryStorage": "neural_memory.storage.memory_store",
+    "SharedStorage": "neural_memory.storage.shared_store",
+    "SharedStorageError": "neural_memory.storage.shared_store_collections",
+    "SQLiteStorage": "neural_memory.storage.sqlite_store",
+}
+
 
-        return FalkorDBStorage
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from neural_memory.core.alert import Alert
     from neural_memory.core.brain import Brain, BrainSnapshot
     from neural_memory.core.fiber import Fiber
@@ -75,6 +78,23 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def add_neurons_batch(self, neurons: list[Neuron]) -> list[str]:
+        """Add multiple neurons in a single operation.
+
+        Default implementation falls back to sequential add_neuron.
+        Backends should override for batch efficiency.
+
+        Args:
+            neurons: The neurons to add
+
+        Returns:
+            The neuron IDs, in input order
+
+        Raises:
+            ValueError: If a neuron with the same ID already exists
+        """
+        return [await self.add_neuron(neuron) for neuron in neurons]
+
     async def get_neurons_batch(self, neuron_ids: list[str]) -> dict[str, Neuron]:
         """Get multiple neurons by ID in a single operation.
 
@@ -321,6 +341,23 @@ class NeuralStorage(ABC):
         """
         raise NotImplementedError
 
+    async def add_synapses_batch(self, synapses: list[Synapse]) -> list[str]:
+        """Add multiple synapses in a single operation.
+
+        Default implementation falls back to sequential add_synapse.
+        Backends should override for batch efficiency.
+
+        Args:
+            synapses: The synapses to add
+
+        Returns:
+            The synapse IDs, in input order
+
+        Raises:
+            ValueError: If a synapse with the same ID exists, or neurons don't exist
+        """
+        return [await self.add_synapse(synapse) for synapse in synapses]
+
     async def get_synapses_for_neurons(
         self,
         neuron_ids: list[str],
@@ -474,6 +511,24 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def delete_fibers(self, fiber_ids: list[str]) -> int:
+        """Delete several fibers.
+
+        Default implementation falls back to sequential delete_fiber.
+        Backends should override for batch efficiency.
+
+        Args:
+            fiber_ids: Fiber IDs to delete
+
+        Returns:
+            Number of fibers deleted
+        """
+        deleted = 0
+        for fiber_id in fiber_ids:
+            if await self.delete_fiber(fiber_id):
+                deleted += 1
+        return deleted
+
     async def find_fibers_batch(
         self,
         neuron_ids: list[str],
@@ -520,6 +575,92 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def get_habit_fibers(self, limit: int = 1000) -> list[Fiber]:
+        """Get learned workflow habit fibers (``_habit_pattern`` metadata).
+
+        Default implementation filters the most recent fibers in Python.
+        Backends should override to push the filter into the query.
+
+        Args:
+            limit: Maximum results
+
+        Returns:
+            Habit fibers, newest first
+        """
+        fibers = await self.get_fibers(limit=1000)
+        return [f for f in fibers if f.metadata.get("_habit_pattern")][:limit]
+
+    async def get_habit_by_name(self, name: str) -> Fiber | None:
+        """Get the newest learned habit fiber whose summary is ``name``.
+
+        Default implementation scans ``iter_habit_fibers``. Backends should
+        override to look the name up in the query.
+
+        Args:
+            name: Habit name (fiber summary)
+
+        Returns:
+            The habit fiber, or None if no habit has that name
+        """
+        async for fiber in self.iter_habit_fibers():
+            if fiber.summary == name:
+                return fiber
+        return None
+
+    async def iter_habit_fibers(self, batch: int = 200) -> AsyncIterator[Fiber]:
+        """Stream all learned workflow habit fibers, newest first.
+
+        Unlike ``get_habit_fibers`` there is no result cap; backends fetch
+        ``batch`` fibers per query. Default implementation yields the
+        result of ``get_habit_fibers``. Backends should override to page
+        through the query.
+
+        Args:
+            batch: Fibers fetched per page
+
+        Yields:
+            Habit fibers, newest first
+        """
+        for fiber in await self.get_habit_fibers():
+            yield fiber
+
+    async def get_fiber_neighborhoods(
+        self,
+        fiber_ids: list[str],
+        max_neighbors: int = 5,
+    ) -> list[tuple[Fiber, Neuron | None, list[tuple[Neuron, Synapse]]]]:
+        """Get fibers with their anchor neuron and the anchor's neighbors.
+
+        Default implementation issues concurrent get_fiber, get_neuron and
+        get_neighbors calls. Backends should override to fetch in bulk.
+        Neighbors are the ``max_neighbors`` strongest by synapse weight.
+
+        Args:
+            fiber_ids: Fiber IDs (missing fibers are skipped)
+            max_neighbors: Maximum neighbors per anchor
+
+        Returns:
+            (fiber, anchor, neighbors) tuples in fiber_ids order
+        """
+        fetched = await asyncio.gather(*(self.get_fiber(fid) for fid in dict.fromkeys(fiber_ids)))
+        fibers = [f for f in fetched if f is not None]
+        anchored = [f for f in fibers if f.anchor_neuron_id]
+        anchors, neighbor_lists = await asyncio.gather(
+            asyncio.gather(*(self.get_neuron(f.anchor_neuron_id) for f in anchored)),
+            asyncio.gather(
+                *(self.get_neighbors(f.anchor_neuron_id, direction="both") for f in anchored)
+            ),
+        )
+        # Strongest neighbors first, as the bulk backends return them
+        by_fiber = {
+            fiber.id: (
+                anchor,
+                sorted(neighbors, key=lambda p: p[1].weight, reverse=True)[:max_neighbors],
+            )
+            for fiber, anchor, neighbors in zip(anchored, anchors, neighbor_lists, strict=True)
+        }
+        return [(fiber, *by_fiber.get(fiber.id, (None, []))) for fiber in fibers]
+
     # ========== Lifecycle ==========
 
     async def close(self) -> None:  # noqa: B027
@@ -647,6 +788,23 @@ class NeuralStorage(ABC):
         """
         raise NotImplementedError
 
+    async def add_typed_memories_batch(self, typed_memories: list[TypedMemory]) -> list[str]:
+        """Add multiple typed memories in a single operation.
+
+        Default implementation falls back to sequential add_typed_memory.
+        Backends should override for batch efficiency.
+
+        Args:
+            typed_memories: The typed memories to add
+
+        Returns:
+            The fiber IDs, in input order
+
+        Raises:
+            ValueError: If a typed memory's fiber does not exist
+        """
+        return [await self.add_typed_memory(tm) for tm in typed_memories]
+
     async def get_typed_memory(self, fiber_id: str) -> TypedMemory | None:
         """Get a typed memory by its fiber ID.
 
@@ -893,6 +1051,10 @@ class NeuralStorage(ABC):
     ) -> list[Any]:
         """Get action events ordered by time.
 
+        Backends should filter ``since`` in the query rather than in
+        Python, and return events oldest first so the per-session sort
+        in sequence mining stays a linear pass.
+
         Args:
             session_id: Filter by session
             since: Only events after this time
@@ -900,6 +1062,7 @@ class NeuralStorage(ABC):
 
         Returns:
             List of ActionEvent objects ordered by created_at
+            (oldest first)
         """
         raise NotImplementedError
 
@@ -282,9 +282,32 @@ class HybridStorage:
                 logger.debug("Remote sync failed for delete_fiber: %s", e)
         return result
 
+    async def delete_fibers(self, fiber_ids: list[str]) -> int:
+        result = await self._local.delete_fibers(fiber_ids)
+        if self._auto_sync:
+            try:
+                await self._ensure_connected()
+                await self._remote.delete_fibers(fiber_ids)
+            except (ConnectionError, OSError) as e:
+                logger.debug("Remote sync failed for delete_fibers: %s", e)
+        return result
+
     async def get_fibers(self, **kwargs: Any) -> Any:
         return await self._local.get_fibers(**kwargs)
 
+    async def get_habit_fibers(self, limit: int = 1000) -> Any:
+        return await self._local.get_habit_fibers(limit=limit)
+
+    async def get_habit_by_name(self, name: str) -> Any:
+        return await self._local.get_habit_by_name(name)
+
+    async def iter_habit_fibers(self, batch: int = 200) -> Any:
+        async for fiber in self._local.iter_habit_fibers(batch=batch):
+            yield fiber
+
+    async def get_fiber_neighborhoods(self, fiber_ids: list[str], max_neighbors: int = 5) -> Any:
+        return await self._local.get_fiber_neighborhoods(fiber_ids, max_neighbors)
+
     async def save_brain(self, brain: Brain) -> None:
         await self._local.save_brain(brain)
 
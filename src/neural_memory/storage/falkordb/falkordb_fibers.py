@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from neural_memory.core.fiber import Fiber
 from neural_memory.storage.falkordb.falkordb_base import FalkorDBBaseMixin
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 
 class FalkorDBFiberMixin(FalkorDBBaseMixin):
     """FalkorDB implementation of fiber CRUD operations.
@@ -266,6 +269,20 @@ class FalkorDBFiberMixin(FalkorDBBaseMixin):
         )
         return True
 
+    async def delete_fibers(self, fiber_ids: list[str]) -> int:
+        if not fiber_ids:
+            return 0
+        rows = await self._query(
+            """
+            UNWIND $ids AS fid
+            MATCH (f:Fiber {id: fid})
+            DETACH DELETE f
+            RETURN count(*)
+            """,
+            {"ids": list(fiber_ids)},
+        )
+        return int(rows[0][0]) if rows else 0
+
     async def get_fibers(
         self,
         limit: int = 10,
@@ -292,6 +309,76 @@ class FalkorDBFiberMixin(FalkorDBBaseMixin):
         )
         return [self._row_to_fiber(r) for r in rows]
 
+    async def get_habit_fibers(self, limit: int = 1000) -> list[Fiber]:
+        limit = min(limit, 1000)
+        # Metadata is a JSON string here; match the key as _serialize_metadata writes it,
+        # then confirm on the decoded dict.
+        rows = await self._query_ro(
+            """
+            MATCH (f:Fiber)
+            WHERE f.metadata CONTAINS $needle
+            RETURN f.id, f.anchor_neuron_id, f.pathway, f.conductivity,
+                   f.last_conducted, f.time_start, f.time_end,
+                   f.coherence, f.salience, f.frequency, f.summary,
+                   f.auto_tags, f.agent_tags, f.metadata,
+                   f.compression_tier, f.created_at,
+                   f.neuron_ids, f.synapse_ids
+            ORDER BY f.created_at DESC
+            LIMIT $limit
+            """,
+            {"needle": '"_habit_pattern": true', "limit": limit},
+        )
+        fibers = [self._row_to_fiber(r) for r in rows]
+        return [f for f in fibers if f.metadata.get("_habit_pattern")]
+
+    async def get_habit_by_name(self, name: str) -> Fiber | None:
+        rows = await self._query_ro(
+            """
+            MATCH (f:Fiber)
+            WHERE f.summary = $name AND f.metadata CONTAINS $needle
+            RETURN f.id, f.anchor_neuron_id, f.pathway, f.conductivity,
+                   f.last_conducted, f.time_start, f.time_end,
+                   f.coherence, f.salience, f.frequency, f.summary,
+                   f.auto_tags, f.agent_tags, f.metadata,
+                   f.compression_tier, f.created_at,
+                   f.neuron_ids, f.synapse_ids
+            ORDER BY f.created_at DESC
+            """,
+            {"name": name, "needle": '"_habit_pattern": true'},
+        )
+        for row in rows:
+            fiber = self._row_to_fiber(row)
+            if fiber.metadata.get("_habit_pattern"):
+                return fiber
+        return None
+
+    async def iter_habit_fibers(self, batch: int = 200) -> AsyncIterator[Fiber]:
+        batch = max(1, min(batch, 1000))
+        skip = 0
+        while True:
+            rows = await self._query_ro(
+                """
+                MATCH (f:Fiber)
+                WHERE f.metadata CONTAINS $needle
+                RETURN f.id, f.anchor_neuron_id, f.pathway, f.conductivity,
+                       f.last_conducted, f.time_start, f.time_end,
+                       f.coherence, f.salience, f.frequency, f.summary,
+                       f.auto_tags, f.agent_tags, f.metadata,
+                       f.compression_tier, f.created_at,
+                       f.neuron_ids, f.synapse_ids
+                ORDER BY f.created_at DESC, f.id DESC
+                SKIP $skip LIMIT $limit
+                """,
+                {"needle": '"_habit_pattern": true', "skip": skip, "limit": batch},
+            )
+            for row in rows:
+                fiber = self._row_to_fiber(row)
+                if fiber.metadata.get("_habit_pattern"):
+                    yield fiber
+            if len(rows) < batch:
+                return
+            skip += batch
+
     # ========== Row Mapper ==========
 
     def _row_to_fiber(self, row: list[Any]) -> Fiber:
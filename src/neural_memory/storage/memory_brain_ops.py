@@ -43,6 +43,12 @@ class InMemoryBrainMixin:
     async def add_synapse(self, synapse: Synapse) -> str:
         raise NotImplementedError
 
+    async def add_neurons_batch(self, neurons: list[Neuron]) -> list[str]:
+        raise NotImplementedError
+
+    async def add_synapses_batch(self, synapses: list[Synapse]) -> list[str]:
+        raise NotImplementedError
+
     async def add_fiber(self, fiber: Fiber) -> str:
         raise NotImplementedError
 
@@ -181,19 +187,22 @@ class InMemoryBrainMixin:
         return brain_id
 
     async def _import_neurons(self, brain_id: str, neurons_data: list[dict[str, Any]]) -> None:
-        for n_data in neurons_data:
-            neuron = Neuron(
+        neurons = [
+            Neuron(
                 id=n_data["id"],
                 type=NeuronType(n_data["type"]),
                 content=n_data["content"],
                 metadata=n_data.get("metadata", {}),
                 created_at=datetime.fromisoformat(n_data["created_at"]),
             )
-            await self.add_neuron(neuron)
+            for n_data in neurons_data
+        ]
+        # One graph update for the whole snapshot instead of one per neuron
+        await self.add_neurons_batch(neurons)
 
     async def _import_synapses(self, brain_id: str, synapses_data: list[dict[str, Any]]) -> None:
-        for s_data in synapses_data:
-            synapse = Synapse(
+        synapses = [
+            Synapse(
                 id=s_data["id"],
                 source_id=s_data["source_id"],
                 target_id=s_data["target_id"],
@@ -204,7 +213,9 @@ class InMemoryBrainMixin:
                 reinforced_count=s_data.get("reinforced_count", 0),
                 created_at=datetime.fromisoformat(s_data["created_at"]),
             )
-            await self.add_synapse(synapse)
+            for s_data in synapses_data
+        ]
+        await self.add_synapses_batch(synapses)
 
     async def _import_fibers(self, brain_id: str, fibers_data: list[dict[str, Any]]) -> None:
         for f_data in fibers_data:
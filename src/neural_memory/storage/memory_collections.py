@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from neural_memory.core.fiber import Fiber
 from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
 from neural_memory.core.project import Project
 from neural_memory.utils.timeutils import utcnow
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 
 class InMemoryCollectionsMixin:
     """Mixin providing fiber, typed memory, and project operations."""
@@ -105,6 +108,14 @@ class InMemoryCollectionsMixin:
         del self._fibers[brain_id][fiber_id]
         return True
 
+    async def delete_fibers(self, fiber_ids: list[str]) -> int:
+        fibers = self._fibers[self._get_brain_id()]
+        deleted = 0
+        for fiber_id in fiber_ids:
+            if fibers.pop(fiber_id, None) is not None:
+                deleted += 1
+        return deleted
+
     async def get_fibers(
         self,
         limit: int = 10,
@@ -122,6 +133,28 @@ class InMemoryCollectionsMixin:
         fibers.sort(key=sort_keys[order_by], reverse=descending)
         return fibers[:limit]
 
+    async def get_habit_fibers(self, limit: int = 1000) -> list[Fiber]:
+        brain_id = self._get_brain_id()
+        habits = [f for f in self._fibers[brain_id].values() if f.metadata.get("_habit_pattern")]
+        habits.sort(key=lambda f: f.created_at, reverse=True)
+        return habits[:limit]
+
+    async def get_habit_by_name(self, name: str) -> Fiber | None:
+        brain_id = self._get_brain_id()
+        matches = [
+            f
+            for f in self._fibers[brain_id].values()
+            if f.summary == name and f.metadata.get("_habit_pattern")
+        ]
+        return max(matches, key=lambda f: f.created_at, default=None)
+
+    async def iter_habit_fibers(self, batch: int = 200) -> AsyncIterator[Fiber]:
+        brain_id = self._get_brain_id()
+        habits = [f for f in self._fibers[brain_id].values() if f.metadata.get("_habit_pattern")]
+        habits.sort(key=lambda f: f.created_at, reverse=True)
+        for fiber in habits:
+            yield fiber
+
     # ========== TypedMemory Operations ==========
 
     async def add_typed_memory(self, typed_memory: TypedMemory) -> str:
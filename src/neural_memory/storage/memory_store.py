@@ -83,6 +83,26 @@ class InMemoryStorage(
         brain_id = self._get_brain_id()
         return self._neurons[brain_id].get(neuron_id)
 
+    async def add_neurons_batch(self, neurons: list[Neuron]) -> list[str]:
+        """Add neurons with one graph update; nothing is added if any ID exists."""
+        brain_id = self._get_brain_id()
+        brain_neurons = self._neurons[brain_id]
+
+        seen: set[str] = set()
+        for neuron in neurons:
+            if neuron.id in brain_neurons or neuron.id in seen:
+                raise ValueError(f"Neuron {neuron.id} already exists")
+            seen.add(neuron.id)
+
+        brain_states = self._states[brain_id]
+        for neuron in neurons:
+            brain_neurons[neuron.id] = neuron
+            brain_states[neuron.id] = NeuronState(neuron_id=neuron.id)
+        self._graph.add_nodes_from(
+            (n.id, {"brain_id": brain_id, "type": n.type, "content": n.content}) for n in neurons
+        )
+        return [n.id for n in neurons]
+
     async def get_neurons_batch(self, neuron_ids: list[str]) -> dict[str, Neuron]:
         """Batch fetch neurons from in-memory store."""
         brain_id = self._get_brain_id()
@@ -233,6 +253,36 @@ class InMemoryStorage(
         brain_id = self._get_brain_id()
         return self._synapses[brain_id].get(synapse_id)
 
+    async def add_synapses_batch(self, synapses: list[Synapse]) -> list[str]:
+        """Add synapses with one graph update; nothing is added if any is invalid."""
+        brain_id = self._get_brain_id()
+        brain_synapses = self._synapses[brain_id]
+        brain_neurons = self._neurons[brain_id]
+
+        seen: set[str] = set()
+        for synapse in synapses:
+            if synapse.id in brain_synapses or synapse.id in seen:
+                raise ValueError(f"Synapse {synapse.id} already exists")
+            if synapse.source_id not in brain_neurons:
+                raise ValueError(f"Source neuron {synapse.source_id} does not exist")
+            if synapse.target_id not in brain_neurons:
+                raise ValueError(f"Target neuron {synapse.target_id} does not exist")
+            seen.add(synapse.id)
+
+        # add_edge per synapse: MultiDiGraph.add_edges_from is slower, as it
+        # re-fetches each new edge's attribute dict through graph views
+        add_edge = self._graph.add_edge
+        for synapse in synapses:
+            brain_synapses[synapse.id] = synapse
+            add_edge(
+                synapse.source_id,
+                synapse.target_id,
+                key=synapse.id,
+                type=synapse.type,
+                weight=synapse.weight,
+            )
+        return [s.id for s in synapses]
+
     async def get_synapses(
         self,
         source_id: str | None = None,
@@ -25,6 +25,9 @@ class SQLiteActionLogMixin:
     def _ensure_conn(self) -> aiosqlite.Connection:
         raise NotImplementedError
 
+    def _ensure_read_conn(self) -> aiosqlite.Connection:
+        raise NotImplementedError
+
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
@@ -85,9 +88,10 @@ class SQLiteActionLogMixin:
 
         Returns:
             List of ActionEvent objects ordered by created_at
+            (oldest first)
         """
         limit = min(limit, 1000)
-        conn = self._ensure_conn()
+        conn = self._ensure_read_conn()
         brain_id = self._get_brain_id()
 
         conditions = ["brain_id = ?"]
@@ -97,6 +101,7 @@ class SQLiteActionLogMixin:
             conditions.append("session_id = ?")
             params.append(session_id)
 
+        # Range on idx_action_events_created, so cost follows the window size
         if since is not None:
             conditions.append("created_at >= ?")
             params.append(since.isoformat())
@@ -11,6 +11,8 @@ from neural_memory.core.fiber import Fiber
 from neural_memory.storage.sqlite_row_mappers import row_to_fiber
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     import aiosqlite
 
 
@@ -228,6 +230,28 @@ class SQLiteFiberMixin:
 
         return cursor.rowcount > 0
 
+    async def delete_fibers(self, fiber_ids: list[str]) -> int:
+        """Delete fibers and their junction rows in one transaction."""
+        if not fiber_ids:
+            return 0
+
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        placeholders = ",".join("?" for _ in fiber_ids)
+        params: list[Any] = [brain_id, *fiber_ids]
+        await conn.execute(
+            f"DELETE FROM fiber_neurons WHERE brain_id = ? AND fiber_id IN ({placeholders})",
+            params,
+        )
+        cursor = await conn.execute(
+            f"DELETE FROM fibers WHERE brain_id = ? AND id IN ({placeholders})",
+            params,
+        )
+        await conn.commit()
+
+        return cursor.rowcount
+
     async def get_stale_fiber_count(self, brain_id: str, stale_days: int = 90) -> int:
         conn = self._ensure_read_conn()
         from neural_memory.utils.timeutils import utcnow
@@ -265,3 +289,57 @@ class SQLiteFiberMixin:
         async with conn.execute(query, (brain_id, limit)) as cursor:
             rows = await cursor.fetchall()
             return [row_to_fiber(row) for row in rows]
+
+    async def get_habit_fibers(self, limit: int = 1000) -> list[Fiber]:
+        limit = min(limit, 1000)
+        conn = self._ensure_read_conn()
+        brain_id = self._get_brain_id()
+
+        # Predicate must match idx_fibers_habit's WHERE clause for the partial index to apply
+        async with conn.execute(
+            """SELECT * FROM fibers
+               WHERE brain_id = ? AND json_extract(metadata, '$._habit_pattern') = 1
+               ORDER BY created_at DESC LIMIT ?""",
+            (brain_id, limit),
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [row_to_fiber(row) for row in rows]
+
+    async def get_habit_by_name(self, name: str) -> Fiber | None:
+        conn = self._ensure_read_conn()
+        brain_id = self._get_brain_id()
+
+        # Predicate must match idx_fibers_habit_summary's WHERE clause
+        async with conn.execute(
+            """SELECT * FROM fibers
+               WHERE brain_id = ? AND summary = ?
+                 AND json_extract(metadata, '$._habit_pattern') = 1
+               ORDER BY created_at DESC LIMIT 1""",
+            (brain_id, name),
+        ) as cursor:
+            row = await cursor.fetchone()
+            return row_to_fiber(row) if row else None
+
+    async def iter_habit_fibers(self, batch: int = 200) -> AsyncIterator[Fiber]:
+        conn = self._ensure_read_conn()
+        brain_id = self._get_brain_id()
+        batch = max(1, min(batch, 1000))
+
+        # Keyset pagination on (created_at, id); the separate created_at <= ? bound
+        # lets SQLite range-scan idx_fibers_habit instead of walking the whole brain
+        query = """SELECT * FROM fibers
+                   WHERE brain_id = ? AND json_extract(metadata, '$._habit_pattern') = 1
+                     {after}
+                   ORDER BY created_at DESC, id DESC LIMIT ?"""
+        sql = query.format(after="")
+        params: tuple[Any, ...] = (brain_id, batch)
+        while True:
+            async with conn.execute(sql, params) as cursor:
+                rows = list(await cursor.fetchall())
+            for row in rows:
+                yield row_to_fiber(row)
+            if len(rows) < batch:
+                return
+            last = rows[-1]
+            sql = query.format(after="AND created_at <= ? AND (created_at < ? OR id < ?)")
+            params = (brain_id, last["created_at"], last["created_at"], last["id"], batch)
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
-SCHEMA_VERSION = 17
+SCHEMA_VERSION = 19
 
 # â”€â”€ Migrations â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 # Each entry maps (from_version -> to_version) with a list of SQL statements.
@@ -303,6 +303,17 @@ MIGRATIONS: dict[tuple[int, int], list[str]] = {
         "CREATE INDEX IF NOT EXISTS idx_synapses_updated ON synapses(brain_id, updated_at)",
         "CREATE INDEX IF NOT EXISTS idx_fibers_updated ON fibers(brain_id, updated_at)",
     ],
+    (17, 18): [
+        # Partial index for learned habit lookups (get_habit_fibers)
+        "CREATE INDEX IF NOT EXISTS idx_fibers_habit ON fibers(brain_id, created_at) "
+        "WHERE json_extract(metadata, '$._habit_pattern') = 1",
+    ],
+    (18, 19): [
+        # Partial index for habit lookup by name (get_habit_by_name)
+        "CREATE INDEX IF NOT EXISTS idx_fibers_habit_summary "
+        "ON fibers(brain_id, summary, created_at) "
+        "WHERE json_extract(metadata, '$._habit_pattern') = 1",
+    ],
 }
 
 
@@ -479,6 +490,10 @@ CREATE INDEX IF NOT EXISTS idx_fibers_created ON fibers(brain_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_fibers_salience ON fibers(brain_id, salience);
 CREATE INDEX IF NOT EXISTS idx_fibers_conductivity ON fibers(brain_id, conductivity);
 CREATE INDEX IF NOT EXISTS idx_fibers_updated ON fibers(brain_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_fibers_habit ON fibers(brain_id, created_at)
+    WHERE json_extract(metadata, '$._habit_pattern') = 1;
+CREATE INDEX IF NOT EXISTS idx_fibers_habit_summary ON fibers(brain_id, summary, created_at)
+    WHERE json_extract(metadata, '$._habit_pattern') = 1;
 
 -- Fiber-neuron junction table (fast lookups)
 CREATE TABLE IF NOT EXISTS fiber_neurons (
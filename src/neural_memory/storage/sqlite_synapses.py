@@ -8,9 +8,10 @@ from collections import deque
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
+from neural_memory.core.fiber import Fiber
 from neural_memory.core.neuron import Neuron
 from neural_memory.core.synapse import Direction, Synapse, SynapseType
-from neural_memory.storage.sqlite_row_mappers import row_to_neuron, row_to_synapse
+from neural_memory.storage.sqlite_row_mappers import row_to_fiber, row_to_neuron, row_to_synapse
 
 if TYPE_CHECKING:
     import aiosqlite
@@ -297,6 +298,70 @@ class SQLiteSynapseMixin:
                 results.append((row_to_neuron(row), _row_to_joined_synapse(row)))
         return results
 
+    async def get_fiber_neighborhoods(
+        self,
+        fiber_ids: list[str],
+        max_neighbors: int = 5,
+    ) -> list[tuple[Fiber, Neuron | None, list[tuple[Neuron, Synapse]]]]:
+        """Fetch fibers, their anchors and strongest anchor neighbors in three queries."""
+        if not fiber_ids:
+            return []
+
+        conn = self._ensure_read_conn()
+        brain_id = self._get_brain_id()
+
+        placeholders = ",".join("?" for _ in fiber_ids)
+        async with conn.execute(
+            f"SELECT * FROM fibers WHERE brain_id = ? AND id IN ({placeholders})",
+            [brain_id, *fiber_ids],
+        ) as cursor:
+            fibers_by_id = {row["id"]: row_to_fiber(row) for row in await cursor.fetchall()}
+        fibers = [fibers_by_id[fid] for fid in dict.fromkeys(fiber_ids) if fid in fibers_by_id]
+        if not fibers:
+            return []
+
+        anchor_ids = list({f.anchor_neuron_id for f in fibers})
+        anchors = await self.get_neurons_batch(anchor_ids)
+
+        # Edges in both directions (self-loops once), ranked per anchor by weight
+        anchor_marks = ",".join("?" for _ in anchor_ids)
+        query = f"""
+            WITH edges AS (
+                SELECT s.source_id AS anchor_id, s.target_id AS neighbor_id, s.*
+                FROM synapses s
+                WHERE s.brain_id = ? AND s.source_id IN ({anchor_marks})
+                UNION ALL
+                SELECT s.target_id AS anchor_id, s.source_id AS neighbor_id, s.*
+                FROM synapses s
+                WHERE s.brain_id = ? AND s.target_id IN ({anchor_marks})
+                  AND s.source_id != s.target_id
+            ),
+            ranked AS (
+                SELECT e.anchor_id, n.*, e.id as s_id, e.source_id, e.target_id,
+                       e.type as s_type, e.weight, e.direction, e.metadata as s_metadata,
+                       e.reinforced_count, e.last_activated as s_last_activated,
+                       e.created_at as s_created_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY e.anchor_id ORDER BY e.weight DESC, e.id
+                       ) AS rank
+                FROM edges e
+                JOIN neurons n ON n.brain_id = e.brain_id AND n.id = e.neighbor_id
+            )
+            SELECT * FROM ranked WHERE rank <= ? ORDER BY anchor_id, rank
+        """
+        params: list[Any] = [brain_id, *anchor_ids, brain_id, *anchor_ids, max_neighbors]
+        neighbors: dict[str, list[tuple[Neuron, Synapse]]] = {}
+        async with conn.execute(query, params) as cursor:
+            async for row in cursor:
+                neighbors.setdefault(row["anchor_id"], []).append(
+                    (row_to_neuron(row), _row_to_joined_synapse(row))
+                )
+
+        return [
+            (f, anchors.get(f.anchor_neuron_id), neighbors.get(f.anchor_neuron_id, []))
+            for f in fibers
+        ]
+
     async def get_path(
         self,
         source_id: str,
@@ -13,6 +13,27 @@ from neural_memory.utils.timeutils import utcnow
 if TYPE_CHECKING:
     import aiosqlite
 
+_INSERT_TYPED_MEMORY = """INSERT OR REPLACE INTO typed_memories
+   (fiber_id, brain_id, memory_type, priority, provenance,
+    expires_at, project_id, tags, metadata, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _typed_memory_params(typed_memory: TypedMemory, brain_id: str) -> tuple[Any, ...]:
+    """Build the _INSERT_TYPED_MEMORY parameters for one typed memory."""
+    return (
+        typed_memory.fiber_id,
+        brain_id,
+        typed_memory.memory_type.value,
+        typed_memory.priority.value,
+        json.dumps(provenance_to_dict(typed_memory.provenance)),
+        typed_memory.expires_at.isoformat() if typed_memory.expires_at else None,
+        typed_memory.project_id,
+        json.dumps(list(typed_memory.tags)),
+        json.dumps(typed_memory.metadata),
+        typed_memory.created_at.isoformat(),
+    )
+
 
 class SQLiteTypedMemoryMixin:
     """Mixin providing typed memory CRUD operations."""
@@ -35,27 +56,36 @@ class SQLiteTypedMemoryMixin:
             if await cursor.fetchone() is None:
                 raise ValueError(f"Fiber {typed_memory.fiber_id} does not exist")
 
-        await conn.execute(
-            """INSERT OR REPLACE INTO typed_memories
-               (fiber_id, brain_id, memory_type, priority, provenance,
-                expires_at, project_id, tags, metadata, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                typed_memory.fiber_id,
-                brain_id,
-                typed_memory.memory_type.value,
-                typed_memory.priority.value,
-                json.dumps(provenance_to_dict(typed_memory.provenance)),
-                typed_memory.expires_at.isoformat() if typed_memory.expires_at else None,
-                typed_memory.project_id,
-                json.dumps(list(typed_memory.tags)),
-                json.dumps(typed_memory.metadata),
-                typed_memory.created_at.isoformat(),
-            ),
-        )
+        await conn.execute(_INSERT_TYPED_MEMORY, _typed_memory_params(typed_memory, brain_id))
         await conn.commit()
         return typed_memory.fiber_id
 
+    async def add_typed_memories_batch(self, typed_memories: list[TypedMemory]) -> list[str]:
+        """Insert typed memories with one fiber check, one executemany and one commit."""
+        if not typed_memories:
+            return []
+
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        fiber_ids = list(dict.fromkeys(tm.fiber_id for tm in typed_memories))
+        placeholders = ",".join("?" for _ in fiber_ids)
+        async with conn.execute(
+            f"SELECT id FROM fibers WHERE brain_id = ? AND id IN ({placeholders})",
+            [brain_id, *fiber_ids],
+        ) as cursor:
+            existing = {row[0] for row in await cursor.fetchall()}
+        for fiber_id in fiber_ids:
+            if fiber_id not in existing:
+                raise ValueError(f"Fiber {fiber_id} does not exist")
+
+        await conn.executemany(
+            _INSERT_TYPED_MEMORY,
+            [_typed_memory_params(tm, brain_id) for tm in typed_memories],
+        )
+        await conn.commit()
+        return [tm.fiber_id for tm in typed_memories]
+
     async def get_typed_memory(self, fiber_id: str) -> TypedMemory | None:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
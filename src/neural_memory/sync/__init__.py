@@ -1,16 +1,28 @@
 """Real-time and incremental synchronization for NeuralMemory."""
 
-from neural_memory.sync.client import SyncClient, SyncClientState
-from neural_memory.sync.device import DeviceInfo, get_device_id, get_device_info, get_device_name
-from neural_memory.sync.protocol import (
-    ConflictStrategy,
-    SyncChange,
-    SyncConflict,
-    SyncRequest,
-    SyncResponse,
-    SyncStatus,
-)
-from neural_memory.sync.sync_engine import SyncEngine
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.utils.lazy import make_getattr
+
+if TYPE_CHECKING:
+    from neural_memory.sync.client import SyncClient, SyncClientState
+    from neural_memory.sync.device import (
+        DeviceInfo,
+        get_device_id,
+        get_device_info,
+        get_device_name,
+    )
+    from neural_memory.sync.protocol import (
+        ConflictStrategy,
+        SyncChange,
+        SyncConflict,
+        SyncRequest,
+        SyncResponse,
+        SyncStatus,
+    )
+    from neural_memory.sync.sync_engine import SyncEngine
 
 __all__ = [
     "SyncClient",
@@ -27,3 +39,25 @@ __all__ = [
     "SyncStatus",
     "SyncEngine",
 ]
+
+
+# Imported on first access: device-id lookups in the config would otherwise
+# pull in the aiohttp sync client.
+_LAZY_IMPORTS: dict[str, str] = {
+    "SyncClient": "neural_memory.sync.client",
+    "SyncClientState": "neural_memory.sync.client",
+    "DeviceInfo": "neural_memory.sync.device",
+    "get_device_id": "neural_memory.sync.device",
+    "get_device_info": "neural_memory.sync.device",
+    "get_device_name": "neural_memory.sync.device",
+    "ConflictStrategy": "neural_memory.sync.protocol",
+    "SyncChange": "neural_memory.sync.protocol",
+    "SyncConflict": "neural_memory.sync.protocol",
+    "SyncRequest": "neural_memory.sync.protocol",
+    "SyncResponse": "neural_memory.sync.protocol",
+    "SyncStatus": "neural_memory.sync.protocol",
+    "SyncEngine": "neural_memory.sync.sync_engine",
+}
+
+
+__getattr__ = make_getattr(__name__, _LAZY_IMPORTS)
@@ -263,6 +263,8 @@ class MaintenanceConfig:
 
 
 _VALID_TOOL_TIERS = frozenset({"minimal", "standard", "full"})
+# For messages listing the valid tiers
+_VALID_TOOL_TIERS_TEXT = ", ".join(sorted(_VALID_TOOL_TIERS))
 
 
 @dataclass(frozen=True)
@@ -1205,3 +1207,24 @@ async def _get_falkordb_storage(config: UnifiedConfig, name: str) -> NeuralStora
     storage.set_brain(brain.id)
     _falkordb_storage = storage
     return storage
+
+
+async def close_shared_storage() -> None:
+    """Close and forget every cached shared storage.
+
+    For long-lived processes (e.g. ``nmem-daemon``) shutting down; the next
+    get_shared_storage() call opens fresh connections.
+    """
+    global _falkordb_storage
+
+    storages = list(_storage_cache.values())
+    _storage_cache.clear()
+    if _falkordb_storage is not None:
+        storages.append(_falkordb_storage)
+        _falkordb_storage = None
+
+    for storage in storages:
+        try:
+            await storage.close()
+        except Exception:
+            logger.debug("Failed to close shared storage", exc_info=True)
@@ -0,0 +1,31 @@
+"""Event loop selection for long-running async entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop (the ``fast`` extra, not available on Windows) speeds up socket
+    and subprocess heavy loops. Without it this is plain ``asyncio.run``.
+    Importing uvloop costs a few milliseconds, so one-shot hook processes
+    keep using ``asyncio.run`` directly.
+
+    Args:
+        main: Coroutine to run, as for ``asyncio.run``
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    result: T = uvloop.run(main)
+    return result
@@ -0,0 +1,49 @@
+"""Incremental JSON writer for large exports."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TextIO
+
+
+def dump_json_streaming(
+    data: dict[str, Any],
+    fp: TextIO,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    ensure_ascii: bool = True,
+) -> None:
+    """Write a JSON object to ``fp``, streaming its array values item by item.
+
+    Each list, tuple or iterator value becomes a JSON array with one element
+    per line, and each element is encoded on its own. The serialized export
+    is never held in memory as a whole, and every element goes through
+    json's C encoder (``json.dump(..., indent=2)`` falls back to the
+    pure-Python one). Other values are written with plain ``json.dumps``.
+
+    Args:
+        data: Top-level object to write
+        fp: Text file to write to
+        default: Fallback serializer, as for ``json.dumps``
+        ensure_ascii: Escape non-ASCII characters, as for ``json.dumps``
+    """
+    encode = json.JSONEncoder(default=default, ensure_ascii=ensure_ascii).encode
+
+    fp.write("{")
+    for i, (key, value) in enumerate(data.items()):
+        fp.write(f"{',' if i else ''}\n  {encode(key)}: ")
+        if isinstance(value, (list, tuple, Iterator)):
+            _write_array(value, fp, encode)
+        else:
+            fp.write(encode(value))
+    fp.write("\n}\n")
+
+
+def _write_array(items: Iterable[Any], fp: TextIO, encode: Callable[[Any], str]) -> None:
+    fp.write("[")
+    empty = True
+    for item in items:
+        fp.write(f"\n    {encode(item)}" if empty else f",\n    {encode(item)}")
+        empty = False
+    fp.write("]" if empty else "\n  ]")
@@ -0,0 +1,32 @@
+"""Lazy package exports.
+
+Packages list their public names in a name -> module mapping and bind
+``__getattr__ = make_getattr(__name__, mapping)``, so importing one
+submodule does not load every sibling the package re-exports.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def make_getattr(module_name: str, lazy_imports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports mapped names on first access.
+
+    Resolved values are stored in the package namespace, so later lookups
+    skip ``__getattr__``. Unmapped names raise ``AttributeError`` as usual.
+    """
+
+    def module_getattr(name: str) -> Any:
+        source = lazy_imports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return module_getattr
@@ -46,6 +46,11 @@ for canonical, synonyms in SYNONYM_MAP.items():
         _REVERSE_MAP[syn.lower()] = canonical
     _REVERSE_MAP[canonical.lower()] = canonical
 
+# SimHash of every built-in canonical tag, computed once per process
+_CANONICAL_HASHES: dict[str, int] = {
+    canonical: simhash(canonical) for canonical in set(_REVERSE_MAP.values())
+}
+
 
 @dataclass(frozen=True)
 class DriftReport:
@@ -71,7 +76,9 @@ class TagNormalizer:
     ) -> None:
         self._reverse_map = dict(_REVERSE_MAP)
         self._simhash_threshold = simhash_threshold
-        self._canonical_hashes: dict[str, int] = {}
+
+        # Built-in canonical hashes are shared; only extra canonicals are hashed
+        self._canonical_hashes: dict[str, int] = _CANONICAL_HASHES
 
         if extra_synonyms:
             for canonical, synonyms in extra_synonyms.items():
@@ -80,9 +87,12 @@ class TagNormalizer:
                 for syn in synonyms:
                     self._reverse_map[syn.lower()] = canonical
 
-        # Pre-compute SimHash for all canonical tags
-        for canonical in set(self._reverse_map.values()):
-            self._canonical_hashes[canonical] = simhash(canonical)
+            self._canonical_hashes = {
+                canonical: _CANONICAL_HASHES[canonical]
+                if canonical in _CANONICAL_HASHES
+                else simhash(canonical)
+                for canonical in set(self._reverse_map.values())
+            }
 
     def normalize(self, tag: str) -> str:
         """Normalize a single tag.
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import importlib.util
+import sys
+from collections.abc import AsyncGenerator, Callable
 from datetime import datetime
+from pathlib import Path
+from types import ModuleType
 
 import pytest
 import pytest_asyncio
@@ -163,3 +167,22 @@ async def populated_storage(
 def reference_time() -> datetime:
     """Standard reference time for tests."""
     return datetime(2024, 2, 4, 14, 30, 0)
+
+
+@pytest.fixture
+def load_hook_script(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], ModuleType]:
+    """Load a standalone script from the top-level hooks/ directory by file name."""
+    hooks_dir = Path(__file__).resolve().parent.parent / "hooks"
+
+    def load(file_name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(
+            Path(file_name).stem.replace("-", "_"), hooks_dir / file_name
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        # dataclass() looks the module up by name while the script executes
+        monkeypatch.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -214,3 +215,46 @@ class TestEncodingFlow:
         fiber = await storage.get_fiber(result.fiber.id)
         assert fiber is not None
         assert fiber.id == result.fiber.id
+
+    @pytest.mark.asyncio
+    async def test_encode_batch_returns_results_in_order(self, storage: InMemoryStorage) -> None:
+        """Test that encode_batch encodes every item with shared tags."""
+        brain = await storage.get_brain(storage._current_brain_id)  # type: ignore
+        assert brain is not None
+
+        encoder = MemoryEncoder(storage, brain.config)
+        contents = ["Alice fixed the login bug", "Bob reviewed the login fix"]
+
+        results = await encoder.encode_batch(
+            contents,
+            timestamp=datetime(2024, 2, 4, 15, 0),
+            tags={"bugfix"},
+        )
+
+        assert len(results) == 2
+        for content, result in zip(contents, results, strict=True):
+            fiber = await storage.get_fiber(result.fiber.id)
+            assert fiber is not None
+            assert "bugfix" in fiber.tags
+            anchor = await storage.get_neuron(fiber.anchor_neuron_id)
+            assert anchor is not None
+            assert anchor.content == content
+
+    @pytest.mark.asyncio
+    async def test_encode_batch_saves_once(self, storage: InMemoryStorage) -> None:
+        """Test that encode_batch flushes storage once for the whole batch."""
+        brain = await storage.get_brain(storage._current_brain_id)  # type: ignore
+        assert brain is not None
+
+        encoder = MemoryEncoder(storage, brain.config)
+
+        with (
+            patch.object(storage, "disable_auto_save") as disable,
+            patch.object(storage, "enable_auto_save") as enable,
+            patch.object(storage, "batch_save", wraps=storage.batch_save) as batch_save,
+        ):
+            await encoder.encode_batch(["First event", "Second event", "Third event"])
+
+        disable.assert_called_once()
+        enable.assert_called_once()
+        batch_save.assert_awaited_once()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from pathlib import Path
 
 import pytest
 import pytest_asyncio
@@ -10,6 +11,7 @@ import pytest_asyncio
 from neural_memory.core.action_event import ActionEvent
 from neural_memory.core.brain import Brain
 from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
 from neural_memory.utils.timeutils import utcnow
 
 
@@ -219,3 +221,37 @@ async def test_session_id_defaults_none(store: InMemoryStorage) -> None:
 
     events = await store.get_action_sequences()
     assert events[0].session_id is None
+
+
+# --- 10. SQLite pushes the since window into an index range ---
+
+
+@pytest.mark.asyncio
+async def test_sqlite_since_filter_uses_created_index(tmp_path: Path) -> None:
+    """SQLite filters 'since' in the query, oldest first, via idx_action_events_created."""
+    storage = SQLiteStorage(tmp_path / "actions.db")
+    await storage.initialize()
+    try:
+        brain = Brain.create(name="action-test")
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+
+        await storage.record_action("recall")
+        cutoff = utcnow()
+        await storage.record_action("remember")
+        await storage.record_action("context")
+
+        events = await storage.get_action_sequences(since=cutoff)
+        assert [e.action_type for e in events] == ["remember", "context"]
+
+        conn = storage._ensure_read_conn()
+        async with conn.execute(
+            """EXPLAIN QUERY PLAN SELECT * FROM action_events
+               WHERE brain_id = ? AND created_at >= ? ORDER BY created_at ASC LIMIT ?""",
+            (brain.id, cutoff.isoformat(), 1000),
+        ) as cursor:
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+        assert "idx_action_events_created" in plan
+        assert "TEMP B-TREE" not in plan
+    finally:
+        await storage.close()
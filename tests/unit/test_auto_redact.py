@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from neural_memory.safety.sensitive import (
+    SensitivePattern,
+    SensitiveType,
+    auto_redact_batch,
     auto_redact_content,
 )
 from neural_memory.unified_config import SafetyConfig
@@ -62,6 +65,42 @@ class TestAutoRedactContent:
         assert "sk-1234567890abcdef1234567890" not in redacted
 
 
+class TestAutoRedactBatch:
+    def test_matches_per_item_results(self) -> None:
+        contents = [
+            "We decided to use FastAPI for the REST server",
+            "The api_key = sk-1234567890abcdef1234567890",
+            "",
+            "Card 4111111111111111 and SSN 123-45-6789",
+            "password = MySecretPassword123!",
+        ]
+        for min_severity in (1, 2, 3):
+            expected = [auto_redact_content(c, min_severity=min_severity) for c in contents]
+            assert auto_redact_batch(contents, min_severity=min_severity) == expected
+
+    def test_no_match_across_items(self) -> None:
+        """A key name at the end of one item does not pair with the next item's value."""
+        contents = ["remember the api_key", "= sk-1234567890abcdef1234567890 is fine"]
+        assert auto_redact_batch(contents) == [auto_redact_content(c) for c in contents]
+
+    def test_item_containing_separator(self) -> None:
+        contents = ["api_key\n\x00\n= sk-1234567890abcdef1234567890", "password = hunter22"]
+        assert auto_redact_batch(contents) == [auto_redact_content(c) for c in contents]
+
+    def test_custom_patterns(self) -> None:
+        patterns = [
+            SensitivePattern(
+                name="Line Start Code",
+                pattern=r"^CODE-\d+",
+                type=SensitiveType.SECRET,
+                description="Anchored test pattern",
+                severity=3,
+            )
+        ]
+        redacted = auto_redact_batch(["CODE-1 first", "CODE-2 second"], patterns=patterns)
+        assert [text for text, _, _ in redacted] == ["[REDACTED] first", "[REDACTED] second"]
+
+
 class TestSafetyConfig:
     def test_default_severity_3(self) -> None:
         cfg = SafetyConfig()
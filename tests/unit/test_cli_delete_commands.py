@@ -0,0 +1,91 @@
+"""Tests for CLI commands that confirm before deleting."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from neural_memory.cli.main import app
+from neural_memory.core.brain import Brain
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.memory_types import MemoryType, TypedMemory
+from neural_memory.core.project import Project
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.utils.timeutils import utcnow
+
+runner = CliRunner()
+
+
+# The commands run their own event loop, so these tests stay synchronous.
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    storage = InMemoryStorage()
+    brain = Brain.create(name="cli")
+    asyncio.run(storage.save_brain(brain))
+    storage.set_brain(brain.id)
+    return storage
+
+
+def _invoke(storage: InMemoryStorage, module: str, args: list[str], answer: str) -> AsyncMock:
+    opener = AsyncMock(return_value=storage)
+    with patch(f"neural_memory.cli.commands.{module}.get_storage", opener):
+        result = runner.invoke(app, args, input=answer)
+    assert result.exit_code == 0, result.output
+    return opener
+
+
+class TestProjectDelete:
+    """Tests for nmem project delete."""
+
+    def test_confirm_deletes_with_one_storage_open(self, storage: InMemoryStorage) -> None:
+        asyncio.run(storage.add_project(Project.create(name="old")))
+
+        opener = _invoke(storage, "project", ["project", "delete", "old"], "y\n")
+
+        assert opener.await_count == 1
+        assert asyncio.run(storage.get_project_by_name("old")) is None
+
+    def test_decline_keeps_project(self, storage: InMemoryStorage) -> None:
+        asyncio.run(storage.add_project(Project.create(name="old")))
+
+        _invoke(storage, "project", ["project", "delete", "old"], "n\n")
+
+        assert asyncio.run(storage.get_project_by_name("old")) is not None
+
+
+class TestCleanup:
+    """Tests for nmem cleanup."""
+
+    def _add_expired(self, storage: InMemoryStorage) -> str:
+        fiber = Fiber.create(neuron_ids={"n1"}, synapse_ids=set(), anchor_neuron_id="n1")
+        typed = TypedMemory.create(fiber_id=fiber.id, memory_type=MemoryType.CONTEXT)
+
+        async def _seed() -> None:
+            await storage.add_fiber(fiber)
+            await storage.add_typed_memory(
+                dataclasses.replace(typed, expires_at=utcnow() - timedelta(days=1))
+            )
+
+        asyncio.run(_seed())
+        return fiber.id
+
+    def test_confirm_deletes_with_one_storage_open(self, storage: InMemoryStorage) -> None:
+        fiber_id = self._add_expired(storage)
+
+        opener = _invoke(storage, "listing", ["cleanup"], "y\n")
+
+        assert opener.await_count == 1
+        assert asyncio.run(storage.get_fiber(fiber_id)) is None
+
+    def test_decline_keeps_memories(self, storage: InMemoryStorage) -> None:
+        fiber_id = self._add_expired(storage)
+
+        _invoke(storage, "listing", ["cleanup"], "n\n")
+
+        assert asyncio.run(storage.get_fiber(fiber_id)) is not None
+        assert asyncio.run(storage.get_expired_memory_count()) == 1
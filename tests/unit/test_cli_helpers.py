@@ -0,0 +1,94 @@
+"""Tests for shared CLI helpers."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from neural_memory.cli import _helpers
+from neural_memory.cli._helpers import dumps_json_indented, get_config, output_result
+
+
+class TestGetConfig:
+    """Tests for get_config caching."""
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path))
+        monkeypatch.setattr(_helpers, "_config_cache", {})
+        return tmp_path
+
+    def test_reloads_when_file_changes(self, data_dir: Path) -> None:
+        assert get_config().current_brain == "default"
+
+        config_file = data_dir / "config.json"
+        data = json.loads(config_file.read_text(encoding="utf-8"))
+        data["current_brain"] = "work"
+        config_file.write_text(json.dumps(data), encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_config().current_brain == "work"
+
+    def test_returns_independent_copies(self) -> None:
+        first = get_config()
+        first.current_brain = "mutated"
+        first.shared.enabled = True
+
+        second = get_config()
+        assert second.current_brain == "default"
+        assert second.shared.enabled is False
+
+
+class TestDumpsJsonIndented:
+    """Tests for dumps_json_indented."""
+
+    DATA = {
+        "answer": 'Dùng "pytest" \\ 𝄞',
+        "created_at": datetime(2026, 2, 26, 12, 0, 5, 123),
+        "neurons_activated": 3,
+        "confidence": 0.25,
+        "tags": {"x"},
+        "nested": [{"ids": ("a", "b"), 1: None}, []],
+    }
+
+    def test_matches_stdlib(self) -> None:
+        assert dumps_json_indented(self.DATA) == json.dumps(self.DATA, indent=2, default=str)
+
+    def test_wide_integers(self) -> None:
+        assert json.loads(dumps_json_indented({"big": 2**70})) == {"big": 2**70}
+
+    def test_without_orjson(self) -> None:
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert dumps_json_indented(self.DATA) == json.dumps(self.DATA, indent=2, default=str)
+
+
+class TestOutputResult:
+    """Tests for human-readable output_result."""
+
+    def test_answer_with_metadata(self, capsys: pytest.CaptureFixture[str]) -> None:
+        output_result(
+            {
+                "answer": "42",
+                "freshness_warnings": ["stale"],
+                "confidence": 0.0,
+                "neurons_activated": 3,
+                "oldest_memory_age": "",
+            }
+        )
+        assert capsys.readouterr().out == "42\n\nstale\n\n[confidence: 0.00, neurons: 3]\n"
+
+    def test_message_with_type_info(self, capsys: pytest.CaptureFixture[str]) -> None:
+        output_result({"message": "Stored", "memory_type": "fact", "expires_in_days": 0})
+        assert capsys.readouterr().out == "Stored\n  [type: fact, expires: 0d]\n"
+
+    def test_writes_once(self) -> None:
+        with patch.object(_helpers.typer, "echo") as echo:
+            output_result({"answer": "42", "freshness_warnings": ["a", "b"], "confidence": 1.0})
+        echo.assert_called_once()
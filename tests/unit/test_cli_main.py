@@ -0,0 +1,92 @@
+"""Tests for the lazily loaded root CLI group."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from neural_memory.cli.main import (
+    _COMMAND_MODULES,
+    _SUBAPPS,
+    _app_callback,
+    _warn_if_not_initialized,
+    app,
+)
+
+
+class TestLazyGroup:
+    """Tests for command loading in the root group."""
+
+    def test_command_map_matches_register(self) -> None:
+        for module_name in set(_COMMAND_MODULES.values()):
+            commands_app = typer.Typer()
+            importlib.import_module(f"neural_memory.cli.commands.{module_name}").register(
+                commands_app
+            )
+            registered = set(typer.main.get_group(commands_app).commands)
+            mapped = {name for name, module in _COMMAND_MODULES.items() if module == module_name}
+            assert registered == mapped, module_name
+
+    def test_subapp_shadows_command_of_same_name(self) -> None:
+        group = typer.main.get_group(app)
+        command = group.get_command(None, "version")
+        assert isinstance(command, typer.core.TyperGroup)
+        assert "create" in command.commands
+
+    def test_help_lists_every_command(self) -> None:
+        result = CliRunner().invoke(app, ["--help"], env={"COLUMNS": "200"})
+        assert result.exit_code == 0
+        for name in (*_COMMAND_MODULES, *_SUBAPPS):
+            assert f" {name} " in result.output
+
+
+class TestInitHint:
+    """Tests for the not-initialized hint."""
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path))
+        return tmp_path
+
+    def test_hint_until_config_exists(
+        self, data_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        ctx = SimpleNamespace(invoked_subcommand="stats")
+        _warn_if_not_initialized(ctx)  # type: ignore[arg-type]
+        assert "nmem init" in capsys.readouterr().err
+
+        (data_dir / "config.toml").write_text("", encoding="utf-8")
+        _warn_if_not_initialized(ctx)  # type: ignore[arg-type]
+        assert capsys.readouterr().err == ""
+
+    def test_no_hint_for_init(self, capsys: pytest.CaptureFixture[str]) -> None:
+        _warn_if_not_initialized(SimpleNamespace(invoked_subcommand="init"))  # type: ignore[arg-type]
+        assert capsys.readouterr().err == ""
+
+    @pytest.mark.parametrize(
+        ("argv", "quiet"),
+        [
+            (["nmem", "list"], False),
+            (["nmem", "list", "--json"], True),
+            (["nmem", "recall", "-j", "auth"], True),
+            (["nmem", "remember", "--", "-j"], False),
+        ],
+    )
+    def test_json_output_skips_hint_and_update_check(
+        self, argv: list[str], quiet: bool, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        ctx = SimpleNamespace(invoked_subcommand=argv[1])
+        with (
+            patch("sys.argv", argv),
+            patch("neural_memory.cli.update_check.run_update_check_background") as update_check,
+        ):
+            _app_callback(ctx)  # type: ignore[arg-type]
+
+        assert ("nmem init" in capsys.readouterr().err) is not quiet
+        assert update_check.called is not quiet
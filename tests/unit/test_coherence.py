@@ -0,0 +1,247 @@
+"""Unit tests for the long-horizon coherence benchmark."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from itertools import accumulate
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Ensure benchmarks module is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from benchmarks import coherence_test
+from benchmarks.coherence_test import format_coherence_report, run_coherence_test
+from benchmarks.ground_truth import MEMORIES, QUERIES, get_session_schedule
+from benchmarks.result_log import BenchmarkLogger
+
+
+class _FakeBackend:
+    """Records encodes and answers each query with its ground-truth memories."""
+
+    def __init__(self) -> None:
+        self.content_to_id: dict[str, str] = {}
+        self.encoded_at: dict[str, datetime] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.encoded_at_query: list[int] = []
+        self.encodes_in_flight = 0
+        self.max_encodes_in_flight = 0
+
+    async def encode(self, content: str, tags: set[str], timestamp: datetime) -> str:
+        self.encodes_in_flight += 1
+        self.max_encodes_in_flight = max(self.max_encodes_in_flight, self.encodes_in_flight)
+        await asyncio.sleep(0)
+        self.encodes_in_flight -= 1
+        actual_id = f"fiber-{len(self.content_to_id)}"
+        self.content_to_id[content] = actual_id
+        self.encoded_at[actual_id] = timestamp
+        return actual_id
+
+    async def query(self, query_text: str) -> list[str]:
+        self.encoded_at_query.append(len(self.content_to_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        gt_query = next(q for q in QUERIES if q.query == query_text)
+        by_id = {m.id: m.content for m in MEMORIES}
+        return [
+            self.content_to_id[by_id[eid]]
+            for eid in sorted(gt_query.expected_ids)
+            if by_id[eid] in self.content_to_id
+        ]
+
+
+class TestRunCoherenceTest:
+    """Tests for run_coherence_test."""
+
+    async def test_one_result_per_session(self) -> None:
+        """Every scheduled day produces a session result."""
+        backend = _FakeBackend()
+        report = await run_coherence_test(backend.encode, backend.query)
+
+        assert [s.day for s in report.sessions] == [day for day, _ in get_session_schedule()]
+        assert report.sessions[-1].total_memories == len(MEMORIES)
+
+    async def test_encode_timestamps_follow_schedule_order(self) -> None:
+        """Encodes get one-minute-spaced timestamps in schedule order."""
+        backend = _FakeBackend()
+        await run_coherence_test(backend.encode, backend.query)
+
+        by_content = {m.content: m for m in MEMORIES}
+        ordered = [m for _, day_memories in get_session_schedule() for m in day_memories]
+        times = [backend.encoded_at[backend.content_to_id[m.content]] for m in ordered]
+        assert times == sorted(times)
+        assert len(set(times)) == len(by_content)
+
+    async def test_oracle_backend_meets_target(self) -> None:
+        """A backend returning exactly the expected memories has perfect recall."""
+        backend = _FakeBackend()
+        report = await run_coherence_test(backend.encode, backend.query, k=10)
+
+        assert report.final_recall == 1.0
+        assert report.final_mrr == 1.0
+        assert report.target_met
+
+    async def test_query_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency queries run at once."""
+        backend = _FakeBackend()
+        await run_coherence_test(backend.encode, backend.query, max_concurrency=2)
+
+        assert 1 <= backend.max_in_flight <= 2
+
+    async def test_encodes_never_overlap(self) -> None:
+        """Encodes run one at a time even when queries may run concurrently."""
+        backend = _FakeBackend()
+        await run_coherence_test(
+            backend.encode, backend.query, max_concurrency=4, interleave_queries=True
+        )
+
+        assert backend.max_encodes_in_flight == 1
+
+    async def test_queries_run_one_at_a_time_by_default(self) -> None:
+        """Concurrency is opt-in: by default queries never overlap."""
+        backend = _FakeBackend()
+        await run_coherence_test(backend.encode, backend.query)
+
+        assert backend.max_in_flight == 1
+
+    async def test_background_consolidation_runs_and_completes(self) -> None:
+        """Background consolidation fires for each day 14+ session and is awaited."""
+        backend = _FakeBackend()
+        finished: list[int] = []
+
+        async def consolidate() -> None:
+            await asyncio.sleep(0)
+            finished.append(len(backend.content_to_id))
+
+        await run_coherence_test(
+            backend.encode, backend.query, consolidate, background_consolidation=True
+        )
+
+        late_days = [day for day, _ in get_session_schedule() if day >= 14]
+        assert len(finished) == len(late_days)
+
+    async def test_background_consolidation_lands_before_next_encodes(self) -> None:
+        """The next session does not encode while consolidation is still running."""
+        backend = _FakeBackend()
+        running = False
+        encoded_during: list[str] = []
+        encode = backend.encode
+
+        async def tracked_encode(content: str, tags: set[str], timestamp: datetime) -> str:
+            if running:
+                encoded_during.append(content)
+            return await encode(content, tags, timestamp)
+
+        async def consolidate() -> None:
+            nonlocal running
+            running = True
+            # Outlasts the session's queries, so it is still running when they finish
+            for _ in range(len(QUERIES) * 10):
+                await asyncio.sleep(0)
+            running = False
+
+        await run_coherence_test(
+            tracked_encode, backend.query, consolidate, background_consolidation=True
+        )
+
+        assert encoded_during == []
+
+    async def test_failed_session_cancels_background_consolidation(self) -> None:
+        """A session that raises does not leave consolidation running."""
+        backend = _FakeBackend()
+        started = asyncio.Event()
+        cancelled = False
+
+        async def consolidate() -> None:
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def query(query_text: str) -> list[str]:
+            if started.is_set():
+                await asyncio.sleep(0)
+                raise RuntimeError("query failed")
+            return await backend.query(query_text)
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            await run_coherence_test(
+                backend.encode, query, consolidate, background_consolidation=True
+            )
+
+        assert cancelled
+
+    async def test_background_consolidation_failure_is_logged(self) -> None:
+        """A failing background consolidation does not abort the run."""
+        backend = _FakeBackend()
+
+        async def consolidate() -> None:
+            raise RuntimeError("boom")
+
+        with patch.object(coherence_test.logger, "exception") as log_exception:
+            report = await run_coherence_test(
+                backend.encode, backend.query, consolidate, background_consolidation=True
+            )
+
+        assert len(report.sessions) == len(get_session_schedule())
+        log_exception.assert_called()
+
+    async def test_interleaved_queries_match_phased_results(self) -> None:
+        """Interleaving encodes and queries keeps an oracle backend's scores."""
+        phased_backend = _FakeBackend()
+        phased = await run_coherence_test(phased_backend.encode, phased_backend.query)
+        backend = _FakeBackend()
+        interleaved = await run_coherence_test(
+            backend.encode, backend.query, max_concurrency=1, interleave_queries=True
+        )
+
+        assert [s.queries_tested for s in interleaved.sessions] == [
+            s.queries_tested for s in phased.sessions
+        ]
+        assert interleaved.final_recall == phased.final_recall
+        # Some queries ran while their session was still encoding
+        boundaries = set(
+            accumulate(len(day_memories) for _, day_memories in get_session_schedule())
+        )
+        assert set(phased_backend.encoded_at_query) <= boundaries
+        assert not set(backend.encoded_at_query) <= boundaries
+
+    async def test_result_log_streams_queries_and_sessions(self, tmp_path: Path) -> None:
+        """Every query metric and session result is written as a JSON line."""
+        backend = _FakeBackend()
+        path = tmp_path / "coherence.jsonl"
+        with BenchmarkLogger(path) as result_log:
+            report = await run_coherence_test(backend.encode, backend.query, result_log=result_log)
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        sessions = [r for r in records if r["kind"] == "session"]
+        queries = [r for r in records if r["kind"] == "query"]
+        assert [r["day"] for r in sessions] == [s.day for s in report.sessions]
+        assert len(queries) == sum(s.queries_tested for s in report.sessions)
+        assert {"query", "category", "recall_at_k", "day"} <= set(queries[0])
+
+
+class TestFormatCoherenceReport:
+    """Tests for format_coherence_report."""
+
+    async def test_contains_all_sessions(self) -> None:
+        """Markdown table has one row per session plus the verdict line."""
+        backend = _FakeBackend()
+        report = await run_coherence_test(backend.encode, backend.query)
+        text = format_coherence_report(report)
+
+        assert text.startswith("### Long-Horizon Coherence Test")
+        for session in report.sessions:
+            assert f"| {session.day} | {session.memories_encoded} |" in text
+        assert "[PASS]" in text
@@ -0,0 +1,136 @@
+"""Tests for the NeuralMemory hook daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from neural_memory import daemon
+
+
+async def _echo(request: dict[str, Any]) -> dict[str, Any]:
+    return {"echo": request.get("value")}
+
+
+async def _flushed(request: dict[str, Any]) -> dict[str, Any]:
+    return {"saved": 1, "items": [{"type": "decision", "content": "Use PostgreSQL"}]}
+
+
+async def _request(path: Path, payload: bytes) -> dict[str, Any]:
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    writer.write(payload)
+    await writer.drain()
+    line = await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+    reply: dict[str, Any] = json.loads(line)
+    return reply
+
+
+class TestHandleRequest:
+    """Tests for request decoding and dispatch."""
+
+    async def test_dispatches_to_handler(self) -> None:
+        with patch.dict(daemon.HANDLERS, {"echo": _echo}):
+            reply = await daemon._handle_request(b'{"op": "echo", "value": 3}', asyncio.Lock())
+
+        assert reply == {"ok": True, "echo": 3}
+
+    async def test_rejects_bad_requests(self) -> None:
+        lock = asyncio.Lock()
+
+        assert not (await daemon._handle_request(b"not json", lock))["ok"]
+        assert not (await daemon._handle_request(b"[1, 2]", lock))["ok"]
+        reply = await daemon._handle_request(b'{"op": "missing"}', lock)
+        assert reply["error"] == "Unknown op: 'missing'"
+
+    async def test_handler_failure_is_reported(self) -> None:
+        async def boom(request: dict[str, Any]) -> dict[str, Any]:
+            raise RuntimeError("boom")
+
+        with patch.dict(daemon.HANDLERS, {"boom": boom}):
+            reply = await daemon._handle_request(b'{"op": "boom"}', asyncio.Lock())
+
+        assert reply == {"ok": False, "error": "boom failed"}
+
+    async def test_precompact_flush_without_transcript_is_noop(self) -> None:
+        reply = await daemon._handle_request(b'{"op": "precompact_flush"}', asyncio.Lock())
+
+        assert reply["ok"]
+        assert reply["saved"] == 0
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets required")
+class TestServe:
+    """Tests for the socket server."""
+
+    async def test_round_trip_and_cleanup(self, tmp_path: Path) -> None:
+        path = tmp_path / "nmem.sock"
+        with patch.dict(daemon.HANDLERS, {"echo": _echo}):
+            task = asyncio.create_task(daemon.serve(path))
+            while not path.exists():
+                await asyncio.sleep(0.01)
+
+            assert path.stat().st_mode & 0o077 == 0
+            assert await _request(path, b'{"op": "echo", "value": "hi"}\n') == {
+                "ok": True,
+                "echo": "hi",
+            }
+            with pytest.raises(RuntimeError, match="already listening"):
+                daemon._claim_socket_path(path)
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert not path.exists()
+
+    async def test_hook_summary_matches_inline_format(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        load_hook_script: Callable[[str], ModuleType],
+    ) -> None:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        hook = load_hook_script("precompact-flush.py")
+        path = tmp_path / "nmem.sock"
+        with patch.dict(daemon.HANDLERS, {"precompact_flush": _flushed}):
+            task = asyncio.create_task(daemon.serve(path))
+            while not path.exists():
+                await asyncio.sleep(0.01)
+
+            flushed = await asyncio.to_thread(hook._flush_via_daemon, "transcript.jsonl")
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert flushed == (1, [hook._summary_line("decision", "Use PostgreSQL")])
+        assert flushed[1] == ["- [decision] Use PostgreSQL"]
+
+    def test_stale_socket_is_replaced(self, tmp_path: Path) -> None:
+        path = tmp_path / "nmem.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()  # File remains, nobody listening
+
+        daemon._claim_socket_path(path)
+
+        assert not path.exists()
+
+    def test_regular_file_is_not_removed(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.txt"
+        path.write_text("keep me")
+
+        with pytest.raises(RuntimeError, match="not a socket"):
+            daemon._claim_socket_path(path)
+
+        assert path.read_text() == "keep me"
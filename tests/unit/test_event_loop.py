@@ -0,0 +1,38 @@
+"""Tests for event loop selection."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType
+from typing import Any
+from unittest.mock import patch
+
+from neural_memory.utils.event_loop import run
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+class TestRun:
+    """Tests for run."""
+
+    def test_falls_back_to_asyncio(self) -> None:
+        with patch.dict(sys.modules, {"uvloop": None}):  # Import raises ImportError
+            assert run(_answer()) == 42
+
+    def test_uses_uvloop_when_installed(self) -> None:
+        calls: list[Any] = []
+        fake_uvloop = ModuleType("uvloop")
+
+        def fake_run(main: Any) -> Any:
+            calls.append(main)
+            return asyncio.run(main)
+
+        fake_uvloop.run = fake_run  # type: ignore[attr-defined]
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            assert run(_answer()) == 42
+
+        assert len(calls) == 1
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+from pathlib import Path
 
 import pytest
 
@@ -10,8 +11,15 @@ from neural_memory.cli.graph_export import (
     FiberNode,
     NeighborEdge,
     build_svg,
+    collect_graph_data,
     layout_tree,
+    write_svg,
 )
+from neural_memory.core.brain import Brain
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.storage.memory_store import InMemoryStorage
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
@@ -95,6 +103,13 @@ class TestBuildSvg:
         assert "&lt;script&gt;" in svg
         ET.fromstring(svg)
 
+    def test_synapse_type_has_fixed_text_length(self) -> None:
+        neighbors = (_make_neighbor('say "hi" & go', "leads_to", "→"),)
+        svg = build_svg("default", [_make_fiber("quoted", neighbors)])
+        assert 'textLength="56"' in svg  # len("leads_to") * 7
+        assert "say &quot;hi&quot; &amp; go" in svg
+        ET.fromstring(svg)
+
     def test_legend_present(self) -> None:
         svg = build_svg("default", [_make_fiber()])
         assert "Legend" in svg
@@ -106,6 +121,15 @@ class TestBuildSvg:
         assert "#0c1419" in svg  # background
         assert "#00d084" in svg  # fiber stroke / header
 
+    def test_write_svg_streams_same_document(self, tmp_path: Path) -> None:
+        fibers = [_make_fiber("streamed", (_make_neighbor(),))]
+        out = tmp_path / "graph.svg"
+        with out.open("w", encoding="utf-8") as f:
+            write_svg(f, "default", fibers, timestamp="2026-02-26 12:00")
+        assert out.read_text(encoding="utf-8") == build_svg(
+            "default", fibers, timestamp="2026-02-26 12:00"
+        )
+
 
 # ── layout_tree tests ────────────────────────────────────────────
 
@@ -183,3 +207,42 @@ class TestDataModels:
         edge = _make_neighbor()
         with pytest.raises(AttributeError):
             edge.weight = 0.0  # type: ignore[misc]
+
+
+# ── collect_graph_data tests ─────────────────────────────────────
+
+
+class TestCollectGraphData:
+    async def test_labels_and_neighbors(self) -> None:
+        storage = InMemoryStorage()
+        brain = Brain.create(name="graph")
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+
+        anchor = Neuron.create(type=NeuronType.CONCEPT, content="anchor content")
+        other = Neuron.create(type=NeuronType.CONCEPT, content="other")
+        await storage.add_neuron(anchor)
+        await storage.add_neuron(other)
+        await storage.add_synapse(
+            Synapse.create(anchor.id, other.id, SynapseType.LEADS_TO, weight=0.9)
+        )
+        await storage.add_fiber(
+            Fiber.create(neuron_ids={anchor.id}, synapse_ids=set(), anchor_neuron_id=anchor.id)
+        )
+        await storage.add_fiber(
+            Fiber.create(
+                neuron_ids={other.id},
+                synapse_ids=set(),
+                anchor_neuron_id=other.id,
+                summary="summarised",
+            )
+        )
+
+        name, nodes = await collect_graph_data(storage)  # type: ignore[arg-type]
+
+        assert name == "graph"
+        by_label = {node.label: node for node in nodes}
+        assert set(by_label) == {"anchor content", "summarised"}
+        assert [n.content for n in by_label["anchor content"].neighbors] == ["other"]
+        assert by_label["anchor content"].neighbors[0].synapse_type == "leads_to"
+        assert [n.content for n in by_label["summarised"].neighbors] == ["anchor content"]
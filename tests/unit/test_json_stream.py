@@ -0,0 +1,47 @@
+"""Tests for the incremental JSON writer."""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime
+
+from neural_memory.utils.json_stream import dump_json_streaming
+
+
+def _dump(data: dict, **kwargs: object) -> str:
+    buf = io.StringIO()
+    dump_json_streaming(data, buf, **kwargs)  # type: ignore[arg-type]
+    return buf.getvalue()
+
+
+def test_round_trips_through_json_loads() -> None:
+    data = {
+        "brain_id": "b1",
+        "neurons": [{"id": "n1", "content": "Xin chào"}, {"id": "n2", "content": "x"}],
+        "synapses": [],
+        "pathway": ("a", "b"),
+        "config": {"decay_rate": 0.1, "nested": [1, 2]},
+    }
+
+    text = _dump(data)
+
+    assert json.loads(text) == {**data, "pathway": ["a", "b"]}
+    # Array elements are written one per line
+    assert '\n    {"id": "n2", "content": "x"}' in text
+
+
+def test_streams_iterators_and_applies_options() -> None:
+    when = datetime(2024, 2, 4, 16, 0)
+    text = _dump(
+        {"items": iter([{"at": when, "note": "café"}])},
+        default=str,
+        ensure_ascii=False,
+    )
+
+    assert json.loads(text) == {"items": [{"at": str(when), "note": "café"}]}
+    assert "café" in text
+
+
+def test_empty_object() -> None:
+    assert json.loads(_dump({})) == {}
@@ -0,0 +1,118 @@
+"""Tests for lazily imported package exports and CLI start-up imports."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import neural_memory
+
+LAZY_PACKAGES = (
+    "neural_memory",
+    "neural_memory.engine",
+    "neural_memory.extraction",
+    "neural_memory.integration",
+    "neural_memory.storage",
+    "neural_memory.sync",
+)
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_all_exports_resolve(package_name: str) -> None:
+    package = importlib.import_module(package_name)
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="NotAThing"):
+        neural_memory.NotAThing  # noqa: B018
+
+
+def test_cli_import_skips_engine_and_storage() -> None:
+    code = (
+        "import sys, neural_memory.cli.main; "
+        "loaded = [m for m in ('neural_memory.engine', 'neural_memory.storage') "
+        "if m in sys.modules]; "
+        "print(','.join(loaded))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_sqlite_store_skips_other_backends_and_engine() -> None:
+    code = (
+        "import sys, neural_memory.storage.sqlite_store, neural_memory.sync.device; "
+        "heavy = ('aiohttp', 'networkx', 'neural_memory.engine.encoder', "
+        "'neural_memory.extraction.entities'); "
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_transcript_offsets_skip_asyncio() -> None:
+    code = "import sys, neural_memory.hooks.transcript_offsets; print('asyncio' in sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_version_skips_command_modules() -> None:
+    code = (
+        "import sys; from typer.testing import CliRunner; "
+        "from neural_memory.cli.main import app; "
+        "assert CliRunner().invoke(app, ['--version']).exit_code == 0; "
+        "print(','.join(m for m in sys.modules if m.startswith('neural_memory.cli.commands.')))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_cli_subapp_loads_only_its_module() -> None:
+    code = (
+        "import sys; from typer.testing import CliRunner; "
+        "from neural_memory.cli.main import app; "
+        "assert CliRunner().invoke(app, ['brain', '--help']).exit_code == 0; "
+        "print(','.join(m for m in sys.modules if m.startswith('neural_memory.cli.commands.')))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == "neural_memory.cli.commands.brain"
+
+
+def test_cli_version_flag_skips_typer() -> None:
+    code = (
+        "import sys; sys.argv = ['nmem', '--version']; "
+        "from neural_memory.cli._entry import main; main(); "
+        "print('typer' in sys.modules)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    version_line, typer_loaded = result.stdout.strip().splitlines()
+    assert version_line == f"neural-memory {neural_memory.__version__}"
+    assert typer_loaded == "False"
+
+
+def test_cli_main_attribute_is_the_submodule() -> None:
+    code = (
+        "import neural_memory.cli.main; "
+        "from neural_memory.cli import app, main; "
+        "print(main is neural_memory.cli.main, app is main.app)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    assert result.stdout.strip() == "True True"
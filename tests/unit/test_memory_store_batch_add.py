@@ -0,0 +1,86 @@
+"""Tests for InMemoryStorage batch neuron/synapse inserts."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+
+from neural_memory.core.brain import Brain
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.storage.memory_store import InMemoryStorage
+
+
+@pytest_asyncio.fixture
+async def store() -> InMemoryStorage:
+    """InMemoryStorage with a brain context set."""
+    storage = InMemoryStorage()
+    brain = Brain.create(name="batch-test", brain_id="batch-brain")
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    return storage
+
+
+def _neurons(n: int) -> list[Neuron]:
+    return [
+        Neuron.create(type=NeuronType.CONCEPT, content=f"concept {i}", neuron_id=f"n{i}")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_add_neurons_batch_matches_single_adds(store: InMemoryStorage) -> None:
+    """Batch-added neurons are readable, have state, and keep input order."""
+    ids = await store.add_neurons_batch(_neurons(3))
+
+    assert ids == ["n0", "n1", "n2"]
+    fetched = await store.get_neurons_batch(ids)
+    assert [fetched[nid].content for nid in ids] == ["concept 0", "concept 1", "concept 2"]
+    state = await store.get_neuron_state("n1")
+    assert state is not None
+
+
+@pytest.mark.asyncio
+async def test_add_neurons_batch_rejects_duplicates_atomically(store: InMemoryStorage) -> None:
+    """A duplicate ID (existing or within the batch) adds nothing."""
+    await store.add_neuron(_neurons(1)[0])
+
+    with pytest.raises(ValueError, match="already exists"):
+        await store.add_neurons_batch(_neurons(3))
+    assert await store.get_neuron("n1") is None
+
+    fresh = Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="x")
+    with pytest.raises(ValueError, match="already exists"):
+        await store.add_neurons_batch([fresh, fresh])
+    assert await store.get_neuron("x") is None
+
+
+@pytest.mark.asyncio
+async def test_add_synapses_batch_links_neurons(store: InMemoryStorage) -> None:
+    """Batch-added synapses show up in traversal and lookups."""
+    await store.add_neurons_batch(_neurons(3))
+    synapses = [
+        Synapse.create("n0", "n1", SynapseType.RELATED_TO, weight=0.8, synapse_id="s0"),
+        Synapse.create("n1", "n2", SynapseType.CAUSED_BY, weight=0.5, synapse_id="s1"),
+    ]
+
+    ids = await store.add_synapses_batch(synapses)
+
+    assert ids == ["s0", "s1"]
+    assert (await store.get_synapse("s1")).type == SynapseType.CAUSED_BY
+    neighbors = await store.get_neighbors("n0")
+    assert [neuron.id for neuron, _ in neighbors] == ["n1"]
+
+
+@pytest.mark.asyncio
+async def test_add_synapses_batch_rejects_missing_neuron(store: InMemoryStorage) -> None:
+    """A synapse to an unknown neuron fails the whole batch."""
+    await store.add_neurons_batch(_neurons(2))
+    synapses = [
+        Synapse.create("n0", "n1", SynapseType.RELATED_TO, synapse_id="s0"),
+        Synapse.create("n1", "missing", SynapseType.RELATED_TO, synapse_id="s1"),
+    ]
+
+    with pytest.raises(ValueError, match="does not exist"):
+        await store.add_synapses_batch(synapses)
+    assert await store.get_synapse("s0") is None
@@ -0,0 +1,66 @@
+"""Tests for the base get_fiber_neighborhoods fallback, via InMemoryStorage."""
+
+from __future__ import annotations
+
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from neural_memory.core.brain import Brain
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.storage.memory_store import InMemoryStorage
+
+
+@pytest_asyncio.fixture
+async def store() -> InMemoryStorage:
+    """InMemoryStorage with a brain context set."""
+    storage = InMemoryStorage()
+    brain = Brain.create(name="neighborhoods")
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_keeps_strongest_neighbors(store: InMemoryStorage) -> None:
+    """Neighbors are the strongest by weight, as the SQLite backend returns them."""
+    center = Neuron.create(type=NeuronType.CONCEPT, content="Center")
+    weak = Neuron.create(type=NeuronType.CONCEPT, content="Weak")
+    strong = Neuron.create(type=NeuronType.CONCEPT, content="Strong")
+    incoming = Neuron.create(type=NeuronType.CONCEPT, content="Incoming")
+    for neuron in (center, weak, strong, incoming):
+        await store.add_neuron(neuron)
+    for synapse in (
+        Synapse.create(center.id, weak.id, SynapseType.RELATED_TO, weight=0.1),
+        Synapse.create(center.id, strong.id, SynapseType.LEADS_TO, weight=0.9),
+        Synapse.create(incoming.id, center.id, SynapseType.CAUSED_BY, weight=0.5),
+    ):
+        await store.add_synapse(synapse)
+    fiber = Fiber.create(neuron_ids={center.id}, synapse_ids=set(), anchor_neuron_id=center.id)
+    await store.add_fiber(fiber)
+
+    [(_, anchor, neighbors)] = await store.get_fiber_neighborhoods([fiber.id], max_neighbors=2)
+
+    assert anchor is not None
+    assert anchor.content == "Center"
+    assert [n.content for n, _ in neighbors] == ["Strong", "Incoming"]
+
+
+@pytest.mark.asyncio
+async def test_skips_lookups_without_anchor(store: InMemoryStorage) -> None:
+    """Fibers without an anchor get no anchor or neighbors, and no lookups."""
+    neuron = Neuron.create(type=NeuronType.CONCEPT, content="Loose")
+    await store.add_neuron(neuron)
+    anchored = Fiber.create(neuron_ids={neuron.id}, synapse_ids=set(), anchor_neuron_id=neuron.id)
+    fiber = dataclasses.replace(anchored, anchor_neuron_id="")  # e.g. an imported fiber
+    await store.add_fiber(fiber)
+
+    with patch.object(store, "get_neighbors", wraps=store.get_neighbors) as spy:
+        result = await store.get_fiber_neighborhoods([fiber.id])
+
+    assert result == [(fiber, None, [])]
+    spy.assert_not_called()
@@ -6,20 +6,30 @@ import math
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure benchmarks module is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "benchmarks"))
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from benchmarks.metrics import (
+    MAX_K,
     BenchmarkReport,
     dcg_at_k,
+    evaluate_batch,
     evaluate_query,
     ndcg_at_k,
     precision_at_k,
     recall_at_k,
     reciprocal_rank,
 )
-from benchmarks.naive_baseline import keyword_overlap_score, rank_memories, tokenize
+from benchmarks.naive_baseline import (
+    TokenizedCorpus,
+    keyword_overlap_score,
+    rank_memories,
+    rank_tokenized,
+    tokenize,
+)
 
 
 class TestPrecisionAtK:
@@ -116,6 +126,10 @@ class TestNDCGAtK:
         ndcg = ndcg_at_k(["x", "y", "a"], {"a"}, k=3)
         assert 0 < ndcg < 1.0
 
+    def test_repeated_id_counts_once(self) -> None:
+        """A relevant ID retrieved several times cannot push NDCG above 1."""
+        assert ndcg_at_k(["a", "a", "a"], {"a"}, k=3) == 1.0
+
     def test_dcg_formula(self) -> None:
         """Verify DCG formula: sum(rel_i / log2(i+2))."""
         # ["a", "x", "b"] with relevant = {a, b}
@@ -124,6 +138,12 @@ class TestNDCGAtK:
         expected = 1.0 / math.log2(2) + 0.0 + 1.0 / math.log2(4)
         assert abs(dcg - expected) < 1e-9
 
+    def test_dcg_beyond_precomputed_discounts(self) -> None:
+        """Ranks deeper than MAX_K fall back to computing the discount."""
+        retrieved = [f"x{i}" for i in range(MAX_K)] + ["a"]
+        dcg = dcg_at_k(retrieved, {"a"}, k=MAX_K + 1)
+        assert abs(dcg - 1.0 / math.log2(MAX_K + 2)) < 1e-12
+
 
 class TestEvaluateQuery:
     """Tests for the combined evaluate_query function."""
@@ -146,6 +166,40 @@ class TestEvaluateQuery:
         assert qm.recall_at_k == 1.0
         assert qm.reciprocal_rank == 1.0  # First result is relevant
 
+    @pytest.mark.parametrize(
+        ("retrieved", "relevant"),
+        [
+            (["x", "b", "y", "z", "a"], {"a", "b", "c"}),
+            (["a", "a", "b", "c"], {"a", "c"}),  # Repeated IDs count once
+        ],
+    )
+    def test_matches_individual_metrics(self, retrieved: list[str], relevant: set[str]) -> None:
+        """Fused evaluation should agree with the standalone metric functions."""
+        qm = evaluate_query("q", "factual", retrieved, relevant, k=3)
+        assert qm.precision_at_k == precision_at_k(retrieved, relevant, 3)
+        assert qm.recall_at_k == recall_at_k(retrieved, relevant, 3)
+        assert qm.reciprocal_rank == reciprocal_rank(retrieved, relevant)
+        assert abs(qm.ndcg_at_k - ndcg_at_k(retrieved, relevant, 3)) < 1e-12
+
+    def test_reciprocal_rank_beyond_k(self) -> None:
+        """Reciprocal rank still counts a first hit below the K cutoff."""
+        qm = evaluate_query("q", "factual", ["x", "y", "a"], {"a"}, k=2)
+        assert qm.relevant_found == 0
+        assert abs(qm.reciprocal_rank - 1 / 3) < 1e-9
+
+    def test_duplicate_ids_count_once(self) -> None:
+        """A repeated relevant ID is credited once and does not fill the top-K."""
+        qm = evaluate_query("q", "factual", ["a", "a", "b"], {"a", "b"}, k=2)
+        assert qm.relevant_found == 2
+        assert qm.precision_at_k == 1.0
+        assert qm.recall_at_k == 1.0
+
+    def test_accepts_generator(self) -> None:
+        """Retrieved IDs may be a one-shot iterator instead of a list."""
+        from_list = evaluate_query("q", "factual", ["x", "a", "y", "b"], {"a", "b"}, k=3)
+        from_gen = evaluate_query("q", "factual", iter(["x", "a", "y", "b"]), {"a", "b"}, k=3)
+        assert from_gen == from_list
+
 
 class TestBenchmarkReport:
     """Tests for aggregate report computation."""
@@ -165,6 +219,23 @@ class TestBenchmarkReport:
         assert "factual" in report.category_breakdown
         assert "temporal" in report.category_breakdown
 
+    def test_category_breakdown_values(self) -> None:
+        """Per-category means are computed over that category's queries only."""
+        report = BenchmarkReport()
+        report.query_metrics = [
+            evaluate_query("q1", "factual", ["a", "b"], {"a"}, k=2),
+            evaluate_query("q2", "factual", ["x", "y"], {"a"}, k=2),
+            evaluate_query("q3", "temporal", ["y", "x"], {"y"}, k=2),
+        ]
+        report.compute_aggregates()
+
+        factual = report.category_breakdown["factual"]
+        assert factual["count"] == 2
+        assert abs(factual["precision"] - 0.25) < 1e-9
+        assert abs(factual["mrr"] - 0.5) < 1e-9
+        assert report.category_breakdown["temporal"]["recall"] == 1.0
+        assert abs(report.mrr - 2 / 3) < 1e-9
+
     def test_empty_report(self) -> None:
         """Empty report should have zero metrics."""
         report = BenchmarkReport()
@@ -173,6 +244,28 @@ class TestBenchmarkReport:
         assert report.mean_recall == 0.0
 
 
+class TestEvaluateBatch:
+    """Tests for batch evaluation."""
+
+    def test_matches_per_query_evaluation(self) -> None:
+        """Batch report holds the same metrics as evaluating one by one."""
+        evaluations = [
+            ("q1", "factual", ["a", "b"], {"a"}),
+            ("q2", "temporal", ["x", "y"], {"y"}),
+        ]
+        report = evaluate_batch(evaluations, k=2)
+
+        assert report.query_metrics == [evaluate_query(*e, k=2) for e in evaluations]
+        assert abs(report.mrr - 0.75) < 1e-9
+        assert set(report.category_breakdown) == {"factual", "temporal"}
+
+    def test_empty_batch(self) -> None:
+        """No evaluations → empty report with zero aggregates."""
+        report = evaluate_batch([], k=5)
+        assert report.query_metrics == []
+        assert report.mrr == 0.0
+
+
 class TestNaiveBaseline:
     """Tests for the naive keyword-overlap baseline."""
 
@@ -216,3 +309,23 @@ class TestNaiveBaseline:
         """Empty query should return no results."""
         results = rank_memories("", [("m1", "some content")], top_k=5)
         assert len(results) == 0
+
+    def test_rank_tokenized_matches_rank_memories(self) -> None:
+        """Ranking a pre-tokenized corpus gives the same results."""
+        memories = [
+            ("m1", "Alice likes coffee"),
+            ("m2", "We use PostgreSQL for the database"),
+            ("m3", "PostgreSQL database migration script"),
+        ]
+        query = "PostgreSQL database migration"
+        assert rank_tokenized(tokenize(query), TokenizedCorpus.build(memories), top_k=2) == (
+            rank_memories(query, memories, top_k=2)
+        )
+
+    def test_corpus_masks_encode_tokens(self) -> None:
+        """Each memory mask has one bit per distinct token; unknown query tokens drop out."""
+        corpus = TokenizedCorpus.build([("m1", "PostgreSQL database"), ("m2", "database backup")])
+        assert len(corpus.vocab) == 3
+        assert [mask.bit_count() for mask in corpus.masks] == [2, 2]
+        assert corpus.query_mask({"database", "unknown"}) == 1 << corpus.vocab["database"]
+        assert corpus.tokens_of(corpus.masks[0]) == {"postgresql", "database"}
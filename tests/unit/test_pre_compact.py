@@ -0,0 +1,108 @@
+"""Tests for incremental transcript reading in the PreCompact hook."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from neural_memory.core.brain import Brain
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.memory_types import MemoryType, TypedMemory
+from neural_memory.hooks.pre_compact import read_transcript_since, save_typed_memories
+from neural_memory.hooks.transcript_offsets import (
+    MAX_TRACKED_TRANSCRIPTS,
+    load_transcript_offset,
+    save_transcript_offset,
+)
+from neural_memory.storage.memory_store import InMemoryStorage
+
+
+def _line(text: str) -> str:
+    return json.dumps({"role": "user", "content": text}) + "\n"
+
+
+@pytest.fixture
+def transcript(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path / "data"))
+    path = tmp_path / "transcript.jsonl"
+    path.write_text(_line("We decided to use PostgreSQL for the main database"))
+    return path
+
+
+class TestReadTranscriptSince:
+    """Tests for read_transcript_since."""
+
+    def test_reads_only_appended_lines(self, transcript: Path) -> None:
+        text, offset = read_transcript_since(str(transcript))
+        assert "PostgreSQL" in text
+        assert offset == transcript.stat().st_size
+
+        with transcript.open("a") as f:
+            f.write(_line("The error was caused by a missing index on users"))
+        text, _ = read_transcript_since(str(transcript), offset)
+        assert "missing index" in text
+        assert "PostgreSQL" not in text
+
+    def test_leaves_partial_last_line(self, transcript: Path) -> None:
+        size = transcript.stat().st_size
+        with transcript.open("a") as f:
+            f.write('{"role": "user", "content": "half wri')
+
+        text, offset = read_transcript_since(str(transcript))
+        assert offset == size
+        assert "half" not in text
+
+
+class TestTranscriptOffsets:
+    """Tests for saving and validating transcript offsets."""
+
+    def test_round_trip(self, transcript: Path) -> None:
+        assert load_transcript_offset(str(transcript)) == 0
+
+        _, offset = read_transcript_since(str(transcript))
+        save_transcript_offset(str(transcript), offset)
+        with transcript.open("a") as f:
+            f.write(_line("TODO: add rate limiting before launch"))
+
+        assert load_transcript_offset(str(transcript)) == offset
+
+    def test_rewritten_transcript_resets_offset(self, transcript: Path) -> None:
+        _, offset = read_transcript_since(str(transcript))
+        save_transcript_offset(str(transcript), offset)
+
+        transcript.write_text(_line("We decided to use MySQL for the main database!"))
+        assert load_transcript_offset(str(transcript)) == 0
+
+        transcript.write_text(_line("short"))
+        assert load_transcript_offset(str(transcript)) == 0
+
+    def test_oldest_transcripts_are_dropped(self, transcript: Path, tmp_path: Path) -> None:
+        save_transcript_offset(str(transcript), 10)
+        for i in range(MAX_TRACKED_TRANSCRIPTS):
+            other = tmp_path / f"other-{i}.jsonl"
+            other.write_text(_line("filler"))
+            save_transcript_offset(str(other), 5)
+
+        assert load_transcript_offset(str(transcript)) == 0
+        assert load_transcript_offset(str(tmp_path / "other-0.jsonl")) == 5
+
+
+class TestSaveTypedMemories:
+    """Tests for save_typed_memories."""
+
+    async def test_bad_row_only_loses_itself(self) -> None:
+        storage = InMemoryStorage()
+        brain = Brain.create(name="flush")
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+        fiber = Fiber.create(neuron_ids={"n1"}, synapse_ids=set(), anchor_neuron_id="n1")
+        await storage.add_fiber(fiber)
+
+        good = TypedMemory.create(fiber_id=fiber.id, memory_type=MemoryType.FACT)
+        missing = TypedMemory.create(fiber_id="no-such-fiber", memory_type=MemoryType.FACT)
+        stored = await save_typed_memories(storage, [missing, good])
+
+        assert stored == {fiber.id}
+        assert await storage.get_typed_memory(fiber.id) is not None
@@ -0,0 +1,35 @@
+"""Tests for the standalone PreCompact flush hook script."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+async def test_storage_closed_when_analysis_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    load_hook_script: Callable[[str], ModuleType],
+) -> None:
+    monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path))
+    hook = load_hook_script("precompact-flush.py")
+    transcript = tmp_path / "transcript.jsonl"
+    transcript.write_text(
+        json.dumps({"message": {"role": "user", "content": "We decided to use PostgreSQL"}}) + "\n"
+    )
+    storage = MagicMock()
+    storage.close = AsyncMock()
+    monkeypatch.setattr(hook, "_detect_memories", MagicMock(side_effect=RuntimeError("boom")))
+
+    with (
+        patch("neural_memory.unified_config.get_shared_storage", AsyncMock(return_value=storage)),
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        await hook._flush_memories(str(transcript))
+
+    storage.close.assert_awaited_once()
@@ -0,0 +1,33 @@
+"""Unit tests for the synthetic benchmark graph builder."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+# Ensure benchmarks module is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from benchmarks.run_benchmarks import build_graph
+
+
+async def _pathways(seed: int, n_neurons: int = 200) -> list[list[str]]:
+    _, _, _, fibers, _ = await build_graph(n_neurons, 20, 8, rng=random.Random(seed))
+    return [f.pathway for f in fibers]
+
+
+class TestBuildGraph:
+    """Tests for build_graph."""
+
+    async def test_same_seed_same_graph(self) -> None:
+        """A size's graph depends only on its own seed, not on earlier builds."""
+        first = await _pathways(43)
+        await _pathways(42, n_neurons=500)
+        assert await _pathways(43) == first
+
+    async def test_fiber_pathways_are_distinct_neurons(self) -> None:
+        """Each pathway has the requested length and no repeated neuron."""
+        for pathway in await _pathways(7):
+            assert len(pathway) == 8
+            assert len(set(pathway)) == 8
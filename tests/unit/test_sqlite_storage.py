@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tempfile
+from dataclasses import replace
 from datetime import timedelta
 from pathlib import Path
 
@@ -280,6 +281,135 @@ class TestSQLiteFibers:
         fibers = await storage.get_fibers(limit=10, order_by="created_at", descending=True)
         assert len(fibers) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_habit_fibers(self, storage: SQLiteStorage) -> None:
+        """Test that only _habit_pattern fibers are returned, via the partial index."""
+        n1 = Neuron.create(type=NeuronType.CONCEPT, content="N1")
+        await storage.add_neuron(n1)
+
+        habit = Fiber.create(
+            neuron_ids={n1.id},
+            synapse_ids=set(),
+            anchor_neuron_id=n1.id,
+            summary="recall-edit",
+            metadata={"_habit_pattern": True, "_workflow_actions": ["recall", "edit"]},
+        )
+        plain = Fiber.create(
+            neuron_ids={n1.id},
+            synapse_ids=set(),
+            anchor_neuron_id=n1.id,
+            summary="Plain",
+            metadata={"_habit_pattern": False},
+        )
+        await storage.add_fiber(habit)
+        await storage.add_fiber(plain)
+
+        habits = await storage.get_habit_fibers()
+        assert [h.id for h in habits] == [habit.id]
+        assert habits[0].metadata["_workflow_actions"] == ["recall", "edit"]
+
+        conn = storage._ensure_read_conn()
+        async with conn.execute(
+            """EXPLAIN QUERY PLAN SELECT * FROM fibers
+               WHERE brain_id = ? AND json_extract(metadata, '$._habit_pattern') = 1
+               ORDER BY created_at DESC""",
+            (storage._get_brain_id(),),
+        ) as cursor:
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+        assert "idx_fibers_habit" in plan
+
+    @pytest.mark.asyncio
+    async def test_iter_habit_fibers_pages_past_ties(self, storage: SQLiteStorage) -> None:
+        """Test keyset paging returns every habit once, newest first, across equal timestamps."""
+        n1 = Neuron.create(type=NeuronType.CONCEPT, content="N1")
+        await storage.add_neuron(n1)
+
+        now = utcnow()
+        habits = [
+            replace(
+                Fiber.create(
+                    neuron_ids={n1.id},
+                    synapse_ids=set(),
+                    anchor_neuron_id=n1.id,
+                    summary=f"habit-{i}",
+                    metadata={"_habit_pattern": True},
+                ),
+                created_at=now - timedelta(minutes=i // 2),
+            )
+            for i in range(5)
+        ]
+        for fiber in habits:
+            await storage.add_fiber(fiber)
+        await storage.add_fiber(
+            Fiber.create(neuron_ids={n1.id}, synapse_ids=set(), anchor_neuron_id=n1.id)
+        )
+
+        streamed = [f async for f in storage.iter_habit_fibers(batch=2)]
+
+        expected = sorted(habits, key=lambda f: (f.created_at, f.id), reverse=True)
+        assert [f.id for f in streamed] == [f.id for f in expected]
+
+    @pytest.mark.asyncio
+    async def test_get_habit_by_name(self, storage: SQLiteStorage) -> None:
+        """Test name lookup returns the newest habit with that summary, via its index."""
+        n1 = Neuron.create(type=NeuronType.CONCEPT, content="N1")
+        await storage.add_neuron(n1)
+
+        now = utcnow()
+        older, newer = (
+            replace(
+                Fiber.create(
+                    neuron_ids={n1.id},
+                    synapse_ids=set(),
+                    anchor_neuron_id=n1.id,
+                    summary="recall-edit",
+                    metadata={"_habit_pattern": True},
+                ),
+                created_at=now - timedelta(minutes=age),
+            )
+            for age in (5, 1)
+        )
+        plain = Fiber.create(
+            neuron_ids={n1.id}, synapse_ids=set(), anchor_neuron_id=n1.id, summary="plain"
+        )
+        for fiber in (older, newer, plain):
+            await storage.add_fiber(fiber)
+
+        found = await storage.get_habit_by_name("recall-edit")
+        assert found is not None
+        assert found.id == newer.id
+        assert await storage.get_habit_by_name("plain") is None
+        assert await storage.get_habit_by_name("missing") is None
+
+        conn = storage._ensure_read_conn()
+        async with conn.execute(
+            """EXPLAIN QUERY PLAN SELECT * FROM fibers
+               WHERE brain_id = ? AND summary = ?
+                 AND json_extract(metadata, '$._habit_pattern') = 1
+               ORDER BY created_at DESC LIMIT 1""",
+            (storage._get_brain_id(), "recall-edit"),
+        ) as cursor:
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+        assert "idx_fibers_habit_summary" in plan
+
+    @pytest.mark.asyncio
+    async def test_delete_fibers(self, storage: SQLiteStorage) -> None:
+        """Test bulk delete removes fibers and their neuron junction rows."""
+        n1 = Neuron.create(type=NeuronType.CONCEPT, content="N1")
+        await storage.add_neuron(n1)
+
+        fibers = [
+            Fiber.create(neuron_ids={n1.id}, synapse_ids=set(), anchor_neuron_id=n1.id)
+            for _ in range(3)
+        ]
+        for fiber in fibers:
+            await storage.add_fiber(fiber)
+
+        assert await storage.delete_fibers([fibers[0].id, fibers[1].id, "missing"]) == 2
+        assert await storage.delete_fibers([]) == 0
+        assert [f.id for f in await storage.find_fibers(contains_neuron=n1.id)] == [fibers[2].id]
+        assert await storage.get_neuron(n1.id) is not None
+
 
 class TestSQLiteTypedMemories:
     """Tests for typed memory operations."""
@@ -377,6 +507,24 @@ class TestSQLiteTypedMemories:
         expired = await storage.get_expired_memories()
         assert len(expired) == 1
 
+    @pytest.mark.asyncio
+    async def test_add_typed_memories_batch(
+        self, storage_with_fiber: tuple[SQLiteStorage, Fiber]
+    ) -> None:
+        """Test batch insert, rejecting the whole batch on a missing fiber."""
+        storage, fiber = storage_with_fiber
+
+        missing = TypedMemory.create(fiber_id="no-such-fiber", memory_type=MemoryType.FACT)
+        typed_mem = TypedMemory.create(fiber_id=fiber.id, memory_type=MemoryType.DECISION)
+        with pytest.raises(ValueError, match="no-such-fiber"):
+            await storage.add_typed_memories_batch([typed_mem, missing])
+        assert await storage.get_typed_memory(fiber.id) is None
+
+        assert await storage.add_typed_memories_batch([typed_mem]) == [fiber.id]
+        retrieved = await storage.get_typed_memory(fiber.id)
+        assert retrieved is not None
+        assert retrieved.memory_type == MemoryType.DECISION
+
 
 class TestSQLiteProjects:
     """Tests for project operations."""
@@ -590,6 +738,37 @@ class TestSQLiteGraphTraversal:
         path = await storage.get_path(n1.id, n2.id)
         assert path is None
 
+    @pytest.mark.asyncio
+    async def test_get_fiber_neighborhoods(self, storage: SQLiteStorage) -> None:
+        """Test bulk fiber/anchor/neighbor fetch keeps the strongest edges per anchor."""
+        center = Neuron.create(type=NeuronType.CONCEPT, content="Center")
+        weak = Neuron.create(type=NeuronType.CONCEPT, content="Weak")
+        strong = Neuron.create(type=NeuronType.CONCEPT, content="Strong")
+        incoming = Neuron.create(type=NeuronType.CONCEPT, content="Incoming")
+        for neuron in (center, weak, strong, incoming):
+            await storage.add_neuron(neuron)
+
+        for synapse in (
+            Synapse.create(center.id, weak.id, SynapseType.RELATED_TO, weight=0.1),
+            Synapse.create(center.id, strong.id, SynapseType.LEADS_TO, weight=0.9),
+            Synapse.create(incoming.id, center.id, SynapseType.CAUSED_BY, weight=0.5),
+        ):
+            await storage.add_synapse(synapse)
+
+        f1 = Fiber.create(neuron_ids={center.id}, synapse_ids=set(), anchor_neuron_id=center.id)
+        f2 = Fiber.create(neuron_ids={weak.id}, synapse_ids=set(), anchor_neuron_id=weak.id)
+        await storage.add_fiber(f1)
+        await storage.add_fiber(f2)
+
+        result = await storage.get_fiber_neighborhoods([f2.id, "missing", f1.id], max_neighbors=2)
+
+        assert [fiber.id for fiber, _, _ in result] == [f2.id, f1.id]
+        _, anchor, neighbors = result[1]
+        assert anchor is not None
+        assert anchor.content == "Center"
+        assert [n.content for n, _ in neighbors] == ["Strong", "Incoming"]
+        assert [n.content for n, _ in result[0][2]] == ["Center"]
+
 
 class TestSQLiteStats:
     """Tests for statistics."""
@@ -0,0 +1,70 @@
+"""Tests for saving memories from the Stop hooks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import ModuleType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from neural_memory.core.brain import Brain
+from neural_memory.hooks.stop import capture_text
+from neural_memory.storage.memory_store import InMemoryStorage
+
+_DETECTED = [
+    {"content": "We decided to use PostgreSQL for the main database", "type": "decision"},
+    {"content": "The error was caused by a missing index on users", "type": "error"},
+]
+
+
+@pytest.fixture
+async def storage() -> InMemoryStorage:
+    storage = InMemoryStorage()
+    brain = Brain.create(name="stop")
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    return storage
+
+
+def _failing_batch(storage: InMemoryStorage) -> Any:
+    return patch.object(
+        storage, "add_typed_memories_batch", AsyncMock(side_effect=ValueError("bad row"))
+    )
+
+
+async def _typed_count(storage: InMemoryStorage) -> int:
+    return len(await storage.find_typed_memories(limit=10))
+
+
+async def test_capture_text_keeps_rows_when_batch_fails(storage: InMemoryStorage) -> None:
+    config = SimpleNamespace(
+        current_brain=storage.current_brain_id,
+        auto=SimpleNamespace(min_confidence=0.5),
+        safety=SimpleNamespace(auto_redact_min_severity=3),
+    )
+    detected = [{**item, "confidence": 0.9} for item in _DETECTED]
+    with (
+        _failing_batch(storage),
+        patch("neural_memory.unified_config.get_config", return_value=config),
+        patch("neural_memory.unified_config.get_shared_storage", AsyncMock(return_value=storage)),
+        patch("neural_memory.mcp.auto_capture.analyze_text_for_memories", return_value=detected),
+    ):
+        result = await capture_text("session transcript")
+
+    assert result["saved"] == 2
+    assert len(result["memories"]) == 2
+    assert await _typed_count(storage) == 2
+
+
+async def test_stop_script_keeps_rows_when_batch_fails(
+    storage: InMemoryStorage, load_hook_script: Callable[[str], ModuleType]
+) -> None:
+    hook = load_hook_script("stop-capture.py")
+
+    with _failing_batch(storage):
+        saved = await hook._save_memories(storage, [{**item, "priority": 5} for item in _DETECTED])
+
+    assert saved == 2
+    assert await _typed_count(storage) == 2
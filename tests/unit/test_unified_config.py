@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from neural_memory.cli.config import _sync_brain_to_toml
+from neural_memory.cli.config import _sync_brain_to_toml, use_unified_config
 from neural_memory.unified_config import (
     _MIN_LEGACY_DB_BYTES,
     UnifiedConfig,
@@ -215,6 +215,25 @@ class TestSyncBrainToToml:
             _sync_brain_to_toml(tmp_data_dir, "work")
 
 
+class TestUseUnifiedConfig:
+    """Tests for the CLI's unified-config probe."""
+
+    def test_env_dir_wins(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path / "missing"))
+        assert use_unified_config() is True
+
+    def test_follows_config_toml_in_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("NEURALMEMORY_DIR", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert use_unified_config() is False
+
+        (tmp_path / ".neuralmemory").mkdir()
+        (tmp_path / ".neuralmemory" / "config.toml").write_text("", encoding="utf-8")
+        assert use_unified_config() is True
+
+
 class TestReadCurrentBrainFromToml:
     """Tests for MCP-side toml reading via _read_current_brain_from_toml."""
 
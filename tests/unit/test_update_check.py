@@ -0,0 +1,78 @@
+"""Tests for the background CLI update check."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from neural_memory import __version__
+from neural_memory.cli import update_check
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("NEURALMEMORY_DIR", str(tmp_path))
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.delenv("NEURALMEMORY_NO_UPDATE_CHECK", raising=False)
+    monkeypatch.setattr(update_check, "_update_check_enabled", lambda: True)
+    return tmp_path
+
+
+def _write_cache(data_dir: Path, **data: object) -> None:
+    (data_dir / ".update_check").write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestUpdateCheckEnabled:
+    """Tests for when the update check runs at all."""
+
+    def test_disabled_on_ci(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CI", "true")
+        with patch.object(update_check.sys.stderr, "isatty", return_value=True):
+            assert update_check._update_check_enabled() is False
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("CI", raising=False)
+        monkeypatch.setenv("NEURALMEMORY_NO_UPDATE_CHECK", "1")
+        with patch.object(update_check.sys.stderr, "isatty", return_value=True):
+            assert update_check._update_check_enabled() is False
+
+    def test_disabled_without_terminal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("CI", raising=False)
+        monkeypatch.delenv("NEURALMEMORY_NO_UPDATE_CHECK", raising=False)
+        with patch.object(update_check.sys.stderr, "isatty", return_value=False):
+            assert update_check._update_check_enabled() is False
+
+    def test_no_thread_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(update_check, "_update_check_enabled", lambda: False)
+        with patch.object(update_check.threading, "Thread") as thread:
+            update_check.run_update_check_background()
+        thread.assert_not_called()
+
+
+class TestRunUpdateCheckBackground:
+    """Tests for cache throttling."""
+
+    def test_fresh_cache_notifies_without_thread(
+        self, data_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        _write_cache(data_dir, last_check=time.time(), latest_version="999.0.0", dismissed=False)
+        with patch.object(update_check.threading, "Thread") as thread:
+            update_check.run_update_check_background()
+        thread.assert_not_called()
+        assert f"{__version__} → 999.0.0" in capsys.readouterr().err
+
+    def test_stale_cache_fetches_in_thread(self, data_dir: Path) -> None:
+        _write_cache(data_dir, last_check=0, latest_version=__version__, dismissed=False)
+        with patch.object(update_check.threading, "Thread") as thread:
+            update_check.run_update_check_background()
+        thread.assert_called_once_with(target=update_check._check_and_notify, daemon=True)
+
+    def test_malformed_cache_fetches_in_thread(self, data_dir: Path) -> None:
+        _write_cache(data_dir, last_check="yesterday")
+        with patch.object(update_check.threading, "Thread") as thread:
+            update_check.run_update_check_background()
+        thread.assert_called_once()